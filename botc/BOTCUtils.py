@@ -1,31 +1,29 @@
 """Contains some BoTC game related utility functions"""
 
 import asyncio
-import json
-import configparser
 import random
 from .Category import Category
+from botutils.profiler import profiled_stage, Stage
 from discord.ext import commands, tasks
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 MAX_MESSAGE_LEN = Config["misc"]["MAX_MESSAGE_LEN"]
 MAX_MESSAGE_LEN = int(MAX_MESSAGE_LEN)
 
-with open('botc/game_text.json') as json_file:
-    documentation = json.load(json_file)
-    x_emoji = documentation["cmd_warnings"]["x_emoji"]
-    player_not_found = documentation["cmd_warnings"]["player_not_found"]
-    no_self_targetting_str = documentation["cmd_warnings"]["no_self_targetting_str"]
-    except_first_night_str = documentation["cmd_warnings"]["except_first_night_str"]
-    requires_one_target_str = documentation["cmd_warnings"]["requires_one_target_str"]
-    requires_two_targets_str = documentation["cmd_warnings"]["requires_two_targets_str"]
-    requires_different_targets_str = documentation["cmd_warnings"]["requires_different_targets_str"]
-    changes_not_allowed = documentation["cmd_warnings"]["changes_not_allowed"]
-    unique_ability_used = documentation["cmd_warnings"]["unique_ability_used"]
-    not_under_status = documentation["cmd_warnings"]["not_under_status"]
-    lore = documentation["lore"]
+documentation = settings.game_text
+x_emoji = documentation["cmd_warnings"]["x_emoji"]
+player_not_found = documentation["cmd_warnings"]["player_not_found"]
+no_self_targetting_str = documentation["cmd_warnings"]["no_self_targetting_str"]
+except_first_night_str = documentation["cmd_warnings"]["except_first_night_str"]
+requires_one_target_str = documentation["cmd_warnings"]["requires_one_target_str"]
+requires_two_targets_str = documentation["cmd_warnings"]["requires_two_targets_str"]
+requires_different_targets_str = documentation["cmd_warnings"]["requires_different_targets_str"]
+changes_not_allowed = documentation["cmd_warnings"]["changes_not_allowed"]
+unique_ability_used = documentation["cmd_warnings"]["unique_ability_used"]
+not_under_status = documentation["cmd_warnings"]["not_under_status"]
+lore = documentation["lore"]
 
 
 # ========== TARGETS ===============================================================
@@ -98,7 +96,7 @@ class BOTCUtils:
         """Get any random player from the game"""
         import globvars
         game = globvars.master_state.game
-        return random.choice(game.sitting_order)
+        return game.rng.storyteller.choice(game.sitting_order)
 
     @staticmethod
     def get_random_player_excluding(player):
@@ -106,12 +104,15 @@ class BOTCUtils:
         import globvars
         game = globvars.master_state.game
         possibilities = [p for p in game.sitting_order if p.user.id != player.user.id]
-        return random.choice(possibilities)
+        return game.rng.storyteller.choice(possibilities)
 
     @staticmethod
     def get_role_list(edition, category):
-        """Get the entire list of an edition and a category"""
-        return [role_class() for role_class in edition.__subclasses__() if issubclass(role_class, category)]
+        """Get the entire list of an edition and a category, as the shared character
+        objects of the edition pack (see EditionPack.get_role)
+        """
+        from botc.packs import get_edition_of
+        return list(get_edition_of(edition).get_roles_of_category(category))
 
     @staticmethod
     def get_player_from_id(userid):
@@ -398,6 +399,7 @@ class RoleNotFound(commands.BadArgument):
 class PlayerConverter(commands.Converter):
     """Parse the player name input arguments from commands"""
 
+    @profiled_stage(Stage.converters)
     async def convert(self, ctx, argument):
         """Convert to player objects"""
         player = BOTCUtils.get_player_from_string(argument)
@@ -409,6 +411,7 @@ class PlayerConverter(commands.Converter):
 class WhisperConverter(commands.Converter):
     """Parse the whisper content"""
 
+    @profiled_stage(Stage.converters)
     async def convert(self, ctx, argument):
         """Convert to a string while also checking for the maximum length"""
         if len(argument) > max(MAX_MESSAGE_LEN - 120, 0):
@@ -419,32 +422,31 @@ class WhisperConverter(commands.Converter):
 class RoleConverter(commands.Converter):
     """Convert a role name to a botc character class"""
 
+    @profiled_stage(Stage.converters)
     async def convert(self, ctx, argument):
         """
         Find a role name amongst the botc pack.
-        Return the role class if it is found, else return None
+        Return the role object if it is found, else raise RoleNotFound
 
         The game_packs variable is coded in the following way:
 
         {'botc': {'game_obj': <botc.Game.Game object at 0x1187bffd0>, 'gamemodes': {'trouble-brewing':
-        [Baron Obj, Butler Obj, Chef Obj, Drunk Obj, Empath Obj, Fortune Teller Obj, Imp Obj,
-        Investigator Obj, Librarian Obj, Mayor Obj, Monk Obj, Poisoner Obj, Ravenkeeper Obj,
-        Recluse Obj, Saint Obj, Scarlet Woman Obj, Slayer Obj, Soldier Obj, Undertaker Obj,
-        Virgin Obj, Washerwoman Obj]}}}
+        <EditionPack trouble-brewing (22 characters, not loaded)>, ...}}}
         """
         import globvars
         editions = globvars.master_state.game_packs["botc"]["gamemodes"]
         for edition in editions:
-            role_pool = editions[edition]
-            for role in role_pool:
-                if argument.lower() in role.name.lower():
-                    return role
+            edition_pack = editions[edition]
+            for role_name in edition_pack.role_names:
+                if argument.lower() in role_name.lower():
+                    return edition_pack.get_role(role_name)
         raise RoleNotFound(f"Role {argument} not found.")
 
 
 class PlayerParser(commands.Converter):
     """Parse the player name input arguments from game commands"""
 
+    @profiled_stage(Stage.converters)
     async def convert(self, ctx, argument):
         """Convert to player objects, and split at "and" keyword"""
         raw_targets = argument.split(" and ")
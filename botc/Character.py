@@ -1,60 +1,52 @@
 """Contains the Character class"""
 
-import json
 import discord
 import botutils
-import datetime
-import configparser
-from .Category import Category
 from .Team import Team
 from .errors import AlreadyDead
 from .BOTCUtils import LorePicker
 from .flag_inventory import Inventory, Flags
 from .abilities import ActionTypes, Action
 from .BOTCUtils import GameLogic
+from .embeds import role_card_template, opening_dm_template
 import globvars
+from botutils.settings import settings
 
-Preferences = configparser.ConfigParser()
-
-Preferences.read("preferences.INI")
-
-TOWNSFOLK_COLOR = Preferences["colors"]["TOWNSFOLK_COLOR"]
-OUTSIDER_COLOR = Preferences["colors"]["OUTSIDER_COLOR"]
-MINION_COLOR = Preferences["colors"]["MINION_COLOR"]
-DEMON_COLOR = Preferences["colors"]["DEMON_COLOR"]
-
-TOWNSFOLK_COLOR = int(TOWNSFOLK_COLOR, 16)
-OUTSIDER_COLOR = int(OUTSIDER_COLOR, 16)
-MINION_COLOR = int(MINION_COLOR, 16)
-DEMON_COLOR = int(DEMON_COLOR, 16)
-
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 PREFIX = Config["settings"]["PREFIX"]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    copyrights_str = strings["misc"]["copyrights"]
-    role_dm = strings["gameplay"]["role_dm"]
-    welcome_dm = strings["gameplay"]["welcome_dm"]
-    blocked = strings["gameplay"]["blocked"]
+strings = settings.game_text
+role_dm = strings["gameplay"]["role_dm"]
+blocked = strings["gameplay"]["blocked"]
 
 
 class Character:
     """Character class
     Methods starting with "playtest" are used for console game creation for playtesting purposes.
+
+    Metadata shared by all the characters of a category or an edition is stored on the
+    classes, not copied into each character object.
     """
+
+    # Parent attributes
+    _main_wiki_link = "https://bloodontheclocktower.com/wiki/Main_Page"  # Main page url -> string
+    _botc_demon_link = "https://bloodontheclocktower.com/img/website/demon-head.png?" \
+                       "rel=1589188746616"  # Demon head art url -> string
+    _botc_logo_link = "https://bloodontheclocktower.com/wiki/images/logo.png"  # Logo art url -> string
+    _demon_head_emoji = botutils.BotEmoji.demonhead
+
+    # Override by gamemode class
+    _gm_of_appearance = None
+    _gm_art_link = None
+
+    # Override by category class
+    _category = None
+    _team = None
     
     def __init__(self):
 
-        # Parent attributes
-        self._main_wiki_link = "https://bloodontheclocktower.com/wiki/Main_Page"  # Main page url -> string
-        self._botc_demon_link = "https://bloodontheclocktower.com/img/website/demon-head.png?" \
-                              "rel=1589188746616"  # Demon head art url -> string
-        self._botc_logo_link = "https://bloodontheclocktower.com/wiki/images/logo.png"  # Logo art url -> string
-
         # Override by child role class:
         self._desc_string = None
         self._examp_string = None
@@ -73,17 +65,8 @@ class Character:
             Flags.slayer_unique_attempt
         )
 
-        # Override by gamemode class
-        self._gm_of_appearance = None
-        self._gm_art_link = None
-
-        # Override by category class
-        self._category = None
-        self._team = None
-
         # Other
         self._emoji = None
-        self._demon_head_emoji = botutils.BotEmoji.demonhead
     
     # -------------------- Character Properties --------------------
     
@@ -206,57 +189,12 @@ class Character:
     # -------------------- Character Mechanics --------------------
 
     async def send_role_card_embed(self, ctx):
-        """Create the role card embed object and return it"""
+        """Send the role card embed (see botc.embeds)"""
 
         if DISABLE_DMS:
             return
 
-        def make_embed(emote,
-                       role_name, 
-                       role_category, 
-                       card_color, 
-                       gm, 
-                       gm_art_link, 
-                       desc_str, 
-                       ex_str, 
-                       pic_link, 
-                       wiki_link):
-
-            embed = discord.Embed(title = "{} [{}] {}".format(role_name, role_category, emote), 
-                                  description = "*{}*".format(self.lore), 
-                                  color = card_color)
-            embed.set_author(name = "Blood on the Clocktower - {}".format(gm), icon_url = gm_art_link)
-            embed.set_thumbnail(url = pic_link)
-            embed.add_field(name = ":small_orange_diamond: Description", value = desc_str, inline = False)
-            embed.add_field(name = ":small_orange_diamond: Examples", value = ex_str + "\n" + wiki_link, inline = False)
-            embed.set_footer(text = copyrights_str)
-
-            return embed
-
-        if self.category == Category.townsfolk:
-            color = TOWNSFOLK_COLOR
-        elif self.category == Category.outsider:
-            color = OUTSIDER_COLOR
-        elif self.category == Category.minion:
-            color = MINION_COLOR
-        elif self.category == Category.demon:
-            color = DEMON_COLOR
-
-        gm_art_link = self.gm_art_link if self.gm_art_link else self.botc_logo_link
-        pic_link = self.art_link if self.art_link else self.botc_demon_link
-        wiki_link = ":paperclip: " + self.wiki_link if self.wiki_link else ":paperclip: " + self.main_wiki_link
-
-        embed = make_embed(self.emoji,
-                           self.__str__(), 
-                           self.category.value, 
-                           color, 
-                           self.gm_of_appearance.value, 
-                           gm_art_link, 
-                           self.description, 
-                           self.examples, 
-                           pic_link, 
-                           wiki_link)
-        await ctx.send(embed=embed)
+        await ctx.send(embed = role_card_template(self).make())
 
     def exec_init_setup(self, townsfolk_obj_list, outsider_obj_list, minion_obj_list, demon_obj_list):
         """Allow for roles that change the setup to modify the role list
@@ -271,17 +209,35 @@ class Character:
         """
         return
 
-    def has_finished_night_action(self, player):
-        """Has the player finished their night action? (For phase fastforwarding)
+    def expected_night_action(self, player):
+        """The type of night action (ActionTypes enum object) expected from the player in
+        the current phase, None if none.
         To be overriden in child classes
         """
-        return True
-    
-    def has_finished_dawn_action(self, player):
-        """Has the player finished their dawn action? (For phase fastforwarding)
+        return None
+
+    def has_finished_night_action(self, player):
+        """Has the player finished their night action? (For phase fastforwarding)"""
+        action_type = self.expected_night_action(player)
+        if action_type is None:
+            return True
+        game = globvars.master_state.game
+        return not game.action_ledger.missing_actions(game._chrono.phase_id, [player], action_type)
+    
+    def expected_dawn_action(self, player):
+        """The type of dawn action (ActionTypes enum object) expected from the player in
+        the current phase, None if none.
         To be overriden in child classes
         """
-        return True
+        return None
+
+    def has_finished_dawn_action(self, player):
+        """Has the player finished their dawn action? (For phase fastforwarding)"""
+        action_type = self.expected_dawn_action(player)
+        if action_type is None:
+            return True
+        game = globvars.master_state.game
+        return not game.action_ledger.missing_actions(game._chrono.phase_id, [player], action_type)
 
     # -------------------- Character DM's --------------------
     
@@ -291,15 +247,6 @@ class Character:
         if DISABLE_DMS:
             return
 
-        if self.ego_self.category == Category.townsfolk:
-            color = TOWNSFOLK_COLOR  
-        elif self.ego_self.category == Category.outsider:
-            color = OUTSIDER_COLOR
-        elif self.ego_self.category == Category.minion:
-            color = MINION_COLOR
-        else:
-            color = DEMON_COLOR
-
         opening_dm = role_dm.format(
             user = recipient.name + recipient.discriminator,
             role_name_str = self.ego_self.name,
@@ -307,15 +254,11 @@ class Character:
             team_str = self.ego_self.team.value,
             prefix = PREFIX)
 
-        embed = discord.Embed(title = welcome_dm.format(self.ego_self.name.upper()),
-                              url = self.ego_self.wiki_link,
-                              description=opening_dm, color=color)
-        embed.timestamp = datetime.datetime.utcnow()
-        embed.add_field(name = "**「 Instruction 」**", value = self.create_n1_instr_str(), inline = True)
-        embed.set_author(name = "{} Edition - Blood on the Clocktower (BoTC)".format(self.ego_self.gm_of_appearance.value),
-                         icon_url = self.ego_self.gm_art_link)
-        embed.set_thumbnail(url = self.ego_self.botc_logo_link)
-        embed.set_footer(text = copyrights_str)
+        embed = opening_dm_template(self.ego_self).make(
+            description = opening_dm,
+            fields = [("**「 Instruction 」**", self.create_n1_instr_str(), True)],
+            timestamp = True
+        )
 
         # If we have an evil team member, send evil list (if 7p or more)
         if globvars.master_state.game.nb_players >= 7:
@@ -326,8 +269,6 @@ class Character:
         # Send the stats list if necessary
         embed = self.add_action_field_n1(embed)
 
-        embed.set_image(url = self.ego_self._art_link_cropped)
-
         try:
             await recipient.send(embed = embed)
         except discord.Forbidden:
@@ -373,8 +314,8 @@ class Character:
         """
         pass
 
-    def check_wincon_after_day(self, player):
-        """Perform a win con check after the day phase ends.
+    def register_win_rules(self, player, win_tracker):
+        """Register the character's own winning conditions (see WinTracker.add_rule).
         Override by child classes.
         """
         return
@@ -385,8 +326,7 @@ class Character:
         """Function that runs after the player is nominated.
         Override by child classes and/or other classes inherited by child classes.
         """
-        from botc.gameloops import nomination_loop
-        nomination_loop.start(globvars.master_state.game, nominator_player, nominated_player)
+        globvars.master_state.game.start_nomination_loop(nominator_player, nominated_player)
     
     async def on_being_executed(self, executed_player):
         """Funtion that runs after the player has been executed.
@@ -5,7 +5,6 @@ from .Team import Team
 
 class Demon:
     """Demon class"""
-    
-    def __init__(self):
-        self._category = Category.demon
-        self._team = Team.evil
+
+    _category = Category.demon
+    _team = Team.evil
@@ -0,0 +1,166 @@
+"""Contains the EventBus class and the game events published on it"""
+
+import asyncio
+import collections
+
+
+class GameEvent:
+    """Base class of the game state changes. Subscribing to GameEvent receives them all."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"<{type(self).__name__} {fields}>"
+
+
+class DeathEvent(GameEvent):
+    """A player has died. Apparent deaths (ex. Zombuul) leave the real state alive."""
+
+    __slots__ = ("player", "apparent")
+
+    def __init__(self, player, apparent = False):
+        self.player = player
+        self.apparent = apparent
+
+
+class RoleChangeEvent(GameEvent):
+    """A player's character has changed (ex. Imp starpass, Scarlet Woman)"""
+
+    __slots__ = ("player", "old_role", "new_role")
+
+    def __init__(self, player, old_role, new_role):
+        self.player = player
+        self.old_role = old_role
+        self.new_role = new_role
+
+
+class StatusAppliedEvent(GameEvent):
+    """A status effect has been added to the status store"""
+
+    __slots__ = ("status_effect",)
+
+    def __init__(self, status_effect):
+        self.status_effect = status_effect
+
+
+class StatusExpiredEvent(GameEvent):
+    """A status effect has worn off, or has been disabled before it did"""
+
+    __slots__ = ("status_effect", "disabled")
+
+    def __init__(self, status_effect, disabled = False):
+        self.status_effect = status_effect
+        self.disabled = disabled
+
+
+class NominationEvent(GameEvent):
+    """A player has nominated another player"""
+
+    __slots__ = ("nominator", "nominated")
+
+    def __init__(self, nominator, nominated):
+        self.nominator = nominator
+        self.nominated = nominated
+
+
+class VoteCastEvent(GameEvent):
+    """A player has voted on a nomination. Not voting in time counts as a hand down."""
+
+    __slots__ = ("voter", "nominated", "hand_up")
+
+    def __init__(self, voter, nominated, hand_up):
+        self.voter = voter
+        self.nominated = nominated
+        self.hand_up = hand_up
+
+
+class ExecutionEvent(GameEvent):
+    """A player is about to be executed (chopping block, Virgin)"""
+
+    __slots__ = ("player",)
+
+    def __init__(self, player):
+        self.player = player
+
+
+class ActionEvent(GameEvent):
+    """A player has used an ability command, saved in the action ledger"""
+
+    __slots__ = ("player", "action", "phase_id")
+
+    def __init__(self, player, action, phase_id):
+        self.player = player
+        self.action = action
+        self.phase_id = phase_id
+
+
+class PhaseChangeEvent(GameEvent):
+    """A phase has ended and the game moves into the next one"""
+
+    __slots__ = ("phase_id", "next_phase")
+
+    def __init__(self, phase_id, next_phase):
+        self.phase_id = phase_id  # Phase ID of the phase that has ended
+        self.next_phase = next_phase  # Phase object
+
+
+class EventBus:
+    """Internal publish/subscribe of the game state changes, so that the indexes, the
+    win checks and the Discord side effects don't have to be called from every
+    character's code path.
+
+    Subscribers are functions or coroutine functions taking the event object. They
+    receive the events of the class they subscribed to and of its subclasses. For one
+    event, the plain functions are called first, then the coroutine functions are
+    awaited, each group in subscription order.
+    """
+
+    def __init__(self):
+        self._subscribers = collections.defaultdict(list)  # {event class : [callback]}
+
+    def subscribe(self, event_type, callback):
+        """Call the callback on every event of a type (GameEvent subclass)"""
+        self._subscribers[event_type].append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        """Remove a subscriber. Does nothing if it was not subscribed."""
+        try:
+            self._subscribers[event_type].remove(callback)
+        except ValueError:
+            pass
+
+    def _split_subscribers(self, event):
+        """Return the (functions, coroutine functions) subscribed to an event"""
+        functions = []
+        coroutines = []
+        for event_type in type(event).__mro__:
+            for callback in self._subscribers.get(event_type, ()):
+                if asyncio.iscoroutinefunction(callback):
+                    coroutines.append(callback)
+                else:
+                    functions.append(callback)
+        return functions, coroutines
+
+    async def publish(self, event):
+        """Publish an event and wait for all the subscribers to be done"""
+        functions, coroutines = self._split_subscribers(event)
+        for callback in functions:
+            callback(event)
+        for callback in coroutines:
+            await callback(event)
+
+    def emit(self, event):
+        """Publish an event from synchronous code. The coroutine subscribers are scheduled
+        on the running event loop instead of being waited for.
+        """
+        functions, coroutines = self._split_subscribers(event)
+        for callback in functions:
+            callback(event)
+        if coroutines:
+            loop = asyncio.get_event_loop()
+            for callback in coroutines:
+                loop.create_task(callback(event))
+
+    def clear(self):
+        self._subscribers.clear()
@@ -1,59 +1,59 @@
 """Contains the BOTC Game class"""
 
+import asyncio
+import collections
+import math
 import random
 import datetime
 import botutils
 import globvars
-import json
 import pytz
-import configparser
 import discord
 import sqlite3
 from library import fancy
+from .abilities import ActionLedger
 from .chrono import GameChrono
+from .GameRandom import GameRandom
 from .BOTCUtils import BOTCUtils
 from .Category import Category
+from .ChoppingBlock import ChoppingBlock
 from .Phase import Phase
 from .Player import Player
+from .status import StatusStore
 from .PlayerState import PlayerState
 from .errors import GameError, TooFewPlayers, TooManyPlayers
 from .Townsfolk import Townsfolk
 from .Outsider import Outsider
 from .Minion import Minion
 from .Demon import Demon
-from .gamemodes.troublebrewing.Saint import Saint
-from .gamemodes.troublebrewing.Drunk import Drunk
+from .gamemodes.troublebrewing import Saint, Drunk
 from .gamemodes.troublebrewing._utils import TroubleBrewing
 from .gamemodes.badmoonrising._utils import BadMoonRising
 from .gamemodes.sectsandviolets._utils import SectsAndViolets
 from .gamemodes.Gamemode import Gamemode
+from .packs import get_edition, load_edition
+from .EventBus import EventBus, DeathEvent, RoleChangeEvent, PhaseChangeEvent, NominationEvent, \
+    VoteCastEvent, ExecutionEvent
+from .NightOrder import NightOrder
+from .Seating import Seating
+from .WinTracker import WinEvent, WinTracker
 from .RoleGuide import RoleGuide
 from .gameloops import master_game_loop, nomination_loop, base_day_loop, debate_timer
+from .snapshot import save_snapshot, delete_snapshot
+from .replay import GameRecorder, RECORD_GAMES
+from . import embeds
 from models import GameMeta
 from botc import StatusList, Team
+from botutils.settings import settings
 
-Preferences = configparser.ConfigParser()
-Preferences.read("preferences.INI")
-
-CARD_NIGHT = Preferences["colors"]["CARD_NIGHT"]
-CARD_NIGHT = int(CARD_NIGHT, 16)
-
-CARD_DAWN = Preferences["colors"]["CARD_DAWN"]
-CARD_DAWN = int(CARD_DAWN, 16)
-
-CARD_DAY = Preferences["colors"]["CARD_DAY"]
-CARD_DAY = int(CARD_DAY, 16)
+Preferences = settings.preferences
 
 TOWNSFOLK_COLOR = Preferences["colors"]["TOWNSFOLK_COLOR"]
 DEMON_COLOR = Preferences["colors"]["DEMON_COLOR"]
 TOWNSFOLK_COLOR = int(TOWNSFOLK_COLOR, 16)
 DEMON_COLOR = int(DEMON_COLOR, 16)
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
-
-SERVER_ID = Config["user"]["SERVER_ID"]
-SERVER_ID = int(SERVER_ID)
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -63,34 +63,22 @@ CONFLICTING_CMDS = [
 
 ]
 
-random.seed(datetime.datetime.now())
-
-with open('botc/game_text.json') as json_file:
-    strings = json.load(json_file)
-    nightfall = strings["gameplay"]["nightfall"]
-    daybreak = strings["gameplay"]["daybreak"]
-    dawn = strings["gameplay"]["dawn"]
-    lobby_game_start = strings["gameplay"]["lobby_game_start"]
-    lobby_game_closing = strings["gameplay"]["lobby_game_closing"]
-    evilteammates = strings["gameplay"]["evilteammates"]
-    copyrights_str = strings["misc"]["copyrights"]
-    tb_lore = strings["gameplay"]["tb_lore"]
-    bmr_lore = strings["gameplay"]["bmr_lore"] # TODO add bmr lore
-    snv_lore = strings["gameplay"]["snv_lore"] # TODO add snv lore
-    nightfall_image = strings["images"]["nightfall"]
-    dawn_image = strings["images"]["dawn"]
-    daybreak_image = strings["images"]["daybreak"]
-    dove = strings["images"]["dove"]
-    demon = strings["images"]["demon"]
-    no_one_wins = strings["gameplay"]["no_one_wins"]
-    good_wins = strings["gameplay"]["good_wins"]
-    evil_wins = strings["gameplay"]["evil_wins"]
-    role_reveal = strings["gameplay"]["role_reveal"]
-    role_reveal_herring = strings["gameplay"]["role_reveal_herring"]
-    storyteller_death = strings["lore"]["storyteller_death"]
-    ego_role_reveal = strings["gameplay"]["ego_role_reveal"]
-    ego_role_reveal_herring = strings["gameplay"]["ego_role_reveal_herring"]
-    changed_role_reveal = strings["gameplay"]["changed_role_reveal"]
+strings = settings.game_text
+lobby_game_start = strings["gameplay"]["lobby_game_start"]
+lobby_game_closing = strings["gameplay"]["lobby_game_closing"]
+evilteammates = strings["gameplay"]["evilteammates"]
+copyrights_str = strings["misc"]["copyrights"]
+dove = strings["images"]["dove"]
+demon = strings["images"]["demon"]
+no_one_wins = strings["gameplay"]["no_one_wins"]
+good_wins = strings["gameplay"]["good_wins"]
+evil_wins = strings["gameplay"]["evil_wins"]
+role_reveal = strings["gameplay"]["role_reveal"]
+role_reveal_herring = strings["gameplay"]["role_reveal_herring"]
+storyteller_death = strings["lore"]["storyteller_death"]
+ego_role_reveal = strings["gameplay"]["ego_role_reveal"]
+ego_role_reveal_herring = strings["gameplay"]["ego_role_reveal_herring"]
+changed_role_reveal = strings["gameplay"]["changed_role_reveal"]
 
 
 class Setup:
@@ -151,6 +139,7 @@ class GameLog:
         self.setup = game_obj.setup
         self.sitting_order = game_obj.sitting_order
         self.gamemode = game_obj.gamemode.value
+        self.seed = game_obj.rng.seed
 
     def create_game_obj_log_str(self):
         """Create the game log string. The string looks like this:
@@ -168,10 +157,8 @@ class GameLog:
         ```
         """
 
-        Config = configparser.ConfigParser()
-        Config.read("preferences.INI")
-
-        TIMEZONE = Config["location"]["TIME_ZONE"]
+        # Read at every game so that a settings reload applies
+        TIMEZONE = settings.preferences["location"]["TIME_ZONE"]
 
         d = datetime.datetime.now()
         timezone = pytz.timezone(TIMEZONE)
@@ -185,6 +172,7 @@ class GameLog:
         msg += f"MINION :: {str(self.setup.minions)}\n"
         msg += f"TOWNSFOLK :: {str(self.setup.townsfolks)}\n"
         msg += f"OUTSIDER :: {str(self.setup.outsiders)}\n"
+        msg += f"SEED :: {self.seed}\n"
 
         msg += "```"
 
@@ -202,17 +190,26 @@ class Game(GameMeta):
     MIN_PLAYERS = 5
     MAX_PLAYERS = 15
 
-    def __init__(self, gamemode = Gamemode.trouble_brewing):
+    def __init__(self, gamemode = Gamemode.trouble_brewing, seed = None, headless = False):
 
         self._gamemode = gamemode  # default gamemode will always be trouble brewing
+        self.headless = headless  # No Discord side effects and no saving (see botc/replay.py)
+        self.rng = GameRandom(seed)  # GameRandom object, the random streams of the game
 
         self._member_obj_list = []  # list object - list of discord member objects
         self._player_obj_list = []  # list object - list of player objects
         self._sitting_order = tuple()  # tuple object (for immutability)
+        self.seating = Seating(self._sitting_order)  # Seating object, alive ring over the sitting order
         self._chrono = GameChrono()
+        self.events = EventBus()  # EventBus object, publishing the game state changes
+        self.status_store = StatusStore(self._chrono, self.events)
+        self.night_order = NightOrder(get_edition(gamemode))
+        self.win_tracker = WinTracker()
+        self.action_ledger = ActionLedger(self.events)
         self._setup = Setup()
         self.gameloop = master_game_loop
         self.winners = None  # botc.Team object
+        self.win_phase_id = None  # Phase ID in which the winners were decided
         self.invalidated = False  # Don't count in win rates due to modkill/frole/player leaving guild
 
         if DISABLE_DMS:
@@ -235,6 +232,12 @@ class Game(GameMeta):
         # Temporary dawn data
         self.dawn_start_time = None  # datetime()
 
+        # Phase ID of the current social self registrations
+        self._registration_phase_id = None
+
+        self.recorder = None  # GameRecorder object
+        self.subscribe_to_events()
+
     @property
     def nb_players(self):
         return len(self._player_obj_list)
@@ -340,62 +343,15 @@ class Game(GameMeta):
     async def send_lobby_welcome_message(self):
         """Send the welcome message in lobby"""
 
-        # Trouble Brewing Edition
-        if self.gamemode == Gamemode.trouble_brewing:
-            embed = discord.Embed(
-               description = tb_lore
-            )
-            # Using the Saint() object to access some URL's
-            embed.set_thumbnail(url = TroubleBrewing()._gm_art_link)
-            embed.set_author(name = "𝕿𝖗𝖔𝖚𝖇𝖑𝖊 𝕭𝖗𝖊𝖜𝖎𝖓𝖌 - 𝕭𝖑𝖔𝖔𝖉 𝖔𝖓 𝖙𝖍𝖊 𝕮𝖑𝖔𝖈𝖐𝖙𝖔𝖜𝖊𝖗 (𝕭𝖔𝕿𝕮)",
-                             icon_url = Saint()._botc_logo_link)
-            embed.timestamp = datetime.datetime.utcnow()
-            embed.set_footer(text = copyrights_str)
-
-            pings = " ".join([player.user.mention for player in self.sitting_order])
-            msg = lobby_game_start.format(pings, "𝕿𝖗𝖔𝖚𝖇𝖑𝖊 𝕭𝖗𝖊𝖜𝖎𝖓𝖌", self.nb_players)
+        embed = embeds.welcome_template(self.gamemode).make(timestamp = True)
+        pings = " ".join([player.user.mention for player in self.sitting_order])
+        msg = lobby_game_start.format(pings, embeds.EDITION_TITLES[self.gamemode], self.nb_players)
 
-            await botutils.send_lobby(msg, embed=embed)
-        
-        # Bad Moon Rising edition
-        elif self.gamemode == Gamemode.bad_moon_rising:
-            embed = discord.Embed(
-               description = bmr_lore
-            )
-            # Using the Saint() object to access some URL's
-            embed.set_thumbnail(url = BadMoonRising()._gm_art_link)
-            embed.set_author(name = "𝕭𝖆𝖉 𝕸𝖔𝖔𝖓 𝕽𝖎𝖘𝖎𝖓𝖌 - 𝕭𝖑𝖔𝖔𝖉 𝖔𝖓 𝖙𝖍𝖊 𝕮𝖑𝖔𝖈𝖐𝖙𝖔𝖜𝖊𝖗 (𝕭𝖔𝕿𝕮)",
-                             icon_url = Saint()._botc_logo_link)
-            embed.timestamp = datetime.datetime.utcnow()
-            embed.set_footer(text = copyrights_str)
-
-            pings = " ".join([player.user.mention for player in self.sitting_order])
-            msg = lobby_game_start.format(pings, "𝕭𝖆𝖉 𝕸𝖔𝖔𝖓 𝕽𝖎𝖘𝖎𝖓𝖌", self.nb_players)
-
-            await botutils.send_lobby(msg, embed=embed)
-
-        # Sects And Violets edition
-        elif self.gamemode == Gamemode.sects_and_violets:
-            embed = discord.Embed(
-               description = snv_lore
-            )
-            # Using the Saint() object to access some URL's
-            embed.set_thumbnail(url = SectsAndViolets()._gm_art_link)
-            embed.set_author(name = "𝕾𝖊𝖈𝖙𝖘 𝖆𝖓𝖉 𝖁𝖎𝖔𝖑𝖊𝖙𝖘 - 𝕭𝖑𝖔𝖔𝖉 𝖔𝖓 𝖙𝖍𝖊 𝕮𝖑𝖔𝖈𝖐𝖙𝖔𝖜𝖊𝖗 (𝕭𝖔𝕿𝕮)",
-                             icon_url = Saint()._botc_logo_link)
-            embed.timestamp = datetime.datetime.utcnow()
-            embed.set_footer(text = copyrights_str)
-
-            pings = " ".join([player.user.mention for player in self.sitting_order])
-            msg = lobby_game_start.format(pings, "𝕾𝖊𝖈𝖙𝖘 𝖆𝖓𝖉 𝖁𝖎𝖔𝖑𝖊𝖙𝖘", self.nb_players)
-
-            await botutils.send_lobby(msg, embed=embed)
+        await botutils.send_lobby(msg, embed=embed)
 
     async def send_lobby_closing_message(self, win_con_reason = ""):
         """Send the closing message in lobby"""
 
-        from botc import Team
-
         gamemode = fancy.bold(self.gamemode.value)
 
         with sqlite3.connect("data.sqlite3") as db:
@@ -471,8 +427,8 @@ class Game(GameMeta):
                    color = TOWNSFOLK_COLOR
                 )
                 embed.set_author(
-                   name = "{} - 𝕭𝖑𝖔𝖔𝖉 𝖔𝖓 𝖙𝖍𝖊 𝕮𝖑𝖔𝖈𝖐𝖙𝖔𝖜𝖊𝖗 (𝕭𝖔𝕿𝕮)".format(gamemode),
-                   icon_url = Saint()._botc_logo_link
+                   name = "{} - {}".format(gamemode, embeds.BOTC_TITLE),
+                   icon_url = Saint._botc_logo_link
                 )
                 embed.set_thumbnail(url = dove)
 
@@ -547,8 +503,8 @@ class Game(GameMeta):
                    color = DEMON_COLOR
                 )
                 embed.set_author(
-                   name = "{} - 𝕭𝖑𝖔𝖔𝖉 𝖔𝖓 𝖙𝖍𝖊 𝕮𝖑𝖔𝖈𝖐𝖙𝖔𝖜𝖊𝖗 (𝕭𝖔𝕿𝕮)".format(gamemode),
-                   icon_url = Saint()._botc_logo_link
+                   name = "{} - {}".format(gamemode, embeds.BOTC_TITLE),
+                   icon_url = Saint._botc_logo_link
                 )
                 embed.set_thumbnail(url = demon)
 
@@ -607,8 +563,8 @@ class Game(GameMeta):
                    description = role_list_str
                 )
                 embed.set_author(
-                   name = "{} - 𝕭𝖑𝖔𝖔𝖉 𝖔𝖓 𝖙𝖍𝖊 𝕮𝖑𝖔𝖈𝖐𝖙𝖔𝖜𝖊𝖗 (𝕭𝖔𝕿𝕮)".format(gamemode),
-                   icon_url = Saint()._botc_logo_link
+                   name = "{} - {}".format(gamemode, embeds.BOTC_TITLE),
+                   icon_url = Saint._botc_logo_link
                 )
 
             embed.timestamp = datetime.datetime.utcnow()
@@ -629,6 +585,33 @@ class Game(GameMeta):
             botutils.start_votes_timer.cancel()
         # Register the players in game
         self.register_players(globvars.master_state.pregame)
+        # Draw the characters and the sitting order
+        self.setup_table()
+        # Record the game, so that it can be replayed (see botc/replay.py)
+        if RECORD_GAMES:
+            self.recorder = GameRecorder.create(self)
+        # Send the lobby welcome message
+        await self.send_lobby_welcome_message()
+        # Lock the lobby channel
+        await botutils.lock_lobby()
+        # Send the opening dm to all players
+        for player in self._player_obj_list:
+            await player.role.ego_self.send_opening_dm_embed(player.user)
+        # Log the game data
+        await GameLog(self).send_game_obj_log_str()
+        # Swap the conflicting commands for the game related commands
+        self.load_game_commands()
+        # Save the game, so that it can be resumed if the bot restarts during night 1
+        save_snapshot(self)
+        # Start the game loop
+        self.gameloop.start(self)
+
+    def setup_table(self):
+        """Draw the characters of the registered members and the sitting order, from the
+        setup random stream of the game. The same seed and members give the same table.
+        """
+        # Import the characters of the selected edition
+        load_edition(self.gamemode)
         # Generate the setup (role list)
         setup = self.generate_role_set()
         # Give each player a role
@@ -641,19 +624,33 @@ class Game(GameMeta):
         # Initialize each role to set flags as needed, etc.
         for player in self._player_obj_list:
             player.role.exec_init_role(self.setup)
-        # Send the lobby welcome message
-        await self.send_lobby_welcome_message()
+        # Compile the night order and count the teams for the characters in play
+        self.night_order.compile(self.sitting_order)
+        self.win_tracker.start(self.sitting_order)
+        # Night 1 draws from its own random streams
+        self.rng.start_phase(1)
+
+    async def resume_game(self):
+        """Resume a game restored from a snapshot (see botc/snapshot.py) after the bot
+        has restarted. The phase that was interrupted is played again from its start.
+        """
+        # Compile the night order and count the teams for the characters in play
+        self.night_order.compile(self.sitting_order)
+        self.win_tracker.start(self.sitting_order)
+        # Keep recording the game
+        if RECORD_GAMES:
+            self.recorder = GameRecorder.resume(self)
         # Lock the lobby channel
         await botutils.lock_lobby()
-        # Send the opening dm to all players
-        for player in self._player_obj_list:
-            await player.role.ego_self.send_opening_dm_embed(player.user)
-        # Log the game data
-        await GameLog(self).send_game_obj_log_str()
-        # Unload conflicting commands
+        # Swap the conflicting commands for the game related commands
+        self.load_game_commands()
+        # Start the game loop
+        self.gameloop.start(self)
+
+    def load_game_commands(self):
+        """Unload the conflicting commands and load the game related commands"""
         for extension in CONFLICTING_CMDS:
             globvars.client.unload_extension(extension)
-        # Load game related commands
         if self.gamemode == Gamemode.trouble_brewing:
             globvars.client.load_extension("botc.commands.abilities.tb")
         elif self.gamemode == Gamemode.bad_moon_rising:
@@ -663,8 +660,20 @@ class Game(GameMeta):
         
         globvars.client.load_extension("botc.commands.townhall")
         globvars.client.load_extension("botc.commands.debug")
-        # Start the game loop
-        self.gameloop.start(self)
+
+    def unload_game_commands(self):
+        """Unload the game related commands and load the conflicting commands back"""
+        if self.gamemode == Gamemode.trouble_brewing:
+            globvars.client.unload_extension("botc.commands.abilities.tb")
+        elif self.gamemode == Gamemode.bad_moon_rising:
+            globvars.client.unload_extension("botc.commands.abilities.bmr")
+        elif self.gamemode == Gamemode.sects_and_violets:
+            globvars.client.unload_extension("botc.commands.abilities.snv")
+        
+        globvars.client.unload_extension("botc.commands.townhall")
+        globvars.client.unload_extension("botc.commands.debug")
+        for extension in CONFLICTING_CMDS:
+            globvars.client.load_extension(extension)
 
     async def compute_dawn_ability_interactions(self):
         """Order of Action
@@ -701,282 +710,158 @@ class Game(GameMeta):
 
         await self.remove_left_guild_players()
 
-        if self.gamemode == Gamemode.trouble_brewing:
-            """Order of Action (First Night)
-            1. poisoner
-            2. washerwoman
-            3. librarian
-            4. investigator
-            5. chef
-            6. empath
-            7. fortune teller
-            8. butler
-            9. spy
-
-            Order of Action (All Other Nights)
-            1. poisoner
-            2. monk
-            3. scarlet woman
-            4. imp
-            5. ravenkeeper
-            6. empath
-            7. fortune teller
-            8. butler
-            9. undertaker
-            10. spy
-            """
-
-            from botc.gamemodes.troublebrewing._utils import TBRole
-
-            night_1_order = [
-
-               TBRole.poisoner,
-               TBRole.washerwoman,
-               TBRole.librarian,
-               TBRole.investigator,
-               TBRole.chef,
-               TBRole.empath,
-               TBRole.fortuneteller,
-               TBRole.butler,
-               TBRole.spy
-
-            ]
-
-            night_regular_order = [
-
-               TBRole.poisoner,      # Poison
-               TBRole.monk,          # Protect
-               TBRole.scarletwoman,  # Let her know of any demon promotion
-               TBRole.soldier,       # Add the safe from demon status effect if not droisoned
-               TBRole.imp,           # Save the kill target
-               TBRole.empath,
-               TBRole.fortuneteller,
-               TBRole.butler,
-               TBRole.undertaker,    # Send the executed player's role
-               TBRole.spy
-
-            ]
-
-        elif self.gamemode == Gamemode.bad_moon_rising:
-            """Order of Action (First Night)
-            1. lunatic
-            2. sailor
-            3. courtier
-            4. godfather
-            5. devil's advocate
-            6. pukka    
-            7. grandmother
-            8. chambermaid
-
-            Order of Action (All Other Nights)
-            1. sailor
-            2. courtier
-            3. innkeeper
-            4. gambler
-            5. devil's advocate
-            6. lunatic
-            7. exorcist
-            8. zombuul
-            9. pukka
-            10. shabaloth
-            11. po
-            12. assasin
-            13. godfather
-            14. gossip
-            15. professor
-            16. tinker
-            17. moonchild
-            18. grandmother
-            19. chambermaid
-            """
-
-            from botc.gamemodes.badmoonrising._utils import BMRRole
-
-            night_1_order = [
-                BMRRole.lunatic,
-                BMRRole.sailor,
-                BMRRole.courtier,
-                BMRRole.godfather,
-                BMRRole.devilsadvocate,
-                BMRRole.pukka,
-                BMRRole.grandmother,
-                BMRRole.chambermaid
-            ]
-
-            night_regular_order = [
-                BMRRole.sailor,
-                BMRRole.courtier,
-                BMRRole.innkeeper,
-                BMRRole.gambler,
-                BMRRole.devilsadvocate,
-                BMRRole.lunatic,
-                BMRRole.exorcist,
-                BMRRole.zombuul,
-                BMRRole.pukka,
-                BMRRole.shabaloth,
-                BMRRole.po,
-                BMRRole.assassin,
-                BMRRole.godfather,
-                BMRRole.gossip,
-                BMRRole.professor,
-                BMRRole.tinker,
-                BMRRole.moonchild,
-                BMRRole.grandmother,
-                BMRRole.chambermaid
-            ]
-
-        elif self.gamemode == Gamemode.sects_and_violets:
-            """Order of Action (First Night)
-            1. philosopher
-            2. snake charmer
-            3. evil twin
-            4. witch
-            5. cerenovus
-            6. clockmaker
-            7. dreamer
-            8. seamstress
-            9. mathematician
-
-            Order of Action (All Other Nights)
-            1. philosopher
-            2. snake charmer
-            3. witch
-            4. cerenovus
-            5. pit-hag
-            6. fang gu
-            7. no dashii
-            8. vortox
-            9. vigormortis
-            10. barber
-            11. sweetheart
-            12. sage
-            13. dreamer
-            14. flowergirl
-            15. town crier
-            16. oracle
-            17. seamstress
-            18. juggler
-            19. mathematician
-            """
-
-            from botc.gamemodes.sectsandviolets._utils import SnVRole
-
-            night_1_order = [
-                SnVRole.philosopher,
-                SnVRole.snakecharmer,
-                SnVRole.eviltwin,
-                SnVRole.witch,
-                SnVRole.cerenovus,
-                SnVRole.clockmaker,
-                SnVRole.dreamer,
-                SnVRole.seamstress,
-                SnVRole.mathematician
-            ]
-
-            night_regular_order = [
-                SnVRole.philosopher,
-                SnVRole.snakecharmer,
-                SnVRole.witch,
-                SnVRole.cerenovus,
-                SnVRole.pithag,
-                SnVRole.fanggu,
-                SnVRole.nodashii,
-                SnVRole.vortox,
-                SnVRole.vigormortis,
-                SnVRole.barber,
-                SnVRole.sweetheart,
-                SnVRole.sage,
-                SnVRole.dreamer,
-                SnVRole.flowergirl,
-                SnVRole.towncrier,
-                SnVRole.oracle,
-                SnVRole.seamstress,
-                SnVRole.juggler,
-                SnVRole.mathematician
-            ]
-
-        else:
-            raise GameError("Gamemode is not one of available BoTC editions.")
-
-        # Night 1 order
-        if self._chrono.is_night_1():
-            for character_enum in night_1_order:
-                list_of_characters = BOTCUtils.get_players_from_role_name(character_enum)
-                for character in list_of_characters:
-                    await character.role.ego_self.process_night_ability(character)
-
-        # Regular night order
-        else:
-            for character_enum in night_regular_order:
-                list_of_characters = BOTCUtils.get_players_from_role_name(character_enum)
-                for character in list_of_characters:
-                    await character.role.ego_self.process_night_ability(character)
+        for wave in self.night_order.get_waves(self._chrono.is_night_1()):
+            # A won game is over: the game loop is being cancelled
+            if self.winners:
+                return
+            await asyncio.gather(*[player.role.ego_self.process_night_ability(player) for player in wave])
 
     def has_received_all_expected_dawn_actions(self):
         """Check if all players with expected dawn actions have submitted them"""
-        for player in self.sitting_order:
-            if not player.role.true_self.has_finished_dawn_action(player):
-                return False
-        return True
+        return self._has_received_all_expected_actions(lambda role, player: role.expected_dawn_action(player))
 
     def has_received_all_expected_night_actions(self):
         """Check if all players with expected night actions have submitted them"""
+        return self._has_received_all_expected_actions(lambda role, player: role.expected_night_action(player))
+
+    def _has_received_all_expected_actions(self, expected_action):
+        """Ask the action ledger for the players missing the action their character
+        expects in the current phase
+        """
+        expected = collections.defaultdict(list)  # {ActionTypes : [Player]}
         for player in self.sitting_order:
-            if not player.role.true_self.has_finished_night_action(player):
-                return False
-        return True
+            action_type = expected_action(player.role.true_self, player)
+            if action_type is not None:
+                expected[action_type].append(player)
+        phase_id = self._chrono.phase_id
+        return not any(self.action_ledger.missing_actions(phase_id, players, action_type)
+                       for action_type, players in expected.items())
 
     @property
     def nb_alive_players(self):
         """Return the number of alive players (apparently alive state)"""
-        count = 0
-        for player in self.sitting_order:
-            if player.is_apparently_alive():
-                count += 1
-        return count
+        return self.seating.nb_alive
+
+    @property
+    def nb_required_votes(self):
+        """Return the number of votes needed to put a nominated player on the chopping block"""
+        return math.ceil(self.nb_alive_players / 2)
 
     @property
     def list_alive_players(self):
         """Return the list of alive players (truly alive state)"""
         return [player for player in self.sitting_order if player.is_alive()]
 
-    async def check_winning_conditions(self):
-        """Check if the game has reached the winning conditons. Promote new demons or
-        end the game is necessary.
+    async def nominate(self, nominator, nominated):
+        """Register a nomination and run the nominated character's ability. The
+        nomination_loop collects the votes, a headless game gets them from cast_vote().
         """
-
-        # Less than or equal to 2 alive players. Winning condition is definitely triggered.
-        if self.nb_alive_players <= 2:
-
-            # There are still alive demons. The game is over with Evil win.
-            if BOTCUtils.has_alive_demons():
-                self.winners = Team.evil
+        nominator.toggle_has_nominated()
+        nominated.toggle_was_nominated()
+        await self.events.publish(NominationEvent(nominator, nominated))
+        await nominated.role.true_self.on_being_nominated(nominator, nominated)
+
+    def start_nomination_loop(self, nominator, nominated):
+        """Start the vote on a nomination, unless the game is headless"""
+        if not self.headless:
+            nomination_loop.start(self, nominator, nominated)
+
+    async def cast_vote(self, voter, nominated, hand_up):
+        """Register the vote of a player on a nomination"""
+        if hand_up:
+            voter.spend_vote()
+        await self.events.publish(VoteCastEvent(voter, nominated, hand_up))
+
+    def tally_votes(self, nominated, nb_votes, nb_required_votes):
+        """Update the chopping block after the vote on a nomination. Return True if the
+        nominated player is now on the chopping block.
+        """
+        # The vote count has not reached the execution threshold. The player is safe.
+        if nb_votes < nb_required_votes:
+            return False
+        # No one is on the chopping block, or this player has more votes: the player
+        # replaces them on the chopping block
+        if not self.chopping_block or nb_votes > self.chopping_block.nb_votes:
+            self.chopping_block = ChoppingBlock(nominated, nb_votes)
+            return True
+        # Tie: no one is executed
+        if nb_votes == self.chopping_block.nb_votes:
+            self.chopping_block = ChoppingBlock(None, nb_votes)
+        # Otherwise the player on the chopping block remains there
+        return False
+
+    async def execute_chopping_block(self):
+        """Execute the player on the chopping block at the end of the day. Return the
+        executed player, or None.
+        """
+        if not self.chopping_block or not self.chopping_block.player_about_to_die:
+            return None
+        executed = self.chopping_block.player_about_to_die
+        await self.events.publish(ExecutionEvent(executed))
+        await executed.role.true_self.on_being_executed(executed)
+        return executed
+
+    async def check_winning_conditions(self, event = WinEvent.death, player = None):
+        """Check if the game has reached the winning conditons after an event (see
+        WinTracker). End the game if necessary.
+        @player : the player concerned by the event (ex. the executed player)
+        """
+        winners = self.win_tracker.check_rules(event, player) or \
+            self.win_tracker.check_counts(self.nb_alive_players)
+        if winners:
+            self.winners = winners
+            self.win_phase_id = self._chrono.phase_id
+            if not self.headless:
                 self.gameloop.cancel()
 
-            # There is no alive demon. The game is over with Good win.
-            else:
-                self.winners = Team.good
-                self.gameloop.cancel()
+    def subscribe_to_events(self):
+        """Keep the game indexes, the Discord roles, the win checks and the snapshot up
+        to date with the state changes published on the event bus. A headless game only
+        keeps its own state.
 
-        # More than 2 players still alive.
-        else:
-
-            # There are still alive demons.
-            if BOTCUtils.has_alive_demons():
-                # There is at least one alive good player. The game continues.
-                alives = self.list_alive_players
-                for player in alives:
-                    if player.role.true_self.is_good():
-                        return
-                # The remaining players are all evil. The demon can't be nominated, and evil wins.
-                else:
-                    self.winners = Team.evil
-                    self.gameloop.cancel()
-
-            # There is no alive demon. The game is over with Good win.
-            else:
-                self.winners = Team.good
-                self.gameloop.cancel()
+        The win checks are subscribed last: a win cancels the game loop, and the
+        subscribers awaited after it would not run for the final death.
+        """
+        self.events.subscribe(DeathEvent, self._on_death)
+        self.events.subscribe(RoleChangeEvent, self._on_role_change)
+        self.events.subscribe(PhaseChangeEvent, self._on_phase_change)
+        if not self.headless:
+            self.events.subscribe(DeathEvent, self._update_death_roles)
+            self.events.subscribe(PhaseChangeEvent, self._save_snapshot)
+        self.events.subscribe(DeathEvent, self._check_wincon_after_death)
+        self.events.subscribe(RoleChangeEvent, self._check_wincon_after_role_change)
+
+    def _on_death(self, event):
+        self.seating.mark_dead(event.player)
+        if not event.apparent:
+            self.win_tracker.on_death(event.player)
+            # The poison ends with the Poisoner
+            if event.player.role.true_self.name == "Poisoner":
+                self.status_store.disable_from_source(event.player, StatusList.poison)
+
+    async def _update_death_roles(self, event):
+        await botutils.add_dead_role(event.player.user)
+        await botutils.remove_alive_role(event.player.user)
+
+    async def _check_wincon_after_death(self, event):
+        if not event.apparent:
+            await self.check_winning_conditions(WinEvent.death, event.player)
+
+    def _on_role_change(self, event):
+        self.night_order.mark_outdated()
+        self.win_tracker.on_role_change(event.player, event.old_role, event.new_role)
+
+    async def _check_wincon_after_role_change(self, event):
+        await self.check_winning_conditions(WinEvent.role_change, event.player)
+
+    def _on_phase_change(self, event):
+        # Wear off the status effects that do not last into the next phase
+        self.status_store.end_phase(event.phase_id)
+        self.rng.start_phase(event.phase_id + 1)
+
+    def _save_snapshot(self, event):
+        # Save the game at the phase boundary
+        save_snapshot(self)
 
     async def end_game(self):
         """End the game, compute winners etc.
@@ -986,19 +871,12 @@ class Game(GameMeta):
         await self.send_lobby_closing_message()
         # Remove roles
         await botutils.remove_all_alive_dead_roles_after_game()
-        # Unload extensions
-        if self.gamemode == Gamemode.trouble_brewing:
-            globvars.client.unload_extension("botc.commands.abilities.tb")
-        elif self.gamemode == Gamemode.bad_moon_rising:
-            globvars.client.unload_extension("botc.commands.abilities.bmr")
-        elif self.gamemode == Gamemode.sects_and_violets:
-            globvars.client.unload_extension("botc.commands.abilities.snv")
-        
-        globvars.client.unload_extension("botc.commands.townhall")
-        globvars.client.unload_extension("botc.commands.debug")
-        # Load conflicting commands
-        for extension in CONFLICTING_CMDS:
-            globvars.client.load_extension(extension)
+        # Unload extensions and load conflicting commands
+        self.unload_game_commands()
+        # The game can't be resumed anymore
+        delete_snapshot()
+        if self.recorder:
+            self.recorder.finish()
         # Log the game
         await botutils.log(botutils.Level.info, "Game finished")
         # Stop various loops from running
@@ -1019,6 +897,10 @@ class Game(GameMeta):
         await botutils.unlock_lobby()
         # Update the global state
         botutils.update_state_machine()
+        # The players on the waiting list join the lobby of the next game
+        if await botutils.promote_waiting_players(self.MAX_PLAYERS):
+            botutils.update_state_machine()
+            botutils.lobby_timeout.start()
 
     async def make_nightfall(self):
         """Transition the game into night phase"""
@@ -1045,13 +927,7 @@ class Game(GameMeta):
         self._chrono.next()
 
         # Prepare the phase announcement message
-        embed = discord.Embed(
-           description = botutils.BotEmoji.moon + " " + nightfall,
-           color = CARD_NIGHT
-        )
-        embed.set_footer(text = copyrights_str)
-        embed.set_image(url = nightfall_image)
-        embed.timestamp = datetime.datetime.utcnow()
+        embed = embeds.nightfall_template.make(description = embeds.nightfall_description, timestamp = True)
         await botutils.send_lobby(message = "", embed = embed)
 
         # Reset the nomination data for the previous day phase
@@ -1075,13 +951,7 @@ class Game(GameMeta):
         self._chrono.next()
 
         # Prepare the phase announcement message
-        embed = discord.Embed(
-           description = botutils.BotEmoji.sunrise + " " + dawn,
-           color = CARD_DAWN
-        )
-        embed.set_footer(text = copyrights_str)
-        embed.set_image(url = dawn_image)
-        embed.timestamp = datetime.datetime.utcnow()
+        embed = embeds.dawn_template.make(description = embeds.dawn_description, timestamp = True)
         await botutils.send_lobby(message = "", embed = embed)
 
     async def make_daybreak(self):
@@ -1146,13 +1016,10 @@ class Game(GameMeta):
                    ", ".join(night_deaths_names)
                 )
 
-        embed = discord.Embed(
-           description = botutils.BotEmoji.sun + " " + daybreak + " " + final_death_message,
-           color = CARD_DAY
+        embed = embeds.daybreak_template.make(
+           description = embeds.daybreak_description.format(final_death_message),
+           timestamp = True
         )
-        embed.set_footer(text = copyrights_str)
-        embed.set_image(url = daybreak_image)
-        embed.timestamp = datetime.datetime.utcnow()
 
         await botutils.send_lobby(message = "", embed = embed)
 
@@ -1196,10 +1063,10 @@ class Game(GameMeta):
             minion_all = BOTCUtils.get_role_list(selected_gamemode, Minion)
             demon_all = BOTCUtils.get_role_list(selected_gamemode, Demon)
 
-            ret_townsfolk = random.sample(townsfolk_all, nb_townsfolk)
-            ret_outsider = random.sample(outsider_all, nb_outsider)
-            ret_minion = random.sample(minion_all, nb_minion)
-            ret_demon = random.sample(demon_all, nb_demon)
+            ret_townsfolk = self.rng.setup.sample(townsfolk_all, nb_townsfolk)
+            ret_outsider = self.rng.setup.sample(outsider_all, nb_outsider)
+            ret_minion = self.rng.setup.sample(minion_all, nb_minion)
+            ret_demon = self.rng.setup.sample(demon_all, nb_demon)
 
             final_townsfolk = ret_townsfolk.copy()
             final_outsider = ret_outsider.copy()
@@ -1214,8 +1081,9 @@ class Game(GameMeta):
                 final_minion = setup_next[2]
                 final_demon = setup_next[3]
 
-            setup = final_townsfolk + final_outsider + final_minion + final_demon
-            random.shuffle(setup)
+            # Each player gets their own character object, not the shared one
+            setup = [type(role)() for role in final_townsfolk + final_outsider + final_minion + final_demon]
+            self.rng.setup.shuffle(setup)
 
             return setup
 
@@ -1229,33 +1097,52 @@ class Game(GameMeta):
             ret = []
             for member in member_obj_list:
                 role_obj = role_obj_list.pop()
-                player_obj = Player(member, role_obj)
+                player_obj = Player(member, role_obj, self.status_store, self.action_ledger)
                 ret.append(player_obj)
 
         self._player_obj_list = ret
 
+    def register_social_selves(self):
+        """Roll what each player registers as (social_self) for the current phase.
+
+        Only done once per phase: the first information character that needs it triggers
+        the registration, after the abilities changing the game state have resolved (ex.
+        a poisoned spy registers as the spy). Every other character reading the social
+        selves during that phase sees the same registrations.
+        """
+        phase_id = self._chrono.phase_id
+        if self._registration_phase_id == phase_id:
+            return
+        for player in self.sitting_order:
+            player.role.set_new_social_self(player)
+        self._registration_phase_id = phase_id
+        registrations = ", ".join(f"{player.user.display_name} as {player.role.social_self}" for player in self.sitting_order)
+        globvars.logging.info(f">>> Registrations for phase {phase_id}: {registrations}")
+
     def generate_frozen_sitting(self):
         """Freeze the sittings of the table around the game table"""
 
-        random.shuffle(self.player_obj_list)
+        self.rng.seating.shuffle(self.player_obj_list)
         self._sitting_order = tuple(self._player_obj_list)
+        self.seating = Seating(self._sitting_order)
         globvars.logging.info(f"Sitting Order {str(self._sitting_order)}")
 
     def __repr__(self):
         return "Blood on the Clocktower"
 
     async def remove_left_guild_players(self):
-        for member in self.member_obj_list:
-            fetched_member = globvars.client.get_guild(SERVER_ID).get_member(int(member.id))
-            if fetched_member == None: #player left guild
-                self.invalidated = True
-                for player in self._player_obj_list:
-                    if player.user == member: #discord.py implements equality check between users and members
-
-                        #We can't call player.exec_real_death() because we would then try to give a role to a nonexistent player
-                        player.ghost_vote = 0
-                        player._state_obj = PlayerState.dead
-                        player._apparent_state_obj = PlayerState.dead
-
-                        break
+        """Kill the players who have left the guild (see MembershipTracker)"""
+        departed = globvars.master_state.membership.departed_among(member.id for member in self.member_obj_list)
+        for user_id in departed:
+            self.invalidated = True
+            player = self.seating.get_player(user_id)
+            if player is None:
+                continue
+            #We can't call player.exec_real_death() because we would then try to give a role to a nonexistent player
+            player.ghost_vote = 0
+            if player.is_alive():
+                self.win_tracker.on_death(player)
+            player._state_obj = PlayerState.dead
+            player._apparent_state_obj = PlayerState.dead
+            self.seating.mark_dead(player)
         await self.check_winning_conditions()
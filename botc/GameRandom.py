@@ -0,0 +1,61 @@
+"""Contains the GameRandom class"""
+
+import enum
+import random
+
+
+class RandomStream(enum.Enum):
+    """Named random streams of a game"""
+
+    setup = "setup"  # Characters in play, Drunk's ego, demon bluffs
+    seating = "seating"  # Sitting order
+    info = "info"  # False information of the drunk or poisoned players
+    storyteller = "storyteller"  # Registrations, promotions, default targets...
+
+
+class GameRandom:
+    """Random number generators of one game, seeded from a recorded game seed.
+
+    Every stream is a separate random.Random object, so that a game never shares the
+    global random state with another game or with the bot's flavour texts. The streams
+    are reseeded from (game seed, stream name, phase ID) at the start of each phase: a
+    game resumed from its snapshot, or replayed with the same seed and the same player
+    actions, draws the same numbers.
+    """
+
+    __slots__ = ("seed", "phase_id", "_streams")
+
+    def __init__(self, seed = None):
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.phase_id = None
+        self._streams = {stream: random.Random() for stream in RandomStream}
+        self.start_phase(0)
+
+    def start_phase(self, phase_id):
+        """Reseed all the streams for a phase (0 for the game setup)"""
+        self.phase_id = phase_id
+        for stream, generator in self._streams.items():
+            generator.seed(f"{self.seed}:{stream.value}:{phase_id}")
+
+    def stream(self, stream):
+        """Return the random.Random object of a stream (RandomStream enum object)"""
+        return self._streams[stream]
+
+    @property
+    def setup(self):
+        return self._streams[RandomStream.setup]
+
+    @property
+    def seating(self):
+        return self._streams[RandomStream.seating]
+
+    @property
+    def info(self):
+        return self._streams[RandomStream.info]
+
+    @property
+    def storyteller(self):
+        return self._streams[RandomStream.storyteller]
+
+    def __repr__(self):
+        return f"<GameRandom seed={self.seed} phase={self.phase_id}>"
@@ -6,7 +6,6 @@ from .Team import Team
 class Minion:
     """Minion class"""
 
-    def __init__(self):
-        self._category = Category.minion
-        self._team = Team.evil
+    _category = Category.minion
+    _team = Team.evil
 
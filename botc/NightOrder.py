@@ -0,0 +1,62 @@
+"""Contains the NightOrder class"""
+
+
+class NightOrder:
+    """Waking order of the characters at night, compiled for the players of a game.
+
+    The order of each edition is declared in botc/gamemodes/manifest.json. It is compiled
+    into the list of seated players that act, using their ego_self. Players holding the
+    same character wake up in sitting order. A role change only marks the order as
+    outdated; it is compiled again the next time it is used.
+
+    The order is also split into waves. A wave is either a single character whose ability
+    changes the game state (poison, protect, kill...), or a run of consecutive information
+    characters (declared as "info" in the manifest). Everything an information character
+    depends on wakes up earlier in the order, so the players of a wave can be resolved
+    concurrently once the previous waves are done.
+    """
+
+    def __init__(self, edition):
+        self._first_night_ranks = {name: rank for rank, name in enumerate(edition.first_night_order)}
+        self._other_nights_ranks = {name: rank for rank, name in enumerate(edition.other_nights_order)}
+        self._info_roles = edition.info_roles
+        self._sitting_order = tuple()
+        self._first_night = []
+        self._other_nights = []
+        self._outdated = True
+
+    @staticmethod
+    def _compile_order(ranks, sitting_order):
+        acting = [player for player in sitting_order if player.role.ego_self.name in ranks]
+        # The sort is stable: same character players stay in sitting order
+        return sorted(acting, key = lambda player: ranks[player.role.ego_self.name])
+
+    def compile(self, sitting_order):
+        """Compile the waking order of the players. To be called once the roles are initialized."""
+        self._sitting_order = tuple(sitting_order)
+        self._first_night = self._compile_order(self._first_night_ranks, self._sitting_order)
+        self._other_nights = self._compile_order(self._other_nights_ranks, self._sitting_order)
+        self._outdated = False
+
+    def mark_outdated(self):
+        """A player's character has changed"""
+        self._outdated = True
+
+    def get_acting_players(self, is_night_1):
+        """Return the players waking up tonight, in order"""
+        if self._outdated:
+            self.compile(self._sitting_order)
+        return list(self._first_night if is_night_1 else self._other_nights)
+
+    def get_waves(self, is_night_1):
+        """Return the players waking up tonight, grouped in waves (lists of players)"""
+        waves = []
+        previous_is_info = False
+        for player in self.get_acting_players(is_night_1):
+            is_info = player.role.ego_self.name in self._info_roles
+            if is_info and previous_is_info:
+                waves[-1].append(player)
+            else:
+                waves.append([player])
+            previous_is_info = is_info
+        return waves
@@ -6,8 +6,7 @@ from .Team import Team
 class Outsider:
     """Outsider class"""
 
-    def __init__(self):
-        self._category = Category.outsider
-        self._team = Team.good
+    _category = Category.outsider
+    _team = Team.good
 
         
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Contains the Player class"""
 
-import botutils
-from botc.status import StatusList
+from botc.status import StatusList, StatusStore
+from .EventBus import DeathEvent, RoleChangeEvent
 from .PlayerState import PlayerState
 from .abilities import ActionGrid
 from .errors import AlreadyDead
@@ -14,16 +14,22 @@ class Player:
     Apparent state: the apparent life/death state of the player (ex. Zombuul)
 
     (Fleaved must be a real state as it pertains to game participation.)
+
+    Status effects and actions are kept in the status store and the action ledger of the
+    game, shared by all players.
     """
 
-    def __init__(self, user_obj, role_obj):
+    __slots__ = ("_user_obj", "_role_obj", "_old_role_obj", "_state_obj", "_apparent_state_obj",
+                 "action_grid", "_status_store", "ghost_vote", "has_nominated", "was_nominated")
+
+    def __init__(self, user_obj, role_obj, status_store = None, action_ledger = None):
         self._user_obj = user_obj  # Discord user object
         self._role_obj = role_obj  # Role object
         self._old_role_obj = None
         self._state_obj = PlayerState.alive  # Enum object
         self._apparent_state_obj = PlayerState.alive  # Enum object
-        self.action_grid = ActionGrid()  # ActionGrib object
-        self._status_effects = []  # List object
+        self.action_grid = ActionGrid(self, action_ledger)  # ActionGrid object, view of the ActionLedger
+        self._status_store = status_store if status_store is not None else StatusStore()  # StatusStore object
         self.ghost_vote = 1
         self.has_nominated = False
         self.was_nominated = False
@@ -52,8 +58,9 @@ class Player:
     async def exec_change_role(self, new_role):
         """Change the player's old role to a new role"""
         import globvars
+        old_role = self._role_obj
         self._role_obj = new_role
-        await globvars.master_state.game.check_winning_conditions()
+        await globvars.master_state.game.events.publish(RoleChangeEvent(self, old_role, new_role))
     
     async def exec_real_death(self):
         """Turn the player's real state into the death state"""
@@ -62,53 +69,42 @@ class Player:
             raise AlreadyDead("Player is already dead, you are trying to kill them again.")
         self._state_obj = PlayerState.dead
         self._apparent_state_obj = PlayerState.dead
-        await botutils.add_dead_role(self.user)
-        await botutils.remove_alive_role(self.user)
-        if self.role.true_self.name == "Poisoner":
-            for player in globvars.master_state.game.sitting_order:
-                for status in player.status_effects:
-                    if status.effect == StatusList.poison:
-                        status.manually_disable()
-        await globvars.master_state.game.check_winning_conditions()
+        await globvars.master_state.game.events.publish(DeathEvent(self))
     
     async def exec_apparent_death(self):
         """Turn the player's apparent state into the death state, but the real state 
         remains alive
         """
+        import globvars
         if self.is_apparently_dead():
             raise AlreadyDead("Player is already 'apparently' dead, you are trying to " \
                 "kill them again.")
         self._apparent_state_obj = PlayerState.dead
-        await botutils.add_dead_role(self.user)
-        await botutils.remove_alive_role(self.user)
+        await globvars.master_state.game.events.publish(DeathEvent(self, apparent = True))
     
     def has_status_effect(self, status_effect):
         """Check if a player has a status effect"""
-        return status_effect in \
-            [status.effect for status in self.status_effects if status.is_active()]
+        return self._status_store.has(self, status_effect)
     
     def is_droisoned(self):
         """Return true if the player is currently drunk or poisoned (droison) when the 
         check is performed, false otherwise.
         """
-        from botc.gamemodes.troublebrewing import Drunk
-        from botc import StatusList
+        from botc.gamemodes.troublebrewing._utils import TBRole
         # The player's true role is Drunk
-        if self.role.true_self.name == Drunk().name:
+        if self.role.true_self.name == TBRole.drunk.value:
             return True
         # The player is affected by an active poison effect
-        elif StatusList.poison in \
-            [status.effect for status in self.status_effects if status.is_active()]:
+        elif self._status_store.has(self, StatusList.poison):
             return True
         # The player is affected by an active drunkenness effect
-        elif StatusList.drunkenness in \
-            [status.effect for status in self.status_effects if status.is_active()]:
+        elif self._status_store.has(self, StatusList.drunkenness):
             return True
         return False
     
     def add_status_effect(self, new_status_effect):
         """Add a status effect"""
-        self._status_effects.append(new_status_effect)
+        self._status_store.add(new_status_effect)
     
     def is_apparently_alive(self):
         return self.apparent_state == PlayerState.alive
@@ -175,7 +171,7 @@ class Player:
     
     @property
     def status_effects(self):
-        return self._status_effects
+        return self._status_store.effects_of(self)
 
     def __repr__(self):
         return f"{str(self.user.display_name)} ({self.user.id}) is {str(self.role)}"
@@ -3,18 +3,15 @@
 import discord
 import datetime
 import botutils
-import json
-import configparser
 from botc import BOTCUtils
+from botutils.settings import settings
 
 butterfly = botutils.BotEmoji.butterfly
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+copyrights_str = strings["misc"]["copyrights"]
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -0,0 +1,106 @@
+"""Contains the Seating class"""
+
+
+class Seating:
+    """Seats around the game table, following the frozen sitting order.
+
+    The (apparently) alive players are linked into a ring, with the index of the next
+    and previous alive seat kept for every alive seat. A death unlinks the seat, so the
+    alive neighbours of a player are found without going through the table. The ring is
+    built from the apparent states of the players (ex. when a game is restored).
+
+    Players are looked up by user ID.
+    """
+
+    def __init__(self, sitting_order):
+        self._seats = tuple(sitting_order)
+        self._seat_of = {player.user.id: idx for idx, player in enumerate(self._seats)}
+        self._alive = [False] * len(self._seats)
+        self._next = [None] * len(self._seats)  # Index of the next alive seat, clockwise
+        self._prev = [None] * len(self._seats)  # Index of the previous alive seat
+        self.nb_alive = 0
+        for idx, player in enumerate(self._seats):
+            if player.is_apparently_alive():
+                self._link(idx)
+
+    def __len__(self):
+        return len(self._seats)
+
+    def __iter__(self):
+        return iter(self._seats)
+
+    def get_player(self, user_id):
+        """Return the player seated with a user ID, None if there is none"""
+        idx = self._seat_of.get(int(user_id))
+        return self._seats[idx] if idx is not None else None
+
+    def seat_of(self, player):
+        """Return the seat index of a player"""
+        return self._seat_of[player.user.id]
+
+    def _find_alive_seat(self, idx, step):
+        """Go around the table from a seat (excluded) until an alive seat is found"""
+        total = len(self._seats)
+        for offset in range(1, total + 1):
+            candidate = (idx + step * offset) % total
+            if self._alive[candidate]:
+                return candidate
+        return None
+
+    def _link(self, idx):
+        if self.nb_alive == 0:
+            self._next[idx] = self._prev[idx] = idx
+        else:
+            prev_idx = self._find_alive_seat(idx, -1)
+            next_idx = self._next[prev_idx]
+            self._prev[idx], self._next[idx] = prev_idx, next_idx
+            self._next[prev_idx] = self._prev[next_idx] = idx
+        self._alive[idx] = True
+        self.nb_alive += 1
+
+    def _unlink(self, idx):
+        prev_idx, next_idx = self._prev[idx], self._next[idx]
+        self._next[prev_idx] = next_idx
+        self._prev[next_idx] = prev_idx
+        self._next[idx] = self._prev[idx] = None
+        self._alive[idx] = False
+        self.nb_alive -= 1
+
+    def mark_dead(self, player):
+        """Take a player out of the alive ring. Does nothing if they already are."""
+        idx = self.seat_of(player)
+        if self._alive[idx]:
+            self._unlink(idx)
+
+    def next_alive(self, player):
+        """Next alive player, clockwise. A dead player gets the alive seat following theirs."""
+        idx = self.seat_of(player)
+        next_idx = self._next[idx] if self._alive[idx] else self._find_alive_seat(idx, 1)
+        return self._seats[next_idx] if next_idx is not None else None
+
+    def prev_alive(self, player):
+        """Previous alive player, anticlockwise"""
+        idx = self.seat_of(player)
+        prev_idx = self._prev[idx] if self._alive[idx] else self._find_alive_seat(idx, -1)
+        return self._seats[prev_idx] if prev_idx is not None else None
+
+    def alive_neighbours(self, player):
+        """Return the (previous, next) alive neighbours of a player"""
+        return self.prev_alive(player), self.next_alive(player)
+
+    def are_alive_neighbours(self, player_1, player_2):
+        """Are the two players sitting next to each other, skipping the dead?"""
+        return player_2 in self.alive_neighbours(player_1)
+
+    def clockwise_from(self, player):
+        """Iterate over all the seats, starting after the player and ending with them"""
+        idx = self.seat_of(player)
+        total = len(self._seats)
+        for offset in range(1, total + 1):
+            yield self._seats[(idx + offset) % total]
+
+    def adjacent_pairs(self):
+        """Iterate over all the pairs of players sitting next to each other, dead or alive"""
+        total = len(self._seats)
+        for idx in range(total):
+            yield self._seats[idx], self._seats[(idx + 1) % total]
@@ -6,6 +6,5 @@ from .Team import Team
 class Townsfolk:
     """Townsfolk class"""
 
-    def __init__(self):
-        self._category = Category.townsfolk
-        self._team = Team.good
+    _category = Category.townsfolk
+    _team = Team.good
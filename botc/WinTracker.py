@@ -0,0 +1,89 @@
+"""Contains the WinTracker class"""
+
+import enum
+from .Category import Category
+from .Team import Team
+
+
+class WinEvent(enum.Enum):
+    """Game events after which the winning conditions are checked"""
+
+    death = "death"
+    role_change = "role_change"
+    execution = "execution"
+    day_end = "day_end"
+
+
+class WinTracker:
+    """Keep the number of alive good, evil and demon players (real life state, true_self)
+    up to date with the deaths and role changes, instead of going through the table at
+    every check.
+
+    Characters with their own winning condition (ex. Saint, Mayor) register rules for the
+    events they care about (see Character.register_win_rules). A rule is called with the
+    player concerned by the event, and returns the winning Team or None.
+    """
+
+    def __init__(self):
+        self.nb_alive_good = 0
+        self.nb_alive_evil = 0
+        self.nb_alive_demons = 0
+        self._rules = {event: [] for event in WinEvent}  # {WinEvent : [(owner player, rule)]}
+
+    def start(self, sitting_order):
+        """Count the players and register the character rules. To be called once the roles
+        are initialized (or a game is restored).
+        """
+        self.__init__()
+        for player in sitting_order:
+            if player.is_alive():
+                self._count(player.role.true_self, 1)
+            player.role.true_self.register_win_rules(player, self)
+
+    def _count(self, character, step):
+        if character.is_good():
+            self.nb_alive_good += step
+        else:
+            self.nb_alive_evil += step
+        if character.category == Category.demon:
+            self.nb_alive_demons += step
+
+    def add_rule(self, event, owner, rule):
+        """Register a winning condition of the owner player's character"""
+        self._rules[event].append((owner, rule))
+
+    def on_death(self, player):
+        """A player has really died. To be called once, when they were alive."""
+        self._count(player.role.true_self, -1)
+
+    def on_role_change(self, player, old_role, new_role):
+        """A player's character has changed: move them to the new counts and replace the
+        rules of their old character
+        """
+        if player.is_alive():
+            self._count(old_role.true_self, -1)
+            self._count(new_role.true_self, 1)
+        for event in self._rules:
+            self._rules[event] = [(owner, rule) for owner, rule in self._rules[event] if owner is not player]
+        new_role.true_self.register_win_rules(player, self)
+
+    def check_counts(self, nb_alive_players):
+        """The base winning conditions. The number of alive players is the apparent one."""
+        # Less than or equal to 2 alive players: evil wins if a demon is alive, good otherwise
+        if nb_alive_players <= 2:
+            return Team.evil if self.nb_alive_demons else Team.good
+        # No alive demon: good wins
+        if not self.nb_alive_demons:
+            return Team.good
+        # The remaining players are all evil. The demon can't be nominated, and evil wins.
+        if not self.nb_alive_good:
+            return Team.evil
+        return None
+
+    def check_rules(self, event, player = None):
+        """The winning conditions registered by the characters for an event"""
+        for _, rule in self._rules[event]:
+            winners = rule(player)
+            if winners:
+                return winners
+        return None
@@ -1,6 +1,6 @@
 """Blood on the Clocktower (BoTC) game specific mechanics"""
 
-from .abilities import ActionTypes, Action, ActionGrid
+from .abilities import ActionTypes, Action, ActionGrid, ActionLedger
 from .BOTCUtils import BOTCUtils, PlayerParser, NotAPlayer, RoleCannotUseCommand, NotDMChannel, \
     NotLobbyChannel, NotDay, NotDawn, NotNight, DeadOnlyCommand, AliveOnlyCommand, GameLogic, \
     get_number_image, AbilityForbidden, PlayerConverter, RoleConverter, PlayerNotFound, \
@@ -17,7 +17,10 @@ from .ChoppingBlock import ChoppingBlock
 from .chrono import GameChrono
 from .Demon import Demon
 from .errors import GameError, IncorrectNumberOfArguments, TooFewPlayers, TooManyPlayers, \
-    AlreadyDead
+    AlreadyDead, ReplayDivergence
+from .EventBus import EventBus, GameEvent, DeathEvent, RoleChangeEvent, StatusAppliedEvent, \
+    StatusExpiredEvent, NominationEvent, VoteCastEvent, ExecutionEvent, ActionEvent, PhaseChangeEvent
+from .GameRandom import GameRandom, RandomStream
 from .flag_inventory import Flags, Inventory
 from .Grimoire import Grimoire
 from .Minion import Minion
@@ -28,8 +31,9 @@ from .RecurringAction import RecurringAction, NonRecurringAction
 from .RoleGuide import RoleGuide
 from .Phase import Phase
 from .status import StatusList, Storyteller, SafetyFromDemon, Drunkenness, Poison, RedHerring, \
-    ButlerService, RavenkeeperActivated
+    ButlerService, RavenkeeperActivated, StatusStore
 from .Team import Team
 from .Townsfolk import Townsfolk
 from .Townsquare import Townsquare
+from .WinTracker import WinEvent, WinTracker
 from .setups import load_pack
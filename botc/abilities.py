@@ -1,6 +1,8 @@
 """Contains the action class for botc night/day character abilities"""
 
+import collections
 import enum
+from .EventBus import ActionEvent
 
 
 class ActionTypes(enum.Enum):
@@ -27,6 +29,8 @@ class ActionTypes(enum.Enum):
 class Action:
     """Action class to represent character ability"""
 
+    __slots__ = ("source_player", "target_player", "action_type", "birth_phase_id")
+
     def __init__(self, source_player, target_player, action_type, phase_id):
         """Param:
         @source_player : player that did the action (Player() object)
@@ -44,30 +48,76 @@ class Action:
         return f"Action {self.action_type}"
 
 
-class _GrowingList(list):
-    """A list that grows automatically when an index that does not exist yet is referenced, 
-    filling the rest of the values with filler items
+class ActionLedger:
+    """Actions (abilities) used by all the players of a game, indexed by phase ID, by
+    action type and by target. A player has at most one action per phase: registering
+    a new one replaces the previous one in all the indexes. Registrations are published
+    on the event bus of the game, if there is one.
     """
 
-    def __setitem__(self, index, value):
-        """Set item
-        If list is not long enough, grow it and fill with default None value.
-        """
-        if index >= len(self):
-            self.extend([None]*(index + 1 - len(self)))
-        list.__setitem__(self, index, value)
-    
-    def __getitem__(self, index):
-        """Get item
-        If list is not long enough, don't grow and return None.
+    def __init__(self, events = None):
+        self._events = events  # EventBus object
+        self._by_phase = collections.defaultdict(dict)  # {phase ID : {source user ID : Action}}
+        self._by_type = collections.defaultdict(list)  # {(phase ID, ActionTypes) : [Action]}
+        self._by_target = collections.defaultdict(list)  # {target user ID : [(phase ID, Action)]}
+
+    @staticmethod
+    def _targets_of(action):
+        targets = action.target_player
+        if targets is None:
+            return []
+        if hasattr(targets, "user"):
+            return [targets]
+        return list(targets)
+
+    def _unindex(self, action, phase_id):
+        self._by_type[(phase_id, action.action_type)].remove(action)
+        for target in self._targets_of(action):
+            self._by_target[target.user.id].remove((phase_id, action))
+
+    def register(self, player, action, phase_id):
+        """Save the action of a player for a phase"""
+        previous = self._by_phase[phase_id].get(player.user.id)
+        if previous is not None:
+            self._unindex(previous, phase_id)
+        self._by_phase[phase_id][player.user.id] = action
+        self._by_type[(phase_id, action.action_type)].append(action)
+        for target in self._targets_of(action):
+            self._by_target[target.user.id].append((phase_id, action))
+        if self._events is not None:
+            self._events.emit(ActionEvent(player, action, phase_id))
+
+    def get(self, player, phase_id):
+        """Return the action of a player for a phase, None if there is none"""
+        return self._by_phase[phase_id].get(player.user.id) if phase_id in self._by_phase else None
+
+    def actions_of_type(self, phase_id, action_type):
+        """Return all the actions of a type in a phase (ex. all the kills tonight)"""
+        return list(self._by_type.get((phase_id, action_type), ()))
+
+    def targeting(self, player, phase_id = None):
+        """Return the actions targeting a player, in a phase or during the whole game"""
+        return [action for action_phase_id, action in self._by_target.get(player.user.id, ())
+                if phase_id is None or action_phase_id == phase_id]
+
+    def missing_actions(self, phase_id, players, action_type = None):
+        """Return the players who have not registered an action (of a type, if given) in
+        a phase
         """
-        if index >= len(self):
-            return None
-        return list.__getitem__(self, index)
+        actions = self._by_phase.get(phase_id, {})
+        return [player for player in players if player.user.id not in actions
+                or (action_type is not None and actions[player.user.id].action_type != action_type)]
+
+    def __iter__(self):
+        """Iterate over (phase ID, Action) for the whole game, in phase order"""
+        for phase_id in sorted(self._by_phase):
+            for action in self._by_phase[phase_id].values():
+                yield phase_id, action
 
 
 class ActionGrid:
-    """A calendar like grid to keep track of actions (abilities) used by players
+    """A calendar like view of the actions (abilities) used by a player, stored in the
+    action ledger of the game
     [
         night1, dawn1, day1,
         night2, dawn2, day3,
@@ -75,13 +125,16 @@ class ActionGrid:
     ]
     """
 
-    def __init__(self):
-        self.grid = _GrowingList()
+    __slots__ = ("_player", "_ledger")
+
+    def __init__(self, player, ledger = None):
+        self._player = player
+        self._ledger = ledger if ledger is not None else ActionLedger()
     
     def register_an_action(self, action, phase_id):
         """Save an action within the grid based on a phase ID"""
-        self.grid[phase_id] = action
+        self._ledger.register(self._player, action, phase_id)
     
     def retrieve_an_action(self, phase_id):
         """Retrieve an action within the grid based on a phase ID"""
-        return self.grid[phase_id]
+        return self._ledger.get(self._player, phase_id)
@@ -1,11 +1,10 @@
 """Contains some checking functions for botc commands"""
 
-import configparser
 from botc import BOTCUtils, NotAPlayer, RoleCannotUseCommand, AliveOnlyCommand, \
     DeadOnlyCommand, NotDay, NotDawn, NotNight, NotDMChannel, NotLobbyChannel
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 LOBBY_CHANNEL_ID = Config["user"]["LOBBY_CHANNEL_ID"]
 
@@ -46,3 +46,12 @@ class GameChrono:
                 return Phase.night
             else:
                 return Phase.dawn
+
+    @property
+    def next_phase(self):
+        """The phase the game moves into after the current one"""
+        if self.current % 3 == 1:
+            return Phase.dawn
+        elif self.current % 3 == 2:
+            return Phase.day
+        return Phase.night
@@ -3,19 +3,17 @@
 import botutils
 import discord
 import traceback
-import json
 from discord.ext import commands
 from botc import check_if_is_player, check_if_is_night, check_if_dm, RoleCannotUseCommand, \
     check_if_player_really_alive, check_if_can_poison, PlayerParser, AbilityForbidden, \
     NotAPlayer, BOTCUtils, AliveOnlyCommand, NotNight, NotDMChannel
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
-with open('botc/game_text.json') as json_file:
-    documentation = json.load(json_file)
+documentation = settings.game_text
 
 
 class Poison(commands.Cog, name = documentation["misc"]["abilities_cog"]):
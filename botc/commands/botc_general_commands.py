@@ -1,28 +1,25 @@
 """Contains cog for general out of game / info related botc commands"""
 
 import discord
-import json
-import configparser
 from discord.ext import commands
 import botutils
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("preferences.INI")
+Config = settings.preferences
 
 CARD_NORMAL = int(Config["colors"]["CARD_NORMAL"], 16)
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    copyrights_str = strings["misc"]["copyrights"]
-    res_title = strings["misc"]["res_title"]
-    res_desc = strings["misc"]["res_desc"]
-    thumnail = strings["misc"]["thumnail"]
-    wiki = strings["misc"]["wiki"]
-    rulebooks = strings["misc"]["rulebooks"]
-    scripts = strings["misc"]["scripts"]
-    social_medias = strings["misc"]["social_medias"].format(
-        botutils.BotEmoji.facebook, botutils.BotEmoji.youtube, botutils.BotEmoji.twitter, botutils.BotEmoji.reddit
-    )
+strings = settings.game_text
+copyrights_str = strings["misc"]["copyrights"]
+res_title = strings["misc"]["res_title"]
+res_desc = strings["misc"]["res_desc"]
+thumnail = strings["misc"]["thumnail"]
+wiki = strings["misc"]["wiki"]
+rulebooks = strings["misc"]["rulebooks"]
+scripts = strings["misc"]["scripts"]
+social_medias = strings["misc"]["social_medias"].format(
+    botutils.BotEmoji.facebook, botutils.BotEmoji.youtube, botutils.BotEmoji.twitter, botutils.BotEmoji.reddit
+)
 
 
 class BOTCGeneralCommands(commands.Cog, name="BoTC Commands"):
@@ -1,17 +1,15 @@
 """Contains the fnomination command cog"""
 
-import json
 import traceback
 import botutils
 from botc import Phase
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
+documentation = settings.game_text
 
-with open('botutils/bot_text.json') as json_file:
-    bot_text = json.load(json_file)
-    error_str = bot_text["system"]["error"]
+bot_text = settings.bot_text
+error_str = bot_text["system"]["error"]
 
 
 class Fnomination(commands.Cog, name = documentation["misc"]["debug_cog"]):
@@ -1,18 +1,16 @@
 """Contains the frole command cog"""
 
-import json
 import traceback
 import botutils
 import discord
 from discord.ext import commands
 from botc import PlayerConverter, RoleConverter, PlayerNotFound, RoleNotFound
+from botutils.settings import settings
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
+documentation = settings.game_text
 
-with open('botutils/bot_text.json') as json_file:
-    bot_text = json.load(json_file)
-    error_str = bot_text["system"]["error"]
+bot_text = settings.bot_text
+error_str = bot_text["system"]["error"]
 
 x_emoji = botutils.BotEmoji.cross
 check_emoji = botutils.BotEmoji.check
@@ -40,6 +38,7 @@ class Frole(commands.Cog, name = documentation["misc"]["debug_cog"]):
         """Frole command"""
         import globvars
         old_role = player.role.true_self
+        role = type(role)()
         await player.exec_change_role(role)
         player.role.exec_init_role(globvars.master_state.game.setup)
         globvars.master_state.game.invalidated = True
@@ -1,18 +1,16 @@
 """Contains the modkill command cog"""
 
-import json
 import traceback
 import botutils
 import globvars
 from botc import PlayerConverter, PlayerNotFound, AlreadyDead
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
+documentation = settings.game_text
 
-with open('botutils/bot_text.json') as json_file:
-    bot_text = json.load(json_file)
-    error_str = bot_text["system"]["error"]
+bot_text = settings.bot_text
+error_str = bot_text["system"]["error"]
 
 x_emoji = botutils.BotEmoji.cross
 check_emoji = botutils.BotEmoji.check
@@ -1,24 +1,22 @@
 """Nominate command"""
 
 import traceback
-import json
 import botutils
 from discord.ext import commands
 from botc import check_if_is_player, check_if_lobby, check_if_player_apparently_alive, \
     check_if_is_day, PlayerConverter, BOTCUtils, NotAPlayer, NotDay, NotLobbyChannel, \
     AliveOnlyCommand
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
-    nomination_ongoing = documentation["cmd_warnings"]["nomination_ongoing"]
-    nominations_not_open = documentation["cmd_warnings"]["nominations_not_open"]
-    cannot_be_nominated_again = documentation["cmd_warnings"]["cannot_be_nominated_again"]
-    cannot_nominate_again = documentation["cmd_warnings"]["cannot_nominate_again"]
+documentation = settings.game_text
+nomination_ongoing = documentation["cmd_warnings"]["nomination_ongoing"]
+nominations_not_open = documentation["cmd_warnings"]["nominations_not_open"]
+cannot_be_nominated_again = documentation["cmd_warnings"]["cannot_be_nominated_again"]
+cannot_nominate_again = documentation["cmd_warnings"]["cannot_nominate_again"]
 
 
 class Nominate(commands.Cog, name = documentation["misc"]["townhall_cog"]):
@@ -77,11 +75,8 @@ class Nominate(commands.Cog, name = documentation["misc"]["townhall_cog"]):
         
         if player.can_nominate():
             if nominated.can_be_nominated():
-                # The player cannot nominate again today
-                player.toggle_has_nominated()
-                # The nominated player cannot be nominated again today
-                nominated.toggle_was_nominated()
-                await nominated.role.true_self.on_being_nominated(player, nominated)
+                # The players cannot nominate and be nominated again today
+                await globvars.master_state.game.nominate(player, nominated)
             else:
                 msg = cannot_be_nominated_again.format(
                     ctx.author.mention, 
@@ -1,30 +1,28 @@
 """Stats command"""
 
 import traceback
-import json
 import math
 import botutils
 from library import fancy
 from botc import Phase, RoleGuide
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
-    current_phase = documentation["gameplay"]["current_phase"]
-    stats_tied = documentation["gameplay"]["stats_tied"]
-    stats_no_one = documentation["gameplay"]["stats_no_one"]
-    stats_chopping = documentation["gameplay"]["stats_chopping"]
-    stats_header = documentation["gameplay"]["stats_header"]
-    votes_stats = documentation["gameplay"]["votes_stats"]
-    stats_1 = documentation["gameplay"]["stats_1"]
-    stats_2 = documentation["gameplay"]["stats_2"]
-    stats_3 = documentation["gameplay"]["stats_3"]
-    setup_info = documentation["gameplay"]["setup_info"]
+documentation = settings.game_text
+current_phase = documentation["gameplay"]["current_phase"]
+stats_tied = documentation["gameplay"]["stats_tied"]
+stats_no_one = documentation["gameplay"]["stats_no_one"]
+stats_chopping = documentation["gameplay"]["stats_chopping"]
+stats_header = documentation["gameplay"]["stats_header"]
+votes_stats = documentation["gameplay"]["votes_stats"]
+stats_1 = documentation["gameplay"]["stats_1"]
+stats_2 = documentation["gameplay"]["stats_2"]
+stats_3 = documentation["gameplay"]["stats_3"]
+setup_info = documentation["gameplay"]["setup_info"]
 
 
 class Stats(commands.Cog, name = documentation["misc"]["townhall_cog"]):
@@ -1,18 +1,16 @@
 """Contains the time command"""
 
 import traceback
-import json
 import datetime
-import configparser
 import botutils
 from library import display_time
 from discord.ext import commands
 from botc import check_if_is_player, Phase
 from botc.gameloops import base_day_loop, calculate_base_day_duration, debate_timer, \
     nomination_loop
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("preferences.INI")
+Config = settings.preferences
 
 # Lengths
 BASE_NIGHT = int(Config["botc"]["BASE_NIGHT"])
@@ -22,18 +20,16 @@ DAWN_MULTIPLIER = int(Config["botc"]["DAWN_MULTIPLIER"])
 DEBATE_TIME = int(Config["botc"]["DEBATE_TIME"])
 INCREMENT = int(Config["botc"]["INCREMENT"])
 
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
-    error_str = language["system"]["error"]
-
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
-    time_night = documentation["gameplay"]["time_night"]
-    time_dawn = documentation["gameplay"]["time_dawn"]
-    time_day_base = documentation["gameplay"]["time_day_base"]
-    time_voting = documentation["gameplay"]["time_voting"]
-    time_debate = documentation["gameplay"]["time_debate"]
-    time_nomination = documentation["gameplay"]["time_nomination"]
+language = settings.bot_text
+error_str = language["system"]["error"]
+
+documentation = settings.game_text
+time_night = documentation["gameplay"]["time_night"]
+time_dawn = documentation["gameplay"]["time_dawn"]
+time_day_base = documentation["gameplay"]["time_day_base"]
+time_voting = documentation["gameplay"]["time_voting"]
+time_debate = documentation["gameplay"]["time_debate"]
+time_nomination = documentation["gameplay"]["time_nomination"]
 
 
 class Time(commands.Cog, name = documentation["misc"]["townhall_cog"]):
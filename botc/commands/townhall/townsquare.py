@@ -1,28 +1,24 @@
 """Townsquare command"""
 
 import traceback
-import json
 import discord
-import configparser
 import botutils
 from botc import Townsquare as TownsquareImage
 from library import display_time
 from discord.ext import commands
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("preferences.INI")
+Config = settings.preferences
 
 TOWNSQUARE_COOLDOWN = Config["botc"]["TOWNSQUARE_COOLDOWN"]
 TOWNSQUARE_COOLDOWN = int(TOWNSQUARE_COOLDOWN)
 
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 cooldown = language["errors"]["cmd_cooldown"]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
+documentation = settings.game_text
 
 townsquare_loading = documentation["cmd_warnings"]["townsquare_loading"]
 
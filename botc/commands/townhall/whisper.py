@@ -3,30 +3,26 @@
 import botutils
 import traceback
 import discord
-import json
 import asyncio
-import configparser
 from discord.ext import commands
 from botc import check_if_is_player, check_if_dm, check_if_is_day, PlayerConverter, \
     NotDMChannel, NotAPlayer, NotDay, WhisperConverter, WhisperTooLong, BOTCUtils
 from library import display_time
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("preferences.INI")
+Config = settings.preferences
 
 WHISPER_COOLDOWN = Config["botc"]["WHISPER_COOLDOWN"]
 WHISPER_COOLDOWN = int(WHISPER_COOLDOWN)
 WHISPER_SHOW_TIME = Config["botc"]["WHISPER_SHOW_TIME"]
 WHISPER_SHOW_TIME = int(WHISPER_SHOW_TIME)
 
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 cooldown = language["errors"]["cmd_cooldown"]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
+documentation = settings.game_text
 
 recipient_blocked = documentation["cmd_warnings"]["recipient_blocked"]
 whisper_announcement = documentation["gameplay"]["whisper_announcement"]
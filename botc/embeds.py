@@ -0,0 +1,158 @@
+"""Contains the EmbedTemplate class and the prebuilt embeds of the game: the phase
+transitions, the lobby welcome messages and the character cards
+
+The static parts of an embed (texts, colors, images, author, footer) are formatted once,
+per edition or per character, the first time they are needed. Sending an embed then
+only fills in its dynamic parts (timestamp, death messages, player names...).
+"""
+
+import datetime
+import discord
+import botutils
+from library import fancy
+from .Category import Category
+from .gamemodes.Gamemode import Gamemode
+from botutils.settings import settings
+
+Preferences = settings.preferences
+
+CARD_NIGHT = int(Preferences["colors"]["CARD_NIGHT"], 16)
+CARD_DAWN = int(Preferences["colors"]["CARD_DAWN"], 16)
+CARD_DAY = int(Preferences["colors"]["CARD_DAY"], 16)
+
+CATEGORY_COLORS = {
+    Category.townsfolk: int(Preferences["colors"]["TOWNSFOLK_COLOR"], 16),
+    Category.outsider: int(Preferences["colors"]["OUTSIDER_COLOR"], 16),
+    Category.minion: int(Preferences["colors"]["MINION_COLOR"], 16),
+    Category.demon: int(Preferences["colors"]["DEMON_COLOR"], 16)
+}
+
+strings = settings.game_text
+copyrights_str = strings["misc"]["copyrights"]
+welcome_dm = strings["gameplay"]["welcome_dm"]
+
+EDITION_LORES = {
+    Gamemode.trouble_brewing: strings["gameplay"]["tb_lore"],
+    Gamemode.bad_moon_rising: strings["gameplay"]["bmr_lore"],  # TODO add bmr lore
+    Gamemode.sects_and_violets: strings["gameplay"]["snv_lore"]  # TODO add snv lore
+}
+
+EDITION_TITLES = {
+    Gamemode.trouble_brewing: fancy.bold("Trouble Brewing"),
+    Gamemode.bad_moon_rising: fancy.bold("Bad Moon Rising"),
+    Gamemode.sects_and_violets: fancy.bold("Sects and Violets")
+}
+
+BOTC_TITLE = fancy.bold("Blood on the Clocktower (BoTC)")
+
+
+class EmbedTemplate:
+    """The static part of an embed, kept as the embed's dict. make() creates a new embed
+    object from it, so that the embeds sent can be modified without touching the
+    template.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, embed):
+        self._data = embed.to_dict()
+
+    def make(self, description = None, fields = (), timestamp = False):
+        """Create the embed, with a description and fields [(name, value, inline)] added
+        to the static ones
+        """
+        data = dict(self._data)
+        # The field list is the only part of the dict that the embed object mutates
+        data["fields"] = list(self._data.get("fields", ()))
+        if description is not None:
+            data["description"] = description
+        for name, value, inline in fields:
+            data["fields"].append({"name": name, "value": value, "inline": inline})
+        embed = discord.Embed.from_dict(data)
+        if timestamp:
+            embed.timestamp = datetime.datetime.utcnow()
+        return embed
+
+    def __repr__(self):
+        return f"<EmbedTemplate {self._data.get('title') or self._data.get('description', '')[:30]!r}>"
+
+
+def _phase_template(color, image):
+    embed = discord.Embed(color = color)
+    embed.set_footer(text = copyrights_str)
+    embed.set_image(url = image)
+    return EmbedTemplate(embed)
+
+
+nightfall_template = _phase_template(CARD_NIGHT, strings["images"]["nightfall"])
+nightfall_description = botutils.BotEmoji.moon + " " + strings["gameplay"]["nightfall"]
+dawn_template = _phase_template(CARD_DAWN, strings["images"]["dawn"])
+dawn_description = botutils.BotEmoji.sunrise + " " + strings["gameplay"]["dawn"]
+daybreak_template = _phase_template(CARD_DAY, strings["images"]["daybreak"])
+daybreak_description = botutils.BotEmoji.sun + " " + strings["gameplay"]["daybreak"] + " {}"
+
+
+_welcome_templates = {}  # {Gamemode : EmbedTemplate}
+_role_card_templates = {}  # {Character class : EmbedTemplate}
+_opening_dm_templates = {}  # {Character class : EmbedTemplate}
+
+
+def welcome_template(gamemode):
+    """The lobby welcome embed of an edition (Gamemode enum object)"""
+    if gamemode not in _welcome_templates:
+        from .Character import Character
+        from .gamemodes.troublebrewing._utils import TroubleBrewing
+        from .gamemodes.badmoonrising._utils import BadMoonRising
+        from .gamemodes.sectsandviolets._utils import SectsAndViolets
+        edition_classes = {
+            Gamemode.trouble_brewing: TroubleBrewing,
+            Gamemode.bad_moon_rising: BadMoonRising,
+            Gamemode.sects_and_violets: SectsAndViolets
+        }
+        embed = discord.Embed(description = EDITION_LORES[gamemode])
+        embed.set_thumbnail(url = edition_classes[gamemode]._gm_art_link)
+        embed.set_author(name = f"{EDITION_TITLES[gamemode]} - {BOTC_TITLE}",
+                         icon_url = Character._botc_logo_link)
+        embed.set_footer(text = copyrights_str)
+        _welcome_templates[gamemode] = EmbedTemplate(embed)
+    return _welcome_templates[gamemode]
+
+
+def role_card_template(character):
+    """The role card embed of a character, entirely static"""
+    role_class = type(character)
+    if role_class not in _role_card_templates:
+        gm_art_link = character.gm_art_link if character.gm_art_link else character.botc_logo_link
+        pic_link = character.art_link if character.art_link else character.botc_demon_link
+        wiki_link = ":paperclip: " + (character.wiki_link if character.wiki_link else character.main_wiki_link)
+
+        embed = discord.Embed(title = "{} [{}] {}".format(character.name, character.category.value, character.emoji),
+                              description = "*{}*".format(character.lore),
+                              color = CATEGORY_COLORS[character.category])
+        embed.set_author(name = "Blood on the Clocktower - {}".format(character.gm_of_appearance.value),
+                         icon_url = gm_art_link)
+        embed.set_thumbnail(url = pic_link)
+        embed.add_field(name = ":small_orange_diamond: Description", value = character.description, inline = False)
+        embed.add_field(name = ":small_orange_diamond: Examples", value = character.examples + "\n" + wiki_link,
+                        inline = False)
+        embed.set_footer(text = copyrights_str)
+        _role_card_templates[role_class] = EmbedTemplate(embed)
+    return _role_card_templates[role_class]
+
+
+def opening_dm_template(character):
+    """The opening DM embed of a character (the one the player thinks they are), without
+    the description and the fields, which depend on the player and the game
+    """
+    role_class = type(character)
+    if role_class not in _opening_dm_templates:
+        embed = discord.Embed(title = welcome_dm.format(character.name.upper()),
+                              url = character.wiki_link,
+                              color = CATEGORY_COLORS[character.category])
+        embed.set_author(name = "{} Edition - Blood on the Clocktower (BoTC)".format(character.gm_of_appearance.value),
+                         icon_url = character.gm_art_link)
+        embed.set_thumbnail(url = character.botc_logo_link)
+        embed.set_footer(text = copyrights_str)
+        embed.set_image(url = character._art_link_cropped)
+        _opening_dm_templates[role_class] = EmbedTemplate(embed)
+    return _opening_dm_templates[role_class]
@@ -26,3 +26,8 @@ class IncorrectNumberOfArguments(Exception):
 class AlreadyDead(commands.CommandInvokeError):
     """Error for when an already dead player is killed again"""
     pass
+
+
+class ReplayDivergence(GameError):
+    """The replay of a recorded game does not reproduce the record"""
+    pass
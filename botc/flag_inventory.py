@@ -17,6 +17,8 @@ class Inventory:
     and/or special abilities.
     """
 
+    __slots__ = ("inv",)
+
     def __init__(self, *args):
         """Initialize with a series of flag objects"""
         self.inv = list(args)
@@ -4,15 +4,13 @@ import botutils
 import asyncio
 import math
 import traceback
-import json
 import discord
 import datetime
-import configparser
-from botc import ChoppingBlock
+from botc import Phase, WinEvent, PhaseChangeEvent
 from discord.ext import tasks
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("preferences.INI")
+Config = settings.preferences
 
 # Lengths
 BASE_NIGHT = int(Config["botc"]["BASE_NIGHT"])
@@ -31,42 +29,40 @@ CARD_NO_LYNCH = Config["colors"]["CARD_NO_LYNCH"]
 CARD_NO_LYNCH = int(CARD_NO_LYNCH, 16)
 
 # Config
-Config.read("config.INI")
+Config = settings.config
 
 PREFIX = Config["settings"]["PREFIX"]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
-    approved_seal = documentation["images"]["approved_seal"]
-    denied_seal = documentation["images"]["denied_seal"]
-    ghost_vote_url = documentation["images"]["ghost_vote"]
-    blank_token_url = documentation["images"]["blank_token"]
-    alive_lynch = documentation["images"]["alive_lynch"]
-    alive_no_lynch = documentation["images"]["alive_no_lynch"]
-    dead_lynch = documentation["images"]["dead_lynch"]
-    dead_no_lynch = documentation["images"]["dead_no_lynch"]
-    call_for_vote = documentation["gameplay"]["call_for_vote"]
-    votes_stats = documentation["gameplay"]["votes_stats"]
-    votes_to_exe = documentation["gameplay"]["votes_to_exe"]
-    votes_to_tie = documentation["gameplay"]["votes_to_tie"]
-    votes_current = documentation["gameplay"]["votes_current"]
-    voted_yes = documentation["gameplay"]["voted_yes"]
-    voted_no = documentation["gameplay"]["voted_no"]
-    verdict_chopping = documentation["gameplay"]["verdict_chopping"]
-    verdict_safe = documentation["gameplay"]["verdict_safe"]
-    nomination_intro = documentation["gameplay"]["nomination_intro"]
-    vote_summary = documentation["gameplay"]["vote_summary"]
-    nomination_short = documentation["gameplay"]["nomination_short"]
-    nominations_open = documentation["gameplay"]["nominations_open"]
-    nomination_countdown = documentation["gameplay"]["nomination_countdown"]
-    day_over_soon = documentation["gameplay"]["day_over_soon"]
-    no_execution = documentation["gameplay"]["no_execution"]
-    execution = documentation["gameplay"]["execution"]
-    copyrights_str = documentation["misc"]["copyrights"]
-
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
-    error_str = language["system"]["error"]
+documentation = settings.game_text
+approved_seal = documentation["images"]["approved_seal"]
+denied_seal = documentation["images"]["denied_seal"]
+ghost_vote_url = documentation["images"]["ghost_vote"]
+blank_token_url = documentation["images"]["blank_token"]
+alive_lynch = documentation["images"]["alive_lynch"]
+alive_no_lynch = documentation["images"]["alive_no_lynch"]
+dead_lynch = documentation["images"]["dead_lynch"]
+dead_no_lynch = documentation["images"]["dead_no_lynch"]
+call_for_vote = documentation["gameplay"]["call_for_vote"]
+votes_stats = documentation["gameplay"]["votes_stats"]
+votes_to_exe = documentation["gameplay"]["votes_to_exe"]
+votes_to_tie = documentation["gameplay"]["votes_to_tie"]
+votes_current = documentation["gameplay"]["votes_current"]
+voted_yes = documentation["gameplay"]["voted_yes"]
+voted_no = documentation["gameplay"]["voted_no"]
+verdict_chopping = documentation["gameplay"]["verdict_chopping"]
+verdict_safe = documentation["gameplay"]["verdict_safe"]
+nomination_intro = documentation["gameplay"]["nomination_intro"]
+vote_summary = documentation["gameplay"]["vote_summary"]
+nomination_short = documentation["gameplay"]["nomination_short"]
+nominations_open = documentation["gameplay"]["nominations_open"]
+nomination_countdown = documentation["gameplay"]["nomination_countdown"]
+day_over_soon = documentation["gameplay"]["day_over_soon"]
+no_execution = documentation["gameplay"]["no_execution"]
+execution = documentation["gameplay"]["execution"]
+copyrights_str = documentation["misc"]["copyrights"]
+
+language = settings.bot_text
+error_str = language["system"]["error"]
 
 global botc_game_obj
 
@@ -100,21 +96,13 @@ async def nomination_loop(game, nominator, nominated):
 
     # Counts
     nb_total_players = len(game.sitting_order)
-    nb_alive_players = len([player for player in game.sitting_order if player.is_apparently_alive()])
+    nb_alive_players = game.nb_alive_players
     nb_available_votes = len([player for player in game.sitting_order if player.has_vote()])
-    nb_required_votes = math.ceil(nb_alive_players / 2)
+    nb_required_votes = game.nb_required_votes
     nb_current_votes = 0
 
-    # The starting index is one after the nominated player
-    find_nominated = lambda p: p.user.id == nominated.user.id
-    nominated_idx = next(i for i, v in enumerate(game.sitting_order) if find_nominated(v))
-    start_idx = nominated_idx + 1
-    end_idx = start_idx + len(game.sitting_order)
-
-    for i in range(start_idx, end_idx):
-
-        idx = i % len(game.sitting_order)
-        player = game.sitting_order[idx]
+    # The vote starts one after the nominated player
+    for player in game.seating.clockwise_from(nominated):
  
         if player.has_vote():
 
@@ -204,6 +192,7 @@ async def nomination_loop(game, nominator, nominated):
                     new_embed.set_thumbnail(url = dead_no_lynch)
                 await message.edit(embed = new_embed, delete_after = DELETE_VOTE_AFTER)
                 await message.clear_reactions()
+                await game.cast_vote(player, nominated, False)
                 continue
 
             # The player has voted
@@ -217,7 +206,6 @@ async def nomination_loop(game, nominator, nominated):
                         nominated.game_nametag
                     )
                     nb_current_votes += 1
-                    player.spend_vote()
                     new_embed = discord.Embed(
                         description = msg,
                         color = CARD_LYNCH
@@ -247,6 +235,7 @@ async def nomination_loop(game, nominator, nominated):
                 
                 await message.edit(embed = new_embed, delete_after = DELETE_VOTE_AFTER)
                 await message.clear_reactions()
+                await game.cast_vote(player, nominated, str(reaction.emoji) == approved_emoji)
     
     # ----- The summmary embed message -----
 
@@ -288,32 +277,11 @@ async def nomination_loop(game, nominator, nominated):
     msg += "\n"
     msg += "\n"
 
-    # The vote count has reached execution threshold. 
-    if nb_current_votes >= nb_required_votes:
-        # Someone is on the chopping block
-        if game.chopping_block:
-            # Tie: no one is lynched
-            if nb_current_votes == game.chopping_block.nb_votes:
-                globvars.master_state.game.chopping_block = ChoppingBlock(None, nb_current_votes)
-                msg += verdict_safe.format(nominated.game_nametag)
-                thumbnail_url = denied_seal
-            # This player will replace the person on the chopping block.
-            elif nb_current_votes > game.chopping_block.nb_votes:
-                globvars.master_state.game.chopping_block = ChoppingBlock(nominated, nb_current_votes)
-                msg += verdict_chopping.format(nominated.game_nametag)
-                thumbnail_url = approved_seal
-            # The player on the chopping block remains there.
-            else:
-                msg += verdict_safe.format(nominated.game_nametag)
-                thumbnail_url = denied_seal
-        # No one is on the chopping block currently. 
-        # The player is now on the chopping block awaiting death.
-        else:
-            globvars.master_state.game.chopping_block = ChoppingBlock(nominated, nb_current_votes)
-            msg += verdict_chopping.format(nominated.game_nametag)
-            thumbnail_url = approved_seal
-
-    # The execution did not pass. The player is safe.
+    # The player is now on the chopping block awaiting death
+    if game.tally_votes(nominated, nb_current_votes, nb_required_votes):
+        msg += verdict_chopping.format(nominated.game_nametag)
+        thumbnail_url = approved_seal
+    # The execution did not pass, or tied. The player is safe.
     else:
         msg += verdict_safe.format(nominated.game_nametag)
         thumbnail_url = denied_seal
@@ -457,20 +425,15 @@ async def day_loop(game):
 
             # Time has run out
             if count >= countdown:
-                if game.chopping_block:
-                    player_about_to_die = game.chopping_block.player_about_to_die
-                    if player_about_to_die:
-                        await player_about_to_die.role.true_self.on_being_executed(player_about_to_die)
-                        msg = botutils.BotEmoji.guillotine + " " + execution.format(
-                            game.chopping_block.player_about_to_die.game_nametag, 
-                            game.chopping_block.nb_votes
-                        )
-                    else:
-                        msg = botutils.BotEmoji.clocktower + " " + no_execution
-                    await botutils.send_lobby(msg)
+                executed = await game.execute_chopping_block()
+                if executed:
+                    msg = botutils.BotEmoji.guillotine + " " + execution.format(
+                        executed.game_nametag, 
+                        game.chopping_block.nb_votes
+                    )
                 else:
                     msg = botutils.BotEmoji.clocktower + " " + no_execution
-                    await botutils.send_lobby(msg)
+                await botutils.send_lobby(msg)
                 return
 
         while nomination_loop.is_running():
@@ -492,15 +455,15 @@ async def after_night_1(game):
     """Run after night 1 ends. Handle the night 1 end."""
     # Send n1 end messages
     await game.compute_night_ability_interactions()
-    for player in game.sitting_order:
-        await player.role.ego_self.send_n1_end_message(player.user)
+    # Every ability is resolved: the information messages don't depend on each other
+    await asyncio.gather(*[player.role.ego_self.send_n1_end_message(player.user) for player in game.sitting_order])
 
 
 async def after_night(game):
     """Run after a regular (not the first) night ends. Handle the regular night end."""
     await game.compute_night_ability_interactions()
-    for player in game.sitting_order:
-        await player.role.ego_self.send_regular_night_end_dm(player.user)
+    # Every ability is resolved: the information messages don't depend on each other
+    await asyncio.gather(*[player.role.ego_self.send_regular_night_end_dm(player.user) for player in game.sitting_order])
     
 
 async def after_dawn(game):
@@ -541,28 +504,22 @@ async def master_game_loop(game_obj):
     """
     global botc_game_obj
     botc_game_obj = game_obj
+    # A game resumed after a restart starts from the phase following its snapshot
     while True:
+        next_phase = game_obj._chrono.next_phase
         # Night
-        await night_loop(game_obj)
-        # Wear off status
-        for player in game_obj.sitting_order:
-            for status in player.status_effects:
-                status.wear_off()
+        if next_phase == Phase.night:
+            await night_loop(game_obj)
         # Dawn
-        await dawn_loop(game_obj)
-        # Wear off status
-        for player in game_obj.sitting_order:
-            for status in player.status_effects:
-                status.wear_off()
+        elif next_phase == Phase.dawn:
+            await dawn_loop(game_obj)
         # Day
-        await day_loop(game_obj)
-        # Check the win con after day
-        for player in game_obj.sitting_order:
-            player.role.true_self.check_wincon_after_day(player)
-        # Wear off status
-        for player in game_obj.sitting_order:
-            for status in player.status_effects:
-                status.wear_off()
+        else:
+            await day_loop(game_obj)
+            # Check the win con after day
+            await game_obj.check_winning_conditions(WinEvent.day_end)
+        # The status effects wear off and the game is saved at the phase boundary
+        await game_obj.events.publish(PhaseChangeEvent(game_obj._chrono.phase_id, game_obj._chrono.next_phase))
     
 
 @master_game_loop.after_loop
@@ -36,14 +36,9 @@ class Assassin(Minion, BadMoonRising, Character):
         self._role_enum = BMRRole.assassin
         self._emoji = emojis["badmoonrising"]["assassin"]
     
-    def has_finished_night_action(self, player):
-        """Return True if assassin has submitted the assassinate action"""
-        
-        if player.is_alive():
-            # First night, assassin does not act
-            if globvars.master_state.game._chrono.is_night_1():
-                return True
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.assassinate
-        return True
+    def expected_night_action(self, player):
+        """The assassin must submit the assassinate action every night, except the first one"""
+
+        if player.is_alive() and not globvars.master_state.game._chrono.is_night_1():
+            return ActionTypes.assassinate
+        return None
@@ -1,18 +1,17 @@
 """Contains the Po Character class"""
 
-import random
 import json
 from botc import Character, Demon, BOTCUtils, Townsfolk, Outsider
 from ._utils import BadMoonRising, BMRRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/badmoonrising/character_text.json') as json_file: 
     character_text = json.load(json_file)[BMRRole.po.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    demon_bluff_str = strings["gameplay"]["demonbluffs"]
+strings = settings.game_text
+demon_bluff_str = strings["gameplay"]["demonbluffs"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
@@ -76,8 +75,8 @@ class Po(Demon, BadMoonRising, Character):
                                         if character.name not in taken_townsfolks]
         possible_outsider_bluffs = [character for character in all_outsiders 
                                     if character.name not in taken_outsiders]
-        random.shuffle(possible_townsfolk_bluffs)
-        random.shuffle(possible_outsider_bluffs)
+        globvars.master_state.game.rng.setup.shuffle(possible_townsfolk_bluffs)
+        globvars.master_state.game.rng.setup.shuffle(possible_outsider_bluffs)
 
         # For the first two bluffs, we want a townsfolk, definitely
         bluff_1 = possible_townsfolk_bluffs.pop()
@@ -86,7 +85,7 @@ class Po(Demon, BadMoonRising, Character):
         # For the third bluff, if the outsider list is not empty, we will take an outsider. Otherwise
         # it's 40% chance outsider, 60% chance townsfolk
         if possible_outsider_bluffs:
-            town_or_out = random.choices(
+            town_or_out = globvars.master_state.game.rng.setup.choices(
                 ["t", "o"],
                 weights=[0.6, 0.4]
             )
@@ -2,21 +2,19 @@
 
 import discord
 import json
-import random
 import botutils
 from botc import Character, Demon, Townsfolk, Outsider, BOTCUtils, ActionTypes, \
     GameLogic, Action, StatusList, RecurringAction
 from ._utils import BadMoonRising, BMRRole
-import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/badmoonrising/character_text.json') as json_file: 
     character_text = json.load(json_file)[BMRRole.zombuul.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    demon_bluff_str = strings["gameplay"]["demonbluffs"]
-    action_assign = strings["gameplay"]["action_assign"]
+strings = settings.game_text
+demon_bluff_str = strings["gameplay"]["demonbluffs"]
+action_assign = strings["gameplay"]["action_assign"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
@@ -103,8 +101,8 @@ class Zombuul(Demon, BadMoonRising, Character, RecurringAction):
                                         if character.name not in taken_townsfolks]
         possible_outsider_bluffs = [character for character in all_outsiders 
                                     if character.name not in taken_outsiders]
-        random.shuffle(possible_townsfolk_bluffs)
-        random.shuffle(possible_outsider_bluffs)
+        globvars.master_state.game.rng.setup.shuffle(possible_townsfolk_bluffs)
+        globvars.master_state.game.rng.setup.shuffle(possible_outsider_bluffs)
 
         # For the first two bluffs, we want a townsfolk, definitely
         bluff_1 = possible_townsfolk_bluffs.pop()
@@ -113,7 +111,7 @@ class Zombuul(Demon, BadMoonRising, Character, RecurringAction):
         # For the third bluff, if the outsider list is not empty, we will take an outsider. Otherwise
         # it's 40% chance outsider, 60% chance townsfolk
         if possible_outsider_bluffs:
-            town_or_out = random.choices(
+            town_or_out = globvars.master_state.game.rng.setup.choices(
                 ["t", "o"],
                 weights=[0.6, 0.4]
             )
@@ -127,16 +125,12 @@ class Zombuul(Demon, BadMoonRising, Character, RecurringAction):
         globvars.logging.info(f">>> Zombull: Received three demon bluffs {bluff_1}, {bluff_2} and {bluff_3}.")
         return (bluff_1, bluff_2, bluff_3)
     
-    def has_finished_night_action(self, player):
-        """Return True if imp has submitted the kill action"""
+    def expected_night_action(self, player):
+        """The zombuul must submit the kill action every night, except the first one"""
 
-        if player.is_alive():
-            if globvars.master_state.game._chrono.is_night_1():
-                return True
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.kill
-        return True
+        if player.is_alive() and not globvars.master_state.game._chrono.is_night_1():
+            return ActionTypes.kill
+        return None
     
     @GameLogic.except_first_night
     @GameLogic.requires_one_target
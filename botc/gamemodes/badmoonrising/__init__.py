@@ -1,28 +1,43 @@
 """Blood on the Clocktower (BoTC) - Bad Moon Rising Edition Characters"""
 
-from .Assassin import Assassin
-from .Chambermaid import Chambermaid
-from .Courtier import Courtier
-from .DevilsAdvocate import DevilsAdvocate
-from .Exorcist import Exorcist
-from .Fool import Fool
-from .Gambler import Gambler
-from .Godfather import Godfather
-from .Goon import Goon
-from .Gossip import Gossip
-from .Grandmother import Grandmother
-from .Innkeeper import Innkeeper
-from .Lunatic import Lunatic
-from .Mastermind import Mastermind
-from .Minstrel import Minstrel
-from .Moonchild import Moonchild
-from .Pacifist import Pacifist
-from .Po import Po
-from .Professor import Professor
-from .Pukka import Pukka
-from .Sailor import Sailor
-from .Shabaloth import Shabaloth
-from .TeaLady import TeaLady
-from .Tinker import Tinker
-from .Zombuul import Zombuul
+import importlib
 
+# Each character module reads its own text files at import, so they are only imported
+# when the character class is first accessed (ex. from botc.gamemodes.badmoonrising import ...)
+__all__ = [
+    "Assassin",
+    "Chambermaid",
+    "Courtier",
+    "DevilsAdvocate",
+    "Exorcist",
+    "Fool",
+    "Gambler",
+    "Godfather",
+    "Goon",
+    "Gossip",
+    "Grandmother",
+    "Innkeeper",
+    "Lunatic",
+    "Mastermind",
+    "Minstrel",
+    "Moonchild",
+    "Pacifist",
+    "Po",
+    "Professor",
+    "Pukka",
+    "Sailor",
+    "Shabaloth",
+    "TeaLady",
+    "Tinker",
+    "Zombuul"
+]
+
+
+def __getattr__(name):
+    """Import the character module on first access and cache the class on the package"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    role_class = getattr(importlib.import_module(f".{name}", __name__), name)
+    # The import system binds the submodule on the package; replace it with the class
+    globals()[name] = role_class
+    return role_class
@@ -37,8 +37,6 @@ class BMRRole(enum.Enum):
 class BadMoonRising:
     """Parent class for all Bad Moon Rising edition roles"""
 
-    def __init__(self):
-
-        self._gm_of_appearance = Gamemode.bad_moon_rising
-        self._gm_art_link = "https://bloodontheclocktower.com/wiki/images/d/d9/BMR_Logo.png"
+    _gm_of_appearance = Gamemode.bad_moon_rising
+    _gm_art_link = "https://bloodontheclocktower.com/wiki/images/d/d9/BMR_Logo.png"
         
\ No newline at end of file
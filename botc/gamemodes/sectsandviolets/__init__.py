@@ -1,27 +1,43 @@
 """Blood on the Clocktower (BoTC) - Sects & Violets Edition Characters"""
 
-from .Artist import Artist
-from .Barber import Barber
-from .Cerenovus import Cerenovus
-from .Clockmaker import Clockmaker
-from .Dreamer import Dreamer
-from .EvilTwin import EvilTwin
-from .FangGu import FangGu
-from .Flowergirl import Flowergirl
-from .Juggler import Juggler
-from .Klutz import Klutz
-from .Mathematician import Mathematician
-from .Mutant import Mutant
-from .NoDashii import NoDashii
-from .Oracle import Oracle
-from .Philosopher import Philosopher
-from .PitHag import PitHag
-from .Sage import Sage
-from .Savant import Savant
-from .Seamstress import Seamstress
-from .Sweetheart import Sweetheart
-from .SnakeCharmer import SnakeCharmer
-from .TownCrier import TownCrier
-from .Vigormortis import Vigormortis
-from .Vortox import Vortox
-from .Witch import Witch
+import importlib
+
+# Each character module reads its own text files at import, so they are only imported
+# when the character class is first accessed (ex. from botc.gamemodes.sectsandviolets import ...)
+__all__ = [
+    "Artist",
+    "Barber",
+    "Cerenovus",
+    "Clockmaker",
+    "Dreamer",
+    "EvilTwin",
+    "FangGu",
+    "Flowergirl",
+    "Juggler",
+    "Klutz",
+    "Mathematician",
+    "Mutant",
+    "NoDashii",
+    "Oracle",
+    "Philosopher",
+    "PitHag",
+    "Sage",
+    "Savant",
+    "Seamstress",
+    "Sweetheart",
+    "SnakeCharmer",
+    "TownCrier",
+    "Vigormortis",
+    "Vortox",
+    "Witch"
+]
+
+
+def __getattr__(name):
+    """Import the character module on first access and cache the class on the package"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    role_class = getattr(importlib.import_module(f".{name}", __name__), name)
+    # The import system binds the submodule on the package; replace it with the class
+    globals()[name] = role_class
+    return role_class
@@ -37,8 +37,6 @@ class SnVRole(enum.Enum):
 class SectsAndViolets:
     """Parent class for all Sects & Violets edition roles"""
 
-    def __init__(self):
-
-        self._gm_of_appearance = Gamemode.sects_and_violets
-        self._gm_art_link = "https://bloodontheclocktower.com/wiki/images/8/8f/SV_Logo.png"
-        self._gm_main_page = "https://bloodontheclocktower.com/wiki/Sects_%26_Violets"
+    _gm_of_appearance = Gamemode.sects_and_violets
+    _gm_art_link = "https://bloodontheclocktower.com/wiki/images/8/8f/SV_Logo.png"
+    _gm_main_page = "https://bloodontheclocktower.com/wiki/Sects_%26_Violets"
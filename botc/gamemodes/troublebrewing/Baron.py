@@ -1,7 +1,6 @@
 """Contains the Baron Character class"""
 
 import json
-import random
 import discord
 from botc import BOTCUtils, Minion, Character, NonRecurringAction, Townsfolk
 from botc.Outsider import Outsider
@@ -79,7 +78,7 @@ class Baron(Minion, TroubleBrewing, Character, NonRecurringAction):
     def exec_init_setup(self, townsfolk_obj_list, outsider_obj_list, minion_obj_list, demon_obj_list):
         """Add two outsiders to the setup, remove two townsfolks from the setup"""
 
-        random.shuffle(townsfolk_obj_list)
+        globvars.master_state.game.rng.setup.shuffle(townsfolk_obj_list)
 
         # Remove two townsfolks
         townsfolk_obj_list.pop()
@@ -90,10 +89,10 @@ class Baron(Minion, TroubleBrewing, Character, NonRecurringAction):
             if townsfolk_obj_list[0].name == TBRole.washerwoman.value:
                 tb_townsfolk_all = BOTCUtils.get_role_list(TroubleBrewing, Townsfolk)
                 all_not_washer = [character for character in tb_townsfolk_all if character.name != TBRole.washerwoman.value]
-                townsfolk_obj_list = [random.choice(all_not_washer)]
+                townsfolk_obj_list = [globvars.master_state.game.rng.setup.choice(all_not_washer)]
 
         tb_outsider_all = BOTCUtils.get_role_list(TroubleBrewing, Outsider)
-        random.shuffle(tb_outsider_all)
+        globvars.master_state.game.rng.setup.shuffle(tb_outsider_all)
 
         count = 0
 
@@ -3,25 +3,23 @@
 import json 
 import botutils
 import discord
-import configparser
 from botc.BOTCUtils import GameLogic
 from botc import Outsider, Character, Action, ActionTypes, BOTCUtils, RecurringAction, \
     ButlerService
 from ._utils import TroubleBrewing, TBRole
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.butler.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
-    action_assign = documentation["gameplay"]["action_assign"]
+documentation = settings.game_text
+action_assign = documentation["gameplay"]["action_assign"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -94,14 +92,12 @@ class Butler(Outsider, TroubleBrewing, Character, RecurringAction):
         embed_obj.add_field(name = botutils.BotEmoji.butterfly + " **「 Your Action 」**", value = msg, inline = False)
         return embed_obj
     
-    def has_finished_night_action(self, player):
-        """Return True if butler has submitted the serve action"""
-        
+    def expected_night_action(self, player):
+        """The butler must submit the serve action every night"""
+
         if player.is_alive():
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.serve
-        return True
+            return ActionTypes.serve
+        return None
     
     @GameLogic.no_self_targetting
     @GameLogic.requires_one_target
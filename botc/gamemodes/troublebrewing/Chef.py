@@ -3,26 +3,23 @@
 import json 
 import discord
 import datetime
-import random
-import configparser
 from botc import Townsfolk, Character, BOTCUtils, NonRecurringAction
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.chef.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    chef_init = strings["gameplay"]["chef_init"]
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+chef_init = strings["gameplay"]["chef_init"]
+copyrights_str = strings["misc"]["copyrights"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -88,11 +85,10 @@ class Chef(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
     def __create_droisoned_info(self):
         """Create drunk/poisoned information for the n1 chef info"""
 
-        import globvars
         total_nb_evils = len(globvars.master_state.game.setup.minions) + \
             len(globvars.master_state.game.setup.demon)
         possibilities = range(total_nb_evils)
-        ret = random.choice(possibilities)
+        ret = globvars.master_state.game.rng.info.choice(possibilities)
         log_msg = f">>> Chef: [droisoned] {ret} pairs of evils"
         globvars.logging.info(log_msg)
         return ret
@@ -138,25 +134,12 @@ class Chef(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
     def get_nb_pairs_of_evils(self):
         """Get the number of pairs of evils sitting together."""
 
-        import globvars
+        # We use what their social self is for this phase
+        globvars.master_state.game.register_social_selves()
 
-        # We initialize what their social self is going to be for this round of inspection
-        for player in globvars.master_state.game.sitting_order:
-            player.role.set_new_social_self(player)
-
-        # Make a list of all pairs in the sitting order
-        total = len(globvars.master_state.game.sitting_order)
-        all_pairs = [
-            (
-                globvars.master_state.game.sitting_order[i], 
-                globvars.master_state.game.sitting_order[(i+1)%total]
-            ) 
-            for i in range(total)
-        ]
-
-        # Count the evil pairs
+        # Count the evil pairs amongst all pairs in the sitting order
         evil_pair_count = 0
-        for pair in all_pairs:
+        for pair in globvars.master_state.game.seating.adjacent_pairs():
             if pair[0].role.social_self.is_evil() and pair[1].role.social_self.is_evil():
                 evil_pair_count += 1
         
@@ -1,8 +1,7 @@
 """Contains the Drunk Character class"""
 
 import json 
-import random
-from botc import Outsider, Character, Townsfolk, NonRecurringAction
+from botc import Outsider, Character, Townsfolk, NonRecurringAction, BOTCUtils
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
@@ -74,12 +73,13 @@ class Drunk(Outsider, TroubleBrewing, Character, NonRecurringAction):
     
     def exec_init_role(self, setup):
         """Randomly choose a townsfolk that is not in play. (persistent throughout the game)"""
-        possibilities = [role_class() for role_class in TroubleBrewing.__subclasses__() if issubclass(role_class, Townsfolk)]
+        possibilities = BOTCUtils.get_role_list(TroubleBrewing, Townsfolk)
         taken = [player.role.name for player in setup.townsfolks]
-        random.shuffle(possibilities)
+        globvars.master_state.game.rng.setup.shuffle(possibilities)
         for p in possibilities:
             if p.name not in taken:
-                self._ego_role = p
+                # The ego_self acts for the player, it can't be the shared character object
+                self._ego_role = type(p)()
                 break
         globvars.logging.info(f">>> Drunk [exec_init_role] Initialized ego_self as {self._ego_role}.")
         
\ No newline at end of file
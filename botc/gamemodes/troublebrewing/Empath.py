@@ -3,25 +3,22 @@
 import json 
 import discord
 import datetime
-import random
-import configparser
 from botc import Townsfolk, Character, BOTCUtils, NonRecurringAction
 from ._utils import TroubleBrewing, TBRole
 import botutils
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.empath.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    empath_nightly = strings["gameplay"]["empath_nightly"]
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+empath_nightly = strings["gameplay"]["empath_nightly"]
+copyrights_str = strings["misc"]["copyrights"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -90,7 +87,7 @@ class Empath(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         """Create drunk/poisoned information for the empath info"""
 
         import globvars
-        nb_evils = random.choice(range(3))
+        nb_evils = globvars.master_state.game.rng.info.choice(range(3))
         log_msg = f">>> Empath: [droisoned] {nb_evils} alive evil neighbours"
         globvars.logging.info(log_msg)
         return nb_evils
@@ -143,27 +140,15 @@ class Empath(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
 
         import globvars
 
-        # Find all alive players
-        alive_players = [player for player in globvars.master_state.game.sitting_order 
-                         if player.is_apparently_alive()]
-        
-        # Find where the empath is seated
-        seat_idx = -1
-        for i, player in enumerate(alive_players):
-            if player.user.id == recipient.id:
-                seat_idx = i
-                break
-        assert seat_idx >= 0, "Something went wrong in Empath [send_first_night_instruction]"
-
-        # Find the empath's neighbours
-        nb_alives = len(alive_players)
-        prev_neighbour = alive_players[(seat_idx - 1) % nb_alives]
-        next_neighbour = alive_players[(seat_idx + 1) % nb_alives]
+        # Find the empath's alive neighbours
+        seating = globvars.master_state.game.seating
+        empath_player = seating.get_player(recipient.id)
+        assert empath_player is not None, "Something went wrong in Empath [send_first_night_instruction]"
+        prev_neighbour, next_neighbour = seating.alive_neighbours(empath_player)
 
         # Find the number of alive evils
         nb_evils = 0
-        prev_neighbour.role.set_new_social_self(prev_neighbour)
-        next_neighbour.role.set_new_social_self(next_neighbour)
+        globvars.master_state.game.register_social_selves()
         if prev_neighbour.role.social_self.is_evil():
             nb_evils += 1
         if next_neighbour.role.social_self.is_evil():
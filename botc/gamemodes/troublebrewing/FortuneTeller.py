@@ -1,34 +1,31 @@
 """Contains the Fortune Teller Character class"""
 
 import json
-import random
 import discord 
 import datetime
-import configparser
 from botc import Action, ActionTypes, Townsfolk, Character, Storyteller, RedHerring, \
     RecurringAction, Category, StatusList
 from botc.BOTCUtils import GameLogic
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.fortuneteller.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    fortune_teller_nightly = strings["gameplay"]["fortune_teller_nightly"]
-    copyrights_str = strings["misc"]["copyrights"]
-    yes = strings["gameplay"]["yes"]
-    no = strings["gameplay"]["no"]
-    good_link = strings["images"]["good"]
-    evil_link = strings["images"]["evil"]
+strings = settings.game_text
+fortune_teller_nightly = strings["gameplay"]["fortune_teller_nightly"]
+copyrights_str = strings["misc"]["copyrights"]
+yes = strings["gameplay"]["yes"]
+no = strings["gameplay"]["no"]
+good_link = strings["images"]["good"]
+evil_link = strings["images"]["evil"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -105,18 +102,16 @@ class FortuneTeller(Townsfolk, TroubleBrewing, Character, RecurringAction):
         """Assign one of the townsfolks or outsiders as a red herring"""
         
         possibilities = setup.townsfolks + setup.outsiders
-        chosen = random.choice(possibilities)
+        chosen = globvars.master_state.game.rng.setup.choice(possibilities)
         chosen.add_status_effect(RedHerring(Storyteller(), chosen))
         globvars.logging.info(f">>> Fortune Teller [exec_init_role] Set red herring to {str(chosen)}")
     
-    def has_finished_night_action(self, player):
-        """Return True if fortune teller has submitted the read action"""
+    def expected_night_action(self, player):
+        """The fortune teller must submit the read action every night"""
 
         if player.is_alive():
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.read
-        return True
+            return ActionTypes.read
+        return None
 
     @GameLogic.requires_two_targets
     @GameLogic.requires_different_targets
@@ -144,13 +139,14 @@ class FortuneTeller(Townsfolk, TroubleBrewing, Character, RecurringAction):
         if fortune_teller_player.is_alive():
             # Correct info
             if not fortune_teller_player.is_droisoned():
+                globvars.master_state.game.register_social_selves()
                 response = read_player_1.role.social_self.category == Category.demon or \
                            read_player_2.role.social_self.category == Category.demon or \
                            read_player_1.has_status_effect(StatusList.red_herring) or \
                            read_player_2.has_status_effect(StatusList.red_herring)
             # Droisoned info
             else:
-                response = random.choice((True, False))
+                response = globvars.master_state.game.rng.info.choice((True, False))
             
             reply = yes if response else no
             link = evil_link if response else good_link
@@ -2,38 +2,32 @@
 
 import json
 import discord
-import random
 import datetime
-import configparser
 import botutils
 from botc import Action, ActionTypes, Demon, Townsfolk, Outsider, Character, \
     RecurringAction, StatusList, AlreadyDead
-from botc.gamemodes.troublebrewing.Soldier import Soldier
 from botc.BOTCUtils import GameLogic, BOTCUtils
 from ._utils import TroubleBrewing, TBRole
 import globvars
+from botutils.settings import settings
 
-Preferences = configparser.ConfigParser()
-
-Preferences.read("preferences.INI")
+Preferences = settings.preferences
 
 DEMON_COLOR = Preferences["colors"]["DEMON_COLOR"]
 DEMON_COLOR = int(DEMON_COLOR, 16)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.imp.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    demon_bluff_str = strings["gameplay"]["demonbluffs"]
-    action_assign = strings["gameplay"]["action_assign"]
-    role_change = strings["gameplay"]["role_change"]
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+demon_bluff_str = strings["gameplay"]["demonbluffs"]
+action_assign = strings["gameplay"]["action_assign"]
+role_change = strings["gameplay"]["role_change"]
+copyrights_str = strings["misc"]["copyrights"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
@@ -120,8 +114,8 @@ class Imp(Demon, TroubleBrewing, Character, RecurringAction):
                                         if character.name not in taken_townsfolks]
         possible_outsider_bluffs = [character for character in all_outsiders 
                                     if character.name not in taken_outsiders]
-        random.shuffle(possible_townsfolk_bluffs)
-        random.shuffle(possible_outsider_bluffs)
+        globvars.master_state.game.rng.setup.shuffle(possible_townsfolk_bluffs)
+        globvars.master_state.game.rng.setup.shuffle(possible_outsider_bluffs)
 
         # For the first two bluffs, we want a townsfolk, definitely
         bluff_1 = possible_townsfolk_bluffs.pop()
@@ -130,7 +124,7 @@ class Imp(Demon, TroubleBrewing, Character, RecurringAction):
         # For the third bluff, if the outsider list is not empty, we will take an outsider. Otherwise
         # it's 40% chance outsider, 60% chance townsfolk
         if possible_outsider_bluffs:
-            town_or_out = random.choices(
+            town_or_out = globvars.master_state.game.rng.setup.choices(
                 ["t", "o"],
                 weights=[0.6, 0.4]
             )
@@ -144,16 +138,12 @@ class Imp(Demon, TroubleBrewing, Character, RecurringAction):
         globvars.logging.info(f">>> Imp: Received three demon bluffs {bluff_1}, {bluff_2} and {bluff_3}.")
         return (bluff_1, bluff_2, bluff_3)
     
-    def has_finished_night_action(self, player):
-        """Return True if imp has submitted the kill action"""
+    def expected_night_action(self, player):
+        """The imp must submit the kill action every night, except the first one"""
 
-        if player.is_alive():
-            if globvars.master_state.game._chrono.is_night_1():
-                return True
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.kill
-        return True
+        if player.is_alive() and not globvars.master_state.game._chrono.is_night_1():
+            return ActionTypes.kill
+        return None
     
     @GameLogic.except_first_night
     @GameLogic.requires_one_target
@@ -192,24 +182,20 @@ class Imp(Demon, TroubleBrewing, Character, RecurringAction):
         """Starpassing ability works when the demon is killed by himself at night"""
         
         # If imp starpasses to poisoner, the poisoned player should be no longer poisoned
-        for player in globvars.master_state.game.sitting_order:
-            for status in player.status_effects:
-                if status.effect == StatusList.poison:
-                    status.manually_disable()
+        globvars.master_state.game.status_store.disable_effect(StatusList.poison)
 
         # If 5 or more players alive (not counting travelers), scarlet woman has priority 
         # over the promotion to demonhood
         if globvars.master_state.game.nb_alive_players >= 5:
 
-            from botc.gamemodes.troublebrewing import ScarletWoman
             # This list of scarletwomen could contain dead players
-            scarletwomen = BOTCUtils.get_players_from_role_name(ScarletWoman()._role_enum)
+            scarletwomen = BOTCUtils.get_players_from_role_name(TBRole.scarletwoman)
 
             if scarletwomen:
                 # We only want the alive, and not poisoned scarlet women
                 alive_scarletwomen = [player for player in scarletwomen if player.is_alive() and not player.is_droisoned()]
                 if alive_scarletwomen:
-                    promoted = random.choice(alive_scarletwomen)
+                    promoted = globvars.master_state.game.rng.storyteller.choice(alive_scarletwomen)
                     promoted._old_role_obj = promoted._role_obj
                     await promoted.exec_change_role(Imp())
 
@@ -231,7 +217,7 @@ class Imp(Demon, TroubleBrewing, Character, RecurringAction):
             # We only want the alive players.
             alive_minions = [player for player in minions if player.is_alive()]
             if alive_minions:
-                promoted = random.choice(alive_minions)
+                promoted = globvars.master_state.game.rng.storyteller.choice(alive_minions)
                 promoted._old_role_obj = promoted._role_obj
                 await promoted.exec_change_role(Imp())
 
@@ -264,15 +250,14 @@ class Imp(Demon, TroubleBrewing, Character, RecurringAction):
             # promoted to demonhood
             if globvars.master_state.game.nb_alive_players >= 5:
 
-                from botc.gamemodes.troublebrewing import ScarletWoman
                 # This list of scarletwomen could contain dead players
-                scarletwomen = BOTCUtils.get_players_from_role_name(ScarletWoman()._role_enum)
+                scarletwomen = BOTCUtils.get_players_from_role_name(TBRole.scarletwoman)
 
                 if scarletwomen:
                     # We only want the alive, and not poisoned scarlet women
                     alive_scarletwomen = [player for player in scarletwomen if player.is_alive() and not player.is_droisoned()]
                     if alive_scarletwomen:
-                        promoted = random.choice(alive_scarletwomen)
+                        promoted = globvars.master_state.game.rng.storyteller.choice(alive_scarletwomen)
                         promoted._old_role_obj = promoted._role_obj
                         await promoted.exec_change_role(Imp())
 
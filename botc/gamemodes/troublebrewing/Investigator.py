@@ -1,29 +1,26 @@
 """Contains the Investigator Character class"""
 
 import json 
-import random
 import datetime
 import discord
-import configparser
 from botc import Townsfolk, Character, Category, NonRecurringAction, BOTCUtils, \
     Minion
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.investigator.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    investigator_init = strings["gameplay"]["investigator_init"]
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+investigator_init = strings["gameplay"]["investigator_init"]
+copyrights_str = strings["misc"]["copyrights"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -138,12 +135,12 @@ class Investigator(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
 
         # Choosing minion type
         tb_minion_all = BOTCUtils.get_role_list(TroubleBrewing, Minion)
-        registered_minion_type = random.choice(tb_minion_all)
+        registered_minion_type = globvars.master_state.game.rng.info.choice(tb_minion_all)
 
         # Choosing candidates
         candidates = [player for player in globvars.master_state.game.sitting_order 
                       if player.user.id != investigator_player.user.id]
-        random.shuffle(candidates)
+        globvars.master_state.game.rng.info.shuffle(candidates)
         candidate_1 = candidates.pop()
         candidate_2 = candidates.pop()
 
@@ -153,8 +150,7 @@ class Investigator(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         """Send two possible minions"""
 
         # First set the social self
-        for player in globvars.master_state.game.sitting_order:
-            player.role.set_new_social_self(player)
+        globvars.master_state.game.register_social_selves()
 
         # Choose the player that registers as minion
         minions = []
@@ -165,7 +161,7 @@ class Investigator(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
 
         # If we found a minion
         if minions:
-            random.shuffle(minions)
+            globvars.master_state.game.rng.info.shuffle(minions)
             minion = minions.pop()
             registered_minion_type = minion.role.social_self
 
@@ -178,11 +174,11 @@ class Investigator(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         # Choose the other player
         other_possibilities = [player for player in globvars.master_state.game.sitting_order 
                                if player.user.id != minion.user.id and player.user.id != investigator_player.user.id]
-        other = random.choice(other_possibilities)
+        other = globvars.master_state.game.rng.info.choice(other_possibilities)
         
         # Construct the message
         two_player_list = [minion, other]
-        random.shuffle(two_player_list)
+        globvars.master_state.game.rng.info.shuffle(two_player_list)
         two_player_list.append(registered_minion_type)
 
         globvars.logging.info(f">>> Investigator: Sent {minion} and {other} as {registered_minion_type}")
@@ -2,30 +2,27 @@
 
 import json
 import discord
-import random
 import datetime
-import configparser
 from botc import Townsfolk, Character, Category, NonRecurringAction, BOTCUtils, \
     Outsider
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.librarian.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    librarian_init = strings["gameplay"]["librarian_init"]
-    librarian_init_zero = strings["gameplay"]["librarian_init_zero"]
-    copyrights_str = strings["misc"]["copyrights"]
-    blank_token = strings["images"]["blank_token"]
+strings = settings.game_text
+librarian_init = strings["gameplay"]["librarian_init"]
+librarian_init_zero = strings["gameplay"]["librarian_init_zero"]
+copyrights_str = strings["misc"]["copyrights"]
+blank_token = strings["images"]["blank_token"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -159,12 +156,12 @@ class Librarian(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
 
         # Choosing outsider type
         tb_outsider_all = BOTCUtils.get_role_list(TroubleBrewing, Outsider)
-        registered_outsider_type = random.choice(tb_outsider_all)
+        registered_outsider_type = globvars.master_state.game.rng.info.choice(tb_outsider_all)
 
         # Choosing candidates
         candidates = [player for player in globvars.master_state.game.sitting_order 
                       if player.user.id != librarian_player.user.id]
-        random.shuffle(candidates)
+        globvars.master_state.game.rng.info.shuffle(candidates)
         candidate_1 = candidates.pop()
         candidate_2 = candidates.pop()
 
@@ -174,8 +171,7 @@ class Librarian(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         """Send two possible outsiders"""
 
         # First set the social self
-        for player in globvars.master_state.game.sitting_order:
-            player.role.set_new_social_self(player)
+        globvars.master_state.game.register_social_selves()
 
         # Find all outsider players
         outsiders = []
@@ -185,17 +181,17 @@ class Librarian(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
 
         # We found at least one outsider, choose one randomly
         if outsiders:
-            random.shuffle(outsiders)
+            globvars.master_state.game.rng.info.shuffle(outsiders)
             outsider = outsiders.pop()
             registered_outsider_type = outsider.role.social_self
 
             # Choose the other player
             other_possibilities = [player for player in globvars.master_state.game.sitting_order 
                                 if player.user.id != outsider.user.id and player.user.id != recipient.id]
-            other = random.choice(other_possibilities)
+            other = globvars.master_state.game.rng.info.choice(other_possibilities)
             
             two_player_list = [outsider, other]
-            random.shuffle(two_player_list)
+            globvars.master_state.game.rng.info.shuffle(two_player_list)
             two_player_list.append(registered_outsider_type)
 
             globvars.logging.info(f">>> Librarian: Sent {outsider} and {other} as {registered_outsider_type}")
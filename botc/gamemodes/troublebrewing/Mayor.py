@@ -1,8 +1,8 @@
 """Contains the Mayor Character class"""
 
 import json 
-import random
-from botc import BOTCUtils, Townsfolk, Character, NonRecurringAction, Category, Team, StatusList
+from botc import BOTCUtils, Townsfolk, Character, NonRecurringAction, Category, Team, StatusList, \
+    WinEvent
 from ._utils import TroubleBrewing, TBRole
 import botutils
 
@@ -85,7 +85,7 @@ class Mayor(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
             # not droisoned, unless all surviving players cannot die from demon.
             if not killed_player.is_droisoned():
 
-                mayor_bounce = random.choice([True, False])
+                mayor_bounce = globvars.master_state.game.rng.storyteller.choice([True, False])
 
                 # Mayor bounce is happening
                 if mayor_bounce:
@@ -105,7 +105,7 @@ class Mayor(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
                                 player.user.id != killed_player.user.id]
 
                     if possibilities:
-                        deflected_to = random.choice(possibilities)
+                        deflected_to = globvars.master_state.game.rng.storyteller.choice(possibilities)
                         if deflected_to.has_status_effect(StatusList.safety_from_demon):
                             return
                         await deflected_to.role.true_self.on_being_demon_killed(deflected_to)
@@ -127,16 +127,16 @@ class Mayor(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
                 await killed_player.exec_real_death()
                 globvars.master_state.game.night_deaths.append(killed_player)
     
-    def check_wincon_after_day(self, mayor_player):
+    def register_win_rules(self, mayor_player, win_tracker):
         """The good team wins if no one has been executed today, 
         and if the mayor is alive and healthy
         """
         import globvars
-        from botc.gameloops import master_game_loop
-
-        if mayor_player.is_alive() and not mayor_player.is_droisoned():
-            if globvars.master_state.game.nb_alive_players == 3:
-                if not globvars.master_state.game.today_executed_player:
-                    globvars.master_state.game.winners = Team.good
-                    if master_game_loop.is_running():
-                        master_game_loop.cancel()
+
+        def mayor_day_end(_):
+            if mayor_player.is_alive() and not mayor_player.is_droisoned():
+                if globvars.master_state.game.nb_alive_players == 3:
+                    if not globvars.master_state.game.today_executed_player:
+                        return Team.good
+
+        win_tracker.add_rule(WinEvent.day_end, mayor_player, mayor_day_end)
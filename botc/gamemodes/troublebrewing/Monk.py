@@ -2,12 +2,12 @@
 
 import json 
 import discord
-import configparser
 from botc import Action, ActionTypes, Townsfolk, Character, SafetyFromDemon, RecurringAction
 from botc.BOTCUtils import GameLogic
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.monk.value.lower()]
@@ -15,8 +15,7 @@ with open('botc/gamemodes/troublebrewing/character_text.json') as json_file:
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -79,17 +78,12 @@ class Monk(Townsfolk, TroubleBrewing, Character, RecurringAction):
             
         return msg
     
-    def has_finished_night_action(self, player):
-        """Return True if monk has submitted the protect action"""
-        
-        if player.is_alive():
-            # First night, monk ability does not act
-            if globvars.master_state.game._chrono.is_night_1():
-                return True
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.protect
-        return True
+    def expected_night_action(self, player):
+        """The monk must submit the protect action every night, except the first one"""
+
+        if player.is_alive() and not globvars.master_state.game._chrono.is_night_1():
+            return ActionTypes.protect
+        return None
     
     @GameLogic.except_first_night
     @GameLogic.no_self_targetting
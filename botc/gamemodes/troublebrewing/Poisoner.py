@@ -2,12 +2,12 @@
 
 import json 
 import discord
-import configparser
 from botc import Action, ActionTypes, Minion, Character, Poison, RecurringAction
 from botc.BOTCUtils import GameLogic
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.poisoner.value.lower()]
@@ -15,8 +15,7 @@ with open('botc/gamemodes/troublebrewing/character_text.json') as json_file:
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -90,14 +89,12 @@ class Poisoner(Minion, TroubleBrewing, Character, RecurringAction):
         embed_obj.add_field(name = botutils.BotEmoji.butterfly + " **「 Your Action 」**", value = msg, inline = False)
         return embed_obj
     
-    def has_finished_night_action(self, player):
-        """Return True if poisoner has submitted the protect action"""
+    def expected_night_action(self, player):
+        """The poisoner must submit the poison action every night"""
 
         if player.is_alive():
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.poison
-        return True
+            return ActionTypes.poison
+        return None
     
     @GameLogic.requires_one_target
     @GameLogic.changes_not_allowed
@@ -2,29 +2,26 @@
 
 import json
 import discord
-import random
 import datetime
-import configparser
 from botc import Action, ActionTypes, Townsfolk, Character, NonRecurringAction, \
     RavenkeeperActivated, StatusList, BOTCUtils, Minion, Demon, Outsider
 from botc.BOTCUtils import GameLogic
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.ravenkeeper.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    copyrights_str = strings["misc"]["copyrights"]
-    ravenkeeper_reply = strings["gameplay"]["ravenkeeper_reply"]
+strings = settings.game_text
+copyrights_str = strings["misc"]["copyrights"]
+ravenkeeper_reply = strings["gameplay"]["ravenkeeper_reply"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -86,14 +83,12 @@ class Ravenkeeper(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
             
         return msg
     
-    def has_finished_dawn_action(self, player):
-        """Return True if ravenkeeper has submitted the learn action"""
+    def expected_dawn_action(self, player):
+        """The ravenkeeper must submit the learn action at the dawn after their death"""
 
         if player.has_status_effect(StatusList.ravenkeeper_activated):
-            current_phase_id = globvars.master_state.game._chrono.phase_id
-            received_action = player.action_grid.retrieve_an_action(current_phase_id)
-            return received_action is not None and received_action.action_type == ActionTypes.learn
-        return True
+            return ActionTypes.learn
+        return None
     
     async def send_regular_dawn_start_dm(self, player):
         """Send the query message at dawn for the learn ability, if the ravenkeeper 
@@ -144,13 +139,13 @@ class Ravenkeeper(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
                 tb_minion_all = BOTCUtils.get_role_list(TroubleBrewing, Minion)
                 tb_demon_all = BOTCUtils.get_role_list(TroubleBrewing, Demon)
                 pool = tb_minion_all + tb_demon_all
-                learned_character_type = random.choice(pool)
+                learned_character_type = globvars.master_state.game.rng.info.choice(pool)
             # If the real character type is bad
             else:
                 tb_townsfolk_all = BOTCUtils.get_role_list(TroubleBrewing, Townsfolk)
                 tb_outsider_all = BOTCUtils.get_role_list(TroubleBrewing, Outsider)
                 pool = tb_townsfolk_all + tb_outsider_all
-                learned_character_type = random.choice(pool)
+                learned_character_type = globvars.master_state.game.rng.info.choice(pool)
         
         link = learned_character_type._art_link_cropped
         recipient = ravenkeeper_player.user
@@ -201,8 +196,8 @@ class Ravenkeeper(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         @player : the Ravenkeeper player (Player object)
         """
         
-        phase = globvars.master_state.game._chrono.phase_id
-        action = player.action_grid.retrieve_an_action(phase)
+        game = globvars.master_state.game
+        action = game.action_ledger.get(player, game._chrono.phase_id)
         # The Ravenkeeper has submitted an action. We call the execution function immediately
         if action:
             assert action.action_type == ActionTypes.learn, f"Wrong action type {action} in ravenkeeper"
@@ -1,8 +1,7 @@
 """Contains the Recluse Character class"""
 
 import json 
-import random
-from botc import Outsider, Character, Minion, Demon, NonRecurringAction
+from botc import Outsider, Character, Minion, Demon, NonRecurringAction, BOTCUtils
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
@@ -76,9 +75,9 @@ class Recluse(Outsider, TroubleBrewing, Character, NonRecurringAction):
         """Social self: what the other players think he is.
         The recluse may register as a demon, a minion, or as recluse.
         """
-        possibilities = [role_class() for role_class in TroubleBrewing.__subclasses__()
-                        if issubclass(role_class, Demon) or issubclass(role_class, Minion)]
-        possibilities.append(Recluse())
-        chosen = random.choice(possibilities)
+        possibilities = BOTCUtils.get_role_list(TroubleBrewing, Demon) + \
+            BOTCUtils.get_role_list(TroubleBrewing, Minion)
+        possibilities.append(self)
+        chosen = globvars.master_state.game.rng.storyteller.choice(possibilities)
         self._social_role = chosen
         globvars.logging.info(f">>> Recluse [social_self] Registered as {chosen}.")
@@ -1,7 +1,7 @@
 """Contains the Saint Character class"""
 
 import json 
-from botc import Outsider, Character, NonRecurringAction, AlreadyDead, Team
+from botc import Outsider, Character, NonRecurringAction, AlreadyDead, Team, WinEvent
 from ._utils import TroubleBrewing, TBRole
 import botutils
 
@@ -81,9 +81,14 @@ class Saint(Outsider, TroubleBrewing, Character, NonRecurringAction):
             pass
         # The saint was alive and has been executed
         else:
-            if not executed_player.is_droisoned():
-                import globvars
-                globvars.master_state.game.winners = Team.evil
-                from botc.gameloops import master_game_loop
-                if master_game_loop.is_running():
-                    master_game_loop.cancel()
+            import globvars
+            await globvars.master_state.game.check_winning_conditions(WinEvent.execution, executed_player)
+
+    def register_win_rules(self, saint_player, win_tracker):
+        """If a healthy and sober saint is executed, evil wins"""
+
+        def saint_executed(executed_player):
+            if executed_player is saint_player and not saint_player.is_droisoned():
+                return Team.evil
+
+        win_tracker.add_rule(WinEvent.execution, saint_player, saint_executed)
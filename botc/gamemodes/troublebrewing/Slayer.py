@@ -100,6 +100,7 @@ class Slayer(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         # The ability succeeds when the slayer is not droisoned and the slain player is registering
         # as a demon with their social self
         if not slayer_player.is_droisoned():
+            globvars.master_state.game.register_social_selves()
             if slain_player.role.social_self.category == Category.demon:
                 string = LorePicker().pick(LorePicker().SLAY_SUCCESS)
                 string = string.format(
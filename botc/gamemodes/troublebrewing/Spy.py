@@ -1,10 +1,8 @@
 """Contains the Spy Character class"""
 
 import json 
-import random
 import discord
 import asyncio
-import configparser
 import datetime
 from botc import Minion, Character, Townsfolk, Outsider, NonRecurringAction, \
     BOTCUtils
@@ -12,25 +10,23 @@ from ._utils import TroubleBrewing, TBRole
 from discord.ext import tasks
 import botutils
 import globvars
+from botutils.settings import settings
 
-Preferences = configparser.ConfigParser()
-Preferences.read("preferences.INI")
+Preferences = settings.preferences
 
 GRIMOIRE_SHOW_TIME = Preferences["botc"]["GRIMOIRE_SHOW_TIME"]
 GRIMOIRE_SHOW_TIME = int(GRIMOIRE_SHOW_TIME)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.spy.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    copyrights_str = strings["misc"]["copyrights"]
-    spy_nightly = strings["gameplay"]["spy_nightly"]
+strings = settings.game_text
+copyrights_str = strings["misc"]["copyrights"]
+spy_nightly = strings["gameplay"]["spy_nightly"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
@@ -103,17 +99,17 @@ class Spy(Minion, TroubleBrewing, Character, NonRecurringAction):
 
         # The spy may register as good, or as spy, even if dead, except when poisoned
         if not player.is_droisoned():
-            possibilities = [role_class() for role_class in TroubleBrewing.__subclasses__() 
-                            if issubclass(role_class, Townsfolk) or issubclass(role_class, Outsider)]
-            possibilities.append(Spy())
-            random.shuffle(possibilities)
-            chosen = random.choice(possibilities)
+            possibilities = BOTCUtils.get_role_list(TroubleBrewing, Townsfolk) + \
+                BOTCUtils.get_role_list(TroubleBrewing, Outsider)
+            possibilities.append(self)
+            globvars.master_state.game.rng.storyteller.shuffle(possibilities)
+            chosen = globvars.master_state.game.rng.storyteller.choice(possibilities)
             self._social_role = chosen
             globvars.logging.info(f">>> Spy [social_self] Registered as {chosen}.")
 
         else:
-            self._social_role = Spy()
-            globvars.logging.info(f">>> Spy [social_self] Registered as {Spy()}.")
+            self._social_role = self
+            globvars.logging.info(f">>> Spy [social_self] Registered as {self}.")
         
     async def __send_grimoire(self, recipient):
         """Send the spy grimoire"""
@@ -3,26 +3,23 @@
 import discord
 import datetime
 import json 
-import random
-import configparser
-from botc import Townsfolk, Character, NonRecurringAction, BOTCUtils, Townsfolk, \
+from botc import Townsfolk, Character, NonRecurringAction, BOTCUtils, \
     Outsider, Minion, Demon
 from ._utils import TroubleBrewing, TBRole
 import botutils
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.undertaker.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    undertaker_nightly = strings["gameplay"]["undertaker_nightly"]
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+undertaker_nightly = strings["gameplay"]["undertaker_nightly"]
+copyrights_str = strings["misc"]["copyrights"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -99,21 +96,21 @@ class Undertaker(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
             tb_minion_all = BOTCUtils.get_role_list(TroubleBrewing, Minion)
             tb_demon_all = BOTCUtils.get_role_list(TroubleBrewing, Demon)
 
-            executed_player.role.set_new_social_self(executed_player)
+            globvars.master_state.game.register_social_selves()
 
             # The executed player has a good role. The droisoned undertaker will see a 
             # bad role.
             if executed_player.role.social_self.is_good():
                 pool = tb_minion_all + tb_demon_all
-                ret = random.choice(pool)
+                ret = globvars.master_state.game.rng.info.choice(pool)
                 return ret
                 
             # The executed player has a bad role. The droisoned undertaker will see 
             # a good role.
             else:
                 pool = tb_townsfolk_all + tb_outsider_all
-                pool = [character for character in pool if character.name != Undertaker().name]
-                ret = random.choice(pool)
+                pool = [character for character in pool if character.name != TBRole.undertaker.value]
+                ret = globvars.master_state.game.rng.info.choice(pool)
                 return ret
 
         # If no one is executed, then send none
@@ -143,7 +140,7 @@ class Undertaker(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
             import globvars
             executed_player = globvars.master_state.game.today_executed_player
             if executed_player:
-                executed_player.role.set_new_social_self(executed_player)
+                globvars.master_state.game.register_social_selves()
                 character_of_executed = executed_player.role.social_self
             else:
                 character_of_executed = None
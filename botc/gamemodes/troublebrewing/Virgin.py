@@ -2,15 +2,15 @@
 
 import json 
 import botutils
-from botc import Townsfolk, Character, NonRecurringAction, Inventory, Flags, Category
+from botc import Townsfolk, Character, NonRecurringAction, Inventory, Flags, Category, ExecutionEvent
 from ._utils import TroubleBrewing, TBRole
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.virgin.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    documentation = json.load(json_file)
-    immediately_executed = documentation["gameplay"]["immediately_executed"]
+documentation = settings.game_text
+immediately_executed = documentation["gameplay"]["immediately_executed"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
@@ -94,18 +94,18 @@ class Virgin(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
             if virgin_player.role.true_self.inventory.has_item_in_inventory(Flags.virgin_first_nomination):
                 # Remove the unique use ability from the player's inventory
                 virgin_player.role.true_self.inventory.remove_item_from_inventory(Flags.virgin_first_nomination)
-                # The nominator player registers as a new social self
-                nominator_player.role.set_new_social_self(nominator_player)
+                # The nominator player registers as their social self of the day
+                globvars.master_state.game.register_social_selves()
                 if nominator_player.role.social_self.category == Category.townsfolk:
                     msg = immediately_executed.format(
                         botutils.BotEmoji.guillotine,
                         nominator_player.game_nametag
                     )
+                    await globvars.master_state.game.events.publish(ExecutionEvent(nominator_player))
                     await nominator_player.role.true_self.on_being_executed(nominator_player)
                     await botutils.send_lobby(msg)
                     import botc.switches
                     botc.switches.master_proceed_to_night = True
                     return 
 
-        from botc.gameloops import nomination_loop
-        nomination_loop.start(globvars.master_state.game, nominator_player, virgin_player)
+        globvars.master_state.game.start_nomination_loop(nominator_player, virgin_player)
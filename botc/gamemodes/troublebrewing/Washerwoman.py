@@ -2,27 +2,24 @@
 
 import json 
 import discord
-import random
 import datetime
-import configparser
 from botc import Townsfolk, Character, Category, NonRecurringAction, BOTCUtils
 from ._utils import TroubleBrewing, TBRole
 import botutils
 import globvars
+from botutils.settings import settings
 
 with open('botc/gamemodes/troublebrewing/character_text.json') as json_file: 
     character_text = json.load(json_file)[TBRole.washerwoman.value.lower()]
 
-with open('botc/game_text.json') as json_file: 
-    strings = json.load(json_file)
-    washerwoman_init = strings["gameplay"]["washerwoman_init"]
-    copyrights_str = strings["misc"]["copyrights"]
+strings = settings.game_text
+washerwoman_init = strings["gameplay"]["washerwoman_init"]
+copyrights_str = strings["misc"]["copyrights"]
 
 with open('botc/emojis.json') as json_file:
     emojis = json.load(json_file)
 
-Config = configparser.ConfigParser()
-Config.read('config.INI')
+Config = settings.config
 
 DISABLE_DMS = Config["misc"].get("DISABLE_DMS", "").lower() == "true"
 
@@ -137,12 +134,12 @@ class Washerwoman(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
 
         # Choosing townsfolk type
         tb_townsfolk_all = BOTCUtils.get_role_list(TroubleBrewing, Townsfolk)
-        registered_townsfolk_type = random.choice(tb_townsfolk_all)
+        registered_townsfolk_type = globvars.master_state.game.rng.info.choice(tb_townsfolk_all)
 
         # Choosing candidates
         candidates = [player for player in globvars.master_state.game.sitting_order 
                       if player.user.id != washerwoman_player.user.id]
-        random.shuffle(candidates)
+        globvars.master_state.game.rng.info.shuffle(candidates)
         candidate_1 = candidates.pop()
         candidate_2 = candidates.pop()
 
@@ -152,25 +149,24 @@ class Washerwoman(Townsfolk, TroubleBrewing, Character, NonRecurringAction):
         """Send two possible townsfolks"""
 
         # First set the social self
-        for player in globvars.master_state.game.sitting_order:
-            player.role.set_new_social_self(player)
+        globvars.master_state.game.register_social_selves()
 
         # Choose the player that registers as townsfolk
         townsfolks = []
         for player in globvars.master_state.game.sitting_order:
             if player.role.social_self.category == Category.townsfolk and player.user.id != recipient.id:
                 townsfolks.append(player)
-        random.shuffle(townsfolks)
+        globvars.master_state.game.rng.info.shuffle(townsfolks)
         townsfolk = townsfolks.pop()
         registered_townsfolk_type = townsfolk.role.social_self
 
         # Choose the other player
         other_possibilities = [player for player in globvars.master_state.game.sitting_order 
                                if player.user.id != townsfolk.user.id and player.user.id != recipient.id]
-        other = random.choice(other_possibilities)
+        other = globvars.master_state.game.rng.info.choice(other_possibilities)
         
         two_player_list = [townsfolk, other]
-        random.shuffle(two_player_list)
+        globvars.master_state.game.rng.info.shuffle(two_player_list)
         two_player_list.append(registered_townsfolk_type)
 
         globvars.logging.info(f">>> Washerwoman: Sent {townsfolk} and {other} as {registered_townsfolk_type}")
@@ -1,25 +1,40 @@
 """Blood on the Clocktower (BoTC) - Trouble Brewing Edition Characters"""
 
-from .Baron import Baron
-from .Butler import Butler
-from .Chef import Chef
-from .Drunk import Drunk
-from .Empath import Empath
-from .FortuneTeller import FortuneTeller
-from .Imp import Imp
-from .Investigator import Investigator
-from .Librarian import Librarian
-from .Mayor import Mayor
-from .Monk import Monk
-from .Poisoner import Poisoner
-from .Ravenkeeper import Ravenkeeper
-from .Recluse import Recluse
-from .Saint import Saint
-from .ScarletWoman import ScarletWoman
-from .Slayer import Slayer
-from .Soldier import Soldier
-from .Spy import Spy
-from .Undertaker import Undertaker
-from .Virgin import Virgin
-from .Washerwoman import Washerwoman
+import importlib
 
+# Each character module reads its own text files at import, so they are only imported
+# when the character class is first accessed (ex. from botc.gamemodes.troublebrewing import ...)
+__all__ = [
+    "Baron",
+    "Butler",
+    "Chef",
+    "Drunk",
+    "Empath",
+    "FortuneTeller",
+    "Imp",
+    "Investigator",
+    "Librarian",
+    "Mayor",
+    "Monk",
+    "Poisoner",
+    "Ravenkeeper",
+    "Recluse",
+    "Saint",
+    "ScarletWoman",
+    "Slayer",
+    "Soldier",
+    "Spy",
+    "Undertaker",
+    "Virgin",
+    "Washerwoman"
+]
+
+
+def __getattr__(name):
+    """Import the character module on first access and cache the class on the package"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    role_class = getattr(importlib.import_module(f".{name}", __name__), name)
+    # The import system binds the submodule on the package; replace it with the class
+    globals()[name] = role_class
+    return role_class
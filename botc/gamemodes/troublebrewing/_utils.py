@@ -34,9 +34,7 @@ class TBRole(enum.Enum):
 class TroubleBrewing:
     """Parent class for all Trouble Brewing edition roles"""
 
-    def __init__(self):
-
-        self._gm_of_appearance = Gamemode.trouble_brewing
-        self._gm_art_link = "https://imgur.com/3ENrO0y.png"
-        self._gm_main_page = "https://bloodontheclocktower.com/wiki/Trouble_Brewing"
+    _gm_of_appearance = Gamemode.trouble_brewing
+    _gm_art_link = "https://imgur.com/3ENrO0y.png"
+    _gm_main_page = "https://bloodontheclocktower.com/wiki/Trouble_Brewing"
 
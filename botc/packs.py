@@ -0,0 +1,128 @@
+"""Contains the EditionPack class, lazily loading the characters of an edition"""
+
+import importlib
+import json
+
+with open('botc/gamemodes/manifest.json') as json_file:
+    manifest = json.load(json_file)
+
+
+class EditionPack:
+    """The characters of one edition, registered from the manifest.
+
+    Character modules are only imported (and the character objects only created) when
+    the edition is selected for a game, or when a single character is looked up
+    (ex. !role). Iterating over the pack loads the entire edition.
+    """
+
+    def __init__(self, title, package, roles, night_order = None):
+        self.title = title  # "trouble-brewing"
+        self.package = package  # "botc.gamemodes.troublebrewing"
+        self._roles = roles  # {"Fortune Teller" : "FortuneTeller", ...}
+        night_order = night_order or {}
+        self.first_night_order = tuple(night_order.get("first_night", ()))  # Role names, in waking order
+        self.other_nights_order = tuple(night_order.get("other_nights", ()))
+        # Characters whose night ability only gathers information: they may resolve concurrently
+        self.info_roles = frozenset(night_order.get("info", ()))
+        self._role_objs = {}
+        self._roles_by_category = {}
+        self._loaded = False
+
+    @property
+    def role_names(self):
+        """The names of all the characters, without loading any of them"""
+        return list(self._roles)
+
+    @property
+    def is_loaded(self):
+        return self._loaded
+
+    def get_role_class(self, role_name):
+        """Import a single character module and return the character class"""
+        return getattr(importlib.import_module(self.package), self._roles[role_name])
+
+    def get_role(self, role_name):
+        """Return the (shared) character object of a role name from the manifest.
+
+        Shared character objects are only read for their metadata (name, category, team,
+        texts...), ex. demon bluffs or what a character registers as. A player must get
+        their own character object: type(role)().
+        """
+        if role_name not in self._role_objs:
+            self._role_objs[role_name] = self.get_role_class(role_name)()
+        return self._role_objs[role_name]
+
+    def get_roles_of_category(self, category):
+        """Return the shared character objects of a category class (ex. Townsfolk)"""
+        if category not in self._roles_by_category:
+            self._roles_by_category[category] = tuple(role for role in self if isinstance(role, category))
+        return self._roles_by_category[category]
+
+    def find_role_name(self, role_name):
+        """Find a role name in the manifest. An exact (case insensitive) match is returned
+        first, then the first partial match. Return None if nothing is found.
+        """
+        match = None
+        for name in self._roles:
+            if role_name.lower() == name.lower():
+                return name
+            elif role_name.lower() in name.lower() and not match:
+                match = name
+        return match
+
+    def load(self):
+        """Import every character module of the edition. Needed before the edition
+        base class (ex. TroubleBrewing) can be used to list its subclasses.
+        """
+        if not self._loaded:
+            for role_name in self._roles:
+                self.get_role_class(role_name)
+            self._loaded = True
+
+    def __iter__(self):
+        return (self.get_role(role_name) for role_name in self._roles)
+
+    def __len__(self):
+        return len(self._roles)
+
+    def __repr__(self):
+        state = "loaded" if self._loaded else "not loaded"
+        return f"<EditionPack {self.title} ({len(self)} characters, {state})>"
+
+
+editions = {
+    title: EditionPack(title, content["package"], content["roles"], content.get("night_order"))
+    for title, content in manifest.items()
+}
+
+
+def get_edition(gamemode):
+    """Return the EditionPack of a Gamemode (ex. Gamemode.trouble_brewing)"""
+    return editions[gamemode.value.lower()]
+
+
+def load_edition(gamemode):
+    """Load all the characters of a Gamemode (ex. Gamemode.trouble_brewing)"""
+    get_edition(gamemode).load()
+
+
+def get_edition_of(edition_class):
+    """Return the EditionPack of an edition base class (ex. TroubleBrewing)"""
+    package = edition_class.__module__.rpartition(".")[0]
+    for pack in editions.values():
+        if pack.package == package:
+            return pack
+    raise KeyError(f"Edition {edition_class.__name__} is not in the manifest.")
+
+
+def load_edition_of(edition_class):
+    """Load all the characters of an edition base class (ex. TroubleBrewing)"""
+    get_edition_of(edition_class).load()
+
+
+def find_role_class(role_name):
+    """Find the character class of a role name in any edition"""
+    for pack in editions.values():
+        if role_name in pack.role_names:
+            return pack.get_role_class(role_name)
+    raise KeyError(f"Role {role_name} is not in any edition manifest.")
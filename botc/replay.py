@@ -0,0 +1,590 @@
+"""Contains the GameRecorder class, recording the events of a game, and the functions
+to replay a recorded game headless against the current code
+
+A record is a json lines file: a header with the seed, the gamemode, the members and
+the table drawn from the seed, then one line per event published on the game's event
+bus, and a closing line with the winners. The phase changes and the closing line carry
+a checkpoint of the game state (alive and dead players, characters, status effects).
+
+The events are either inputs (the abilities used, the nominations and the votes of the
+players) or results (the deaths, role changes, status effects and executions). The
+replay draws the table again from the seed and plays the recorded inputs only: the
+current code resolves the abilities, the votes and the phase ends again, with the same
+random streams. It raises ReplayDivergence at the first phase whose results or
+checkpoint differ from the recorded ones.
+Usage: python -m botc.replay game_records/*.jsonl
+
+play_test_game() plays a Trouble Brewing game headless, with random player inputs, and
+records it like a live game. `python -m botc.replay --selfcheck` plays some and replays
+them, to check that the recording and the replay still agree.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+from .abilities import ActionTypes
+from .BOTCUtils import Targets, AbilityForbidden
+from .errors import ReplayDivergence
+from .EventBus import GameEvent, DeathEvent, RoleChangeEvent, StatusAppliedEvent, \
+    StatusExpiredEvent, NominationEvent, VoteCastEvent, ExecutionEvent, ActionEvent, \
+    PhaseChangeEvent
+from .WinTracker import WinEvent
+from .snapshot import _player_id, _dump_role, _dump_status, _dump_action
+from botutils.settings import settings
+
+Preferences = settings.preferences
+
+RECORD_GAMES = Preferences.get("replay", "RECORD_GAMES", fallback = "false").lower() == "true"
+MAX_RECORDS = Preferences.getint("replay", "MAX_RECORDS", fallback = 50)
+
+logger = logging.getLogger(__name__)
+
+RECORDS_DIR = "game_records"
+RECORD_VERSION = 2
+
+# The events played by the replay, and the events it compares
+INPUT_EVENTS = ("action", "nomination", "vote")
+RESULT_EVENTS = ("death", "role_change", "status_applied", "status_expired", "execution")
+
+
+def record_path(seed):
+    return os.path.join(RECORDS_DIR, f"{seed}.jsonl")
+
+
+def checkpoint(game):
+    """The game state compared between a record and its replay"""
+    return {
+        "alive": [player.user.id for player in game.sitting_order if player.is_apparently_alive()],
+        "dead": [player.user.id for player in game.sitting_order if player.is_dead()],
+        "roles": [player.role.true_self.name for player in game.sitting_order],
+        "status": sorted(
+            [type(status_effect).__name__, player.user.id]
+            for player in game.sitting_order
+            for status_effect in player.status_effects if status_effect.is_active()
+        )
+    }
+
+
+# ========== RECORDING =============================================================
+# ----------------------------------------------------------------------------------
+
+def _dump_event(event):
+    """Event object -> dict"""
+    if isinstance(event, DeathEvent):
+        return {"event": "death", "player": _player_id(event.player), "apparent": event.apparent}
+    if isinstance(event, RoleChangeEvent):
+        return {"event": "role_change", "player": _player_id(event.player), "role": _dump_role(event.new_role)}
+    if isinstance(event, StatusAppliedEvent):
+        return {"event": "status_applied", "affected": _player_id(event.status_effect.affected_player),
+                **_dump_status(event.status_effect)}
+    if isinstance(event, StatusExpiredEvent):
+        return {"event": "status_expired", "affected": _player_id(event.status_effect.affected_player),
+                "disabled": event.disabled, **_dump_status(event.status_effect)}
+    if isinstance(event, NominationEvent):
+        return {"event": "nomination", "nominator": _player_id(event.nominator),
+                "nominated": _player_id(event.nominated)}
+    if isinstance(event, VoteCastEvent):
+        return {"event": "vote", "voter": _player_id(event.voter), "nominated": _player_id(event.nominated),
+                "hand_up": event.hand_up}
+    if isinstance(event, ExecutionEvent):
+        return {"event": "execution", "player": _player_id(event.player)}
+    if isinstance(event, ActionEvent):
+        return {"event": "action", "action": _dump_action(event.action)}
+    if isinstance(event, PhaseChangeEvent):
+        return {"event": "phase_change", "next_phase": event.next_phase.value}
+    return {"event": type(event).__name__}
+
+
+def prune_records(max_records = MAX_RECORDS):
+    """Delete the oldest records, keeping room for a new one among the `max_records`
+    newest files
+    """
+    try:
+        names = [name for name in os.listdir(RECORDS_DIR) if name.endswith(".jsonl")]
+    except FileNotFoundError:
+        return
+    paths = sorted((os.path.join(RECORDS_DIR, name) for name in names), key = os.path.getmtime)
+    for path in paths[:max(len(paths) - max_records + 1, 0)]:
+        os.remove(path)
+
+
+class GameRecorder:
+    """Append the events of a game to its record file, one json line per event.
+
+    record() only queues the entry: a worker thread writes the queued entries and flushes
+    the file whenever the queue is empty, so the event loop never waits on the disk and
+    the record survives a crash of the bot. Recording is off unless RECORD_GAMES is set
+    in the [replay] preferences. Only the MAX_RECORDS newest records are kept.
+
+    The events published after the game is won are not recorded: the game loop is being
+    cancelled, and a replay stops at the win.
+    """
+
+    def __init__(self, game, path, mode, prune = False):
+        self._game = game
+        self._queue = queue.SimpleQueue()  # Entries to write, None to close the file
+        self._failed = False  # The file can't be written: stop queueing
+        self._thread = threading.Thread(target = self._write_entries, args = (path, mode, prune), daemon = True)
+        self._thread.start()
+        game.events.subscribe(GameEvent, self.record)
+
+    @classmethod
+    def create(cls, game, path = None):
+        """Start the record of a game whose table has just been drawn"""
+        prune = path is None
+        if path is None:
+            path = record_path(game.rng.seed)
+        recorder = cls(game, path, "w", prune)
+        recorder._write({
+            "version": RECORD_VERSION,
+            "t": round(time.time(), 3),
+            "seed": game.rng.seed,
+            "gamemode": game.gamemode.value,
+            "members": [member.id for member in game.member_obj_list],
+            "table": [[player.user.id, player.role.true_self.name] for player in game.sitting_order]
+        })
+        return recorder
+
+    @classmethod
+    def resume(cls, game):
+        """Keep recording a game resumed from its snapshot. None if it has no record."""
+        path = record_path(game.rng.seed)
+        if not os.path.exists(path):
+            return None
+        recorder = cls(game, path, "a")
+        recorder._write({"t": round(time.time(), 3), "phase": game._chrono.phase_id, "event": "resume"})
+        return recorder
+
+    def _write(self, entry):
+        if not self._failed:
+            self._queue.put(entry)
+
+    def _write_entries(self, path, mode, prune):
+        """Worker thread: write the queued entries until the record is closed"""
+        try:
+            if prune:
+                os.makedirs(RECORDS_DIR, exist_ok = True)
+                prune_records()
+            with open(path, mode) as record_file:
+                entry = self._queue.get()
+                while entry is not None:
+                    record_file.write(json.dumps(entry, separators = (",", ":")) + "\n")
+                    if self._queue.empty():
+                        record_file.flush()
+                    entry = self._queue.get()
+        except OSError:
+            self._failed = True
+            logger.exception("Could not write the game record %s", path)
+
+    def record(self, event):
+        if self._game.winners:
+            return
+        entry = {"t": round(time.time(), 3), "phase": self._game._chrono.phase_id}
+        entry.update(_dump_event(event))
+        if isinstance(event, PhaseChangeEvent):
+            entry.update(checkpoint(self._game))
+        self._write(entry)
+
+    def finish(self):
+        """Close the record with the winners of the game, in the phase they were decided.
+        The game loop may have moved the chrono on before it was cancelled.
+        """
+        game = self._game
+        game.events.unsubscribe(GameEvent, self.record)
+        phase_id = game.win_phase_id if game.winners else game._chrono.phase_id
+        entry = {"t": round(time.time(), 3), "phase": phase_id, "event": "end",
+                 "winners": game.winners.value if game.winners else None}
+        entry.update(checkpoint(game))
+        self._write(entry)
+        self.close()
+
+    def close(self):
+        """Stop recording. The worker thread writes out the queued entries and closes
+        the file.
+        """
+        self._game.events.unsubscribe(GameEvent, self.record)
+        self._queue.put(None)
+
+    def wait(self, timeout = None):
+        """Wait until the closed record is written. Blocks: only for a restart or a test."""
+        self._thread.join(timeout)
+
+
+# ========== REPLAYING =============================================================
+# ----------------------------------------------------------------------------------
+
+class ReplayMember:
+    """Headless stand-in for the Discord member of a player in a replayed game"""
+
+    __slots__ = ("id", "name", "display_name", "discriminator", "mention")
+
+    def __init__(self, user_id):
+        self.id = user_id
+        self.name = self.display_name = str(user_id)
+        self.discriminator = "0000"
+        self.mention = f"<@{user_id}>"
+
+    async def send(self, *args, **kwargs):
+        return None
+
+    def __repr__(self):
+        return f"<ReplayMember {self.id}>"
+
+
+def load_record(path):
+    """Read a record file. Return the header and the list of events."""
+    with open(path) as record_file:
+        lines = [json.loads(line) for line in record_file if line.strip()]
+    if not lines or lines[0].get("version") != RECORD_VERSION:
+        raise ReplayDivergence(f"{path} is not a version {RECORD_VERSION} game record.")
+    return lines[0], lines[1:]
+
+
+def start_phase(game):
+    """Move a headless game into its next phase, the way make_nightfall, make_dawn and
+    make_daybreak do
+    """
+    import botc.switches
+    botc.switches.init_switches()
+    game._chrono.next()
+    if game.is_night():
+        game.init_temporary_night_data()
+        for player in game.sitting_order:
+            player.reset_nomination()
+    elif game.is_dawn():
+        game.init_temporary_dawn_data()
+    else:
+        game.init_temporary_day_data()
+
+
+async def end_phase(game):
+    """Resolve the end of the current phase of a headless game, the way the night, dawn
+    and day loops of master_game_loop do. The information messages of the night end
+    (ex. the Spy's grimoire) are not sent: they don't change the game.
+    """
+    import botc.switches
+    if game.is_night():
+        await game.compute_night_ability_interactions()
+    elif game.is_dawn():
+        await game.compute_dawn_ability_interactions()
+    else:
+        # An execution during the nominations (ex. Virgin) ends the day at once
+        if not botc.switches.master_proceed_to_night:
+            await game.execute_chopping_block()
+        if not game.winners:
+            await game.check_winning_conditions(WinEvent.day_end)
+
+
+def _result(entry):
+    """Result entry -> what a replay must reproduce of it"""
+    return {key: value for key, value in entry.items() if key not in ("t", "phase")}
+
+
+class GameReplay:
+    """Play the recorded inputs of a game on a headless game, and compare the results
+    of the current code with the recorded ones at every phase change
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.players = {player.user.id: player for player in game.sitting_order}
+        self.recorded = []  # Recorded results of the current phase
+        self.replayed = []  # Replayed results of the current phase
+        self.nomination = None  # [nominated Player, votes, required votes] of the ongoing vote
+        game.events.subscribe(GameEvent, self._collect)
+
+    def _collect(self, event):
+        # Like the recorder, stop at the win
+        if self.game.winners:
+            return
+        entry = _dump_event(event)
+        if entry["event"] in RESULT_EVENTS:
+            self.replayed.append(entry)
+
+    def _diverge(self, entry, what, recorded, replayed):
+        raise ReplayDivergence(
+            f"Phase {entry.get('phase')} ({entry['event']}): {what} recorded as {recorded}, "
+            f"replayed as {replayed}."
+        )
+
+    def check_results(self, entry):
+        for recorded, replayed in zip(self.recorded, self.replayed):
+            if recorded != replayed:
+                self._diverge(entry, "result", recorded, replayed)
+        if len(self.recorded) != len(self.replayed):
+            common = min(len(self.recorded), len(self.replayed))
+            self._diverge(entry, "results", self.recorded[common:], self.replayed[common:])
+        self.recorded.clear()
+        self.replayed.clear()
+
+    def check_checkpoint(self, entry):
+        replayed = checkpoint(self.game)
+        for key, value in replayed.items():
+            if entry[key] != value:
+                self._diverge(entry, key, entry[key], value)
+
+    def check_winners(self, entry, recorded):
+        winners = self.game.winners.value if self.game.winners else None
+        if recorded != winners:
+            self._diverge(entry, "winners", recorded, winners)
+
+    def close_nomination(self):
+        """Count the votes of the ongoing nomination, like the end of nomination_loop"""
+        if self.nomination is not None:
+            self.game.tally_votes(*self.nomination)
+            self.nomination = None
+
+    async def register_action(self, entry):
+        """Use an ability through the character, like the ability commands do"""
+        game = self.game
+        data = entry["action"]
+        source = self.players[data["source"]]
+        targets = Targets([self.players[user_id] for user_id in data["targets"] or ()])
+        register = getattr(source.role.ego_self, "register_" + data["type"])
+        try:
+            await register(source, targets)
+        except (AbilityForbidden, NotImplementedError) as e:
+            self._diverge(entry, "action", data, f"refused ({type(e).__name__})")
+        action = game.action_ledger.get(source, game._chrono.phase_id)
+        replayed = _dump_action(action) if action is not None else None
+        if replayed != data:
+            self._diverge(entry, "action", data, replayed)
+
+    async def apply(self, entry):
+        game = self.game
+        players = self.players
+        event = entry["event"]
+
+        if event in RESULT_EVENTS:
+            self.recorded.append(_result(entry))
+            return
+
+        if entry["phase"] != game._chrono.phase_id:
+            self._diverge(entry, "phase ID", entry["phase"], game._chrono.phase_id)
+        # The record goes on: the game was not won yet
+        if game.winners and event != "end":
+            self._diverge(entry, "winners", None, game.winners.value)
+
+        if event == "action":
+            await self.register_action(entry)
+
+        elif event == "nomination":
+            self.close_nomination()
+            nominator = players[entry["nominator"]]
+            nominated = players[entry["nominated"]]
+            if not nominator.can_nominate() or not nominated.can_be_nominated():
+                self._diverge(entry, "nomination", "allowed", "refused")
+            self.nomination = [nominated, 0, game.nb_required_votes]
+            await game.nominate(nominator, nominated)
+
+        elif event == "vote":
+            voter = players[entry["voter"]]
+            if self.nomination is None or self.nomination[0] is not players[entry["nominated"]]:
+                self._diverge(entry, "vote", "during the nomination", "without a nomination")
+            if not voter.has_vote():
+                self._diverge(entry, "vote", "available", "spent")
+            if entry["hand_up"]:
+                self.nomination[1] += 1
+            await game.cast_vote(voter, self.nomination[0], entry["hand_up"])
+
+        elif event == "phase_change":
+            self.close_nomination()
+            await end_phase(game)
+            if game.winners:
+                self._diverge(entry, "winners", None, game.winners.value)
+            # The status effects wear off at the phase change
+            await game.events.publish(PhaseChangeEvent(game._chrono.phase_id, game._chrono.next_phase))
+            self.check_results(entry)
+            self.check_checkpoint(entry)
+            start_phase(game)
+
+        elif event == "end":
+            self.close_nomination()
+            # The game was won by the resolution of the phase (ex. the night kills)
+            if entry["winners"] is not None and not game.winners:
+                await end_phase(game)
+            self.check_results(entry)
+            self.check_winners(entry, entry["winners"])
+            self.check_checkpoint(entry)
+
+
+async def replay_game(path):
+    """Replay a recorded game as fast as possible. Return the number of events replayed,
+    raise ReplayDivergence if the current code doesn't reproduce the record.
+
+    A game resumed after a restart plays the interrupted phase again from its snapshot:
+    its record is replayed up to the restart.
+    """
+    import globvars
+    from .Game import Game
+    from .gamemodes.Gamemode import Gamemode
+
+    header, entries = load_record(path)
+    game = Game(Gamemode(header["gamemode"]), seed = header["seed"], headless = True)
+    game._member_obj_list = [ReplayMember(user_id) for user_id in header["members"]]
+
+    # The characters read the game from the master state
+    previous_game = globvars.master_state.game
+    globvars.master_state.game = game
+    nb_replayed = 0
+    try:
+        game.setup_table()
+        table = [[player.user.id, player.role.true_self.name] for player in game.sitting_order]
+        if table != header["table"]:
+            raise ReplayDivergence(f"Table recorded as {header['table']}, drawn as {table}.")
+        # The results of the setup are recorded before the nightfall (see start_game)
+        replay = GameReplay(game)
+        start_phase(game)
+        for entry in entries:
+            if entry["event"] == "resume":
+                break
+            await replay.apply(entry)
+            nb_replayed += 1
+    finally:
+        globvars.master_state.game = previous_game
+    return nb_replayed
+
+
+# ========== SELF CHECK ============================================================
+# ----------------------------------------------------------------------------------
+
+async def _use_abilities(game, choices):
+    """Use the night or dawn ability of every player expecting one, on random targets.
+    Some are refused, like the commands of real players.
+    """
+    for player in game.sitting_order:
+        character = player.role.ego_self
+        if game.is_night():
+            action_type = character.expected_night_action(player)
+        else:
+            action_type = character.expected_dawn_action(player)
+        if action_type is None:
+            continue
+        nb_targets = 2 if action_type == ActionTypes.read else 1
+        targets = Targets(choices.sample(game.sitting_order, nb_targets))
+        try:
+            await getattr(character, "register_" + action_type.value)(player, targets)
+        except AbilityForbidden:
+            pass
+
+
+async def _play_day(game, choices):
+    """Play a day with random slays, nominations and votes"""
+    import botc.switches
+    for player in game.list_alive_players:
+        if choices.random() < 0.1:
+            try:
+                await player.role.ego_self.register_slay(player, Targets([choices.choice(game.sitting_order)]))
+            except AbilityForbidden:
+                pass
+            if game.winners:
+                return
+    while choices.random() < 0.6:
+        nominators = [player for player in game.list_alive_players if player.can_nominate()]
+        nominees = [player for player in game.sitting_order if player.can_be_nominated()]
+        if not nominators or not nominees:
+            return
+        nominated = choices.choice(nominees)
+        nb_required_votes = game.nb_required_votes
+        await game.nominate(choices.choice(nominators), nominated)
+        # The Virgin's nominator has been executed: the day is over
+        if botc.switches.master_proceed_to_night or game.winners:
+            return
+        nb_votes = 0
+        for voter in game.seating.clockwise_from(nominated):
+            if voter.has_vote():
+                hand_up = choices.random() < 0.5
+                nb_votes += hand_up
+                await game.cast_vote(voter, nominated, hand_up)
+        game.tally_votes(nominated, nb_votes, nb_required_votes)
+
+
+async def _play_phases(game, choices):
+    """Play the phases of a headless game until it is won, the way master_game_loop
+    does: the chrono moves on at the start of a phase, the phase change is published at
+    its end. A win decided during a phase ends the game in that phase.
+    """
+    while True:
+        start_phase(game)
+        if game.is_day():
+            await _play_day(game, choices)
+        else:
+            await _use_abilities(game, choices)
+        if not game.winners:
+            await end_phase(game)
+        if game.winners:
+            return
+        await game.events.publish(PhaseChangeEvent(game._chrono.phase_id, game._chrono.next_phase))
+
+
+async def play_test_game(seed, nb_players, path):
+    """Play a Trouble Brewing game headless, with random abilities, nominations and
+    votes, and record it in `path` like a live game
+    """
+    import globvars
+    from .Game import Game
+    from .gamemodes.Gamemode import Gamemode
+
+    game = Game(Gamemode.trouble_brewing, seed = seed, headless = True)
+    game._member_obj_list = [ReplayMember(user_id) for user_id in range(1, nb_players + 1)]
+
+    previous_game = globvars.master_state.game
+    globvars.master_state.game = game
+    try:
+        game.setup_table()
+        recorder = GameRecorder.create(game, path)
+        await _play_phases(game, random.Random(seed))
+        recorder.finish()
+        recorder.wait()
+    finally:
+        globvars.master_state.game = previous_game
+
+
+def selfcheck_records(directory, nb_games = 20):
+    """Play and record test games in a directory. Return the paths of the records."""
+    paths = []
+    for seed in range(1, nb_games + 1):
+        path = os.path.join(directory, f"{seed}.jsonl")
+        nb_players = 5 + seed % 11
+        asyncio.run(play_test_game(seed, nb_players, path))
+        paths.append(path)
+    return paths
+
+
+def main(paths):
+    """Replay record files, print the result of each. Return 1 if any diverged.
+    With --selfcheck, replay freshly recorded test games instead.
+    """
+    import globvars
+    globvars.init_master_state()
+    globvars.init_client()
+    if paths == ["--selfcheck"]:
+        with tempfile.TemporaryDirectory() as directory:
+            return _replay_all(selfcheck_records(directory))
+    return _replay_all(paths)
+
+
+def _replay_all(paths):
+    nb_diverged = 0
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            nb_events = asyncio.run(replay_game(path))
+        except ReplayDivergence as e:
+            nb_diverged += 1
+            print(f"DIVERGED {path}: {e}")
+        else:
+            print(f"OK       {path}: {nb_events} events in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{len(paths) - nb_diverged}/{len(paths)} games reproduced")
+    return 1 if nb_diverged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -2,17 +2,7 @@
 
 from models import FormatterMeta
 from .Game import Game
-from .gamemodes.troublebrewing import Baron, Butler, Chef, Drunk, Empath, FortuneTeller, \
-        Imp, Investigator, Librarian, Mayor, Monk, Poisoner, Ravenkeeper, Recluse, Saint, \
-        ScarletWoman, Slayer, Soldier, Spy, Undertaker, Virgin, Washerwoman
-from .gamemodes.badmoonrising import Assassin, Chambermaid, Courtier, DevilsAdvocate, \
-        Exorcist, Fool, Gambler, Godfather, Goon, Gossip, Grandmother, Innkeeper, Lunatic, \
-        Mastermind, Minstrel, Moonchild, Pacifist, Po, Professor, Pukka, Sailor, Shabaloth, \
-        TeaLady, Tinker, Zombuul
-from .gamemodes.sectsandviolets import Artist, Barber, Cerenovus, Clockmaker, Dreamer, \
-    EvilTwin, FangGu, Flowergirl, Juggler, Klutz, Mathematician, Mutant, NoDashii, Oracle, \
-    Philosopher, PitHag, Sage, Savant, Seamstress, SnakeCharmer, Sweetheart, TownCrier, \
-    Vigormortis, Vortox, Witch
+from .packs import editions
 
 
 class BOTCFormatter(FormatterMeta):
@@ -26,8 +16,8 @@ class BOTCFormatter(FormatterMeta):
         for mode_title in setup["botc"]["gamemodes"]: 
             final_text += self.make_section_header(mode_title)
             final_text += "\n"
-            role_obj_list = setup["botc"]["gamemodes"][mode_title]
-            temp = ", ".join([self.format_role_name(role.name) for role in role_obj_list])
+            edition_pack = setup["botc"]["gamemodes"][mode_title]
+            temp = ", ".join([self.format_role_name(role_name) for role_name in edition_pack.role_names])
             final_text += temp
             final_text += "\n\n"
         return final_text
@@ -41,100 +31,12 @@ setup = {
 
         "formatter" : BOTCFormatter(),
 
-        "gamemodes" : {
-
-            "trouble-brewing" : [
-
-                            Baron(),
-                            Butler(),
-                            Chef(),
-                            Drunk(),
-                            Empath(),
-                            FortuneTeller(),
-                            Imp(),
-                            Investigator(),
-                            Librarian(),
-                            Mayor(),
-                            Monk(),
-                            Poisoner(),
-                            Ravenkeeper(),
-                            Recluse(),
-                            Saint(),
-                            ScarletWoman(),
-                            Slayer(),
-                            Soldier(),
-                            Spy(),
-                            Undertaker(),
-                            Virgin(),
-                            Washerwoman()
-
-                        ],
-            
-            "bad-moon-rising" : [
-
-                            Assassin(),
-                            Chambermaid(),
-                            Courtier(),
-                            DevilsAdvocate(),
-                            Exorcist(),
-                            Fool(),
-                            Gambler(),
-                            Godfather(),
-                            Goon(),
-                            Gossip(),
-                            Grandmother(),
-                            Innkeeper(),
-                            Lunatic(),
-                            Mastermind(),
-                            Minstrel(),
-                            Moonchild(),
-                            Pacifist(),
-                            Po(),
-                            Professor(),
-                            Pukka(),
-                            Sailor(),
-                            Shabaloth(),
-                            TeaLady(),
-                            Tinker(),
-                            Zombuul()
-
-                        ],
-            
-            "sects-&-violets" : [
-
-                            Artist(),
-                            Barber(),
-                            Cerenovus(),
-                            Clockmaker(),
-                            Dreamer(),
-                            EvilTwin(),
-                            FangGu(),
-                            Flowergirl(),
-                            Juggler(),
-                            Klutz(),
-                            Mathematician(),
-                            Mutant(),
-                            NoDashii(),
-                            Oracle(),
-                            Philosopher(),
-                            PitHag(),
-                            Sage(),
-                            Savant(),
-                            Seamstress(),
-                            SnakeCharmer(),
-                            Sweetheart(),
-                            TownCrier(),
-                            Vigormortis(),
-                            Vortox(),
-                            Witch()
-
-                        ]
-
-        }
+        # Lazily loaded character lists (see botc/packs.py)
+        "gamemodes" : editions
 
     }
 
-}   
+}
 
 
 def load_pack(master_state):
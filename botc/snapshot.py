@@ -0,0 +1,232 @@
+"""Contains the functions to save the game at each phase boundary and to resume it
+after the bot restarts (frestart, update)
+
+The snapshot is a compact json file. Players are referenced by user ID, characters
+by role name and status effects by class name, so a new process can rebuild the game.
+"""
+
+import json
+import os
+import botutils
+from .abilities import Action, ActionTypes
+from .BOTCUtils import Targets
+from .ChoppingBlock import ChoppingBlock
+from .errors import GameError
+from .flag_inventory import Inventory, Flags
+from .PlayerState import PlayerState
+from .Seating import Seating
+from . import status
+
+SNAPSHOT_FILE = "game_snapshot.json"
+SNAPSHOT_VERSION = 3
+
+STORYTELLER = "storyteller"
+
+
+# ========== SAVING ================================================================
+# ----------------------------------------------------------------------------------
+
+def _player_id(player):
+    """User ID of a player, None for anything else (Storyteller, missing player)"""
+    user = getattr(player, "user", None)
+    return user.id if user is not None else None
+
+
+def _dump_role(role):
+    """Character object -> dict. The true/ego/social layers are only saved when they
+    are a different character object (ex. the Drunk thinking they are a townsfolk).
+    """
+    data = {
+        "name": role.name,
+        "inventory": [flag.value for flag in role.inventory.inv]
+    }
+    for key, layer in (("true", role._true_role), ("ego", role._ego_role), ("social", role._social_role)):
+        if layer is not role:
+            data[key] = _dump_role(layer)
+    return data
+
+
+def _dump_status(status_effect):
+    source = status_effect.source_player
+    return {
+        "type": type(status_effect).__name__,
+        "source": STORYTELLER if isinstance(source, status.Storyteller) else _player_id(source),
+        "pointer": _player_id(status_effect.pointer_player),
+        "duration": status_effect.duration,
+        "expires": status_effect.expires_at,
+        "active": status_effect._is_active
+    }
+
+
+def _dump_action(action):
+    targets = action.target_player
+    if targets is None:
+        target_ids = None
+    elif hasattr(targets, "user"):
+        target_ids = [targets.user.id]
+    else:
+        target_ids = [player.user.id for player in targets]
+    return {
+        "source": _player_id(action.source_player),
+        "targets": target_ids,
+        "type": action.action_type.value,
+        "birth": action.birth_phase_id
+    }
+
+
+def _dump_player(player):
+    return {
+        "id": player.user.id,
+        "role": _dump_role(player.role),
+        "old_role": _dump_role(player.old_role) if player.old_role else None,
+        "state": player.state.value,
+        "apparent_state": player.apparent_state.value,
+        "ghost_vote": player.ghost_vote,
+        "has_nominated": player.has_nominated,
+        "was_nominated": player.was_nominated,
+        "status_effects": [_dump_status(status_effect) for status_effect in player.status_effects]
+    }
+
+
+def dump_game(game):
+    """Game object -> dict"""
+    chopping_block = game.chopping_block
+    return {
+        "version": SNAPSHOT_VERSION,
+        "gamemode": game.gamemode.value,
+        "seed": game.rng.seed,
+        "phase_id": game._chrono.current,
+        "invalidated": game.invalidated,
+        "members": [member.id for member in game.member_obj_list],
+        "sitting_order": [player.user.id for player in game.sitting_order],
+        "players": [_dump_player(player) for player in game.sitting_order],
+        "actions": [[phase_id, _dump_action(action)] for phase_id, action in game.action_ledger],
+        "chopping_block": {
+            "player": _player_id(chopping_block.player_about_to_die),
+            "votes": chopping_block.nb_votes
+        } if chopping_block else None,
+        "today_executed_player": _player_id(game.today_executed_player),
+        "night_deaths": [player.user.id for player in game.night_deaths]
+    }
+
+
+def save_snapshot(game):
+    """Write the snapshot of the game, replacing the previous one atomically"""
+    temp_file = SNAPSHOT_FILE + ".tmp"
+    with open(temp_file, "w") as snapshot_file:
+        json.dump(dump_game(game), snapshot_file, separators = (",", ":"))
+    os.replace(temp_file, SNAPSHOT_FILE)
+
+
+def delete_snapshot():
+    """Delete the snapshot once the game is over"""
+    try:
+        os.remove(SNAPSHOT_FILE)
+    except FileNotFoundError:
+        pass
+
+
+def has_snapshot():
+    return os.path.exists(SNAPSHOT_FILE)
+
+
+# ========== RESTORING =============================================================
+# ----------------------------------------------------------------------------------
+
+def load_snapshot():
+    """Read the snapshot file. Return None if there is none or it can't be used."""
+    try:
+        with open(SNAPSHOT_FILE) as snapshot_file:
+            data = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != SNAPSHOT_VERSION:
+        return None
+    return data
+
+
+def _restore_role(data):
+    from .packs import find_role_class
+    role = find_role_class(data["name"])()
+    role.inventory = Inventory(*[Flags(value) for value in data["inventory"]])
+    for key, attribute in (("true", "_true_role"), ("ego", "_ego_role"), ("social", "_social_role")):
+        if key in data:
+            setattr(role, attribute, _restore_role(data[key]))
+    return role
+
+
+def restore_game(data):
+    """Dict -> Game object. Raise GameError if a player can't be found anymore."""
+    from .Game import Game
+    from .Player import Player
+    from .gamemodes.Gamemode import Gamemode
+    from .packs import load_edition
+
+    game = Game(Gamemode(data["gamemode"]), seed = data["seed"])
+    load_edition(game.gamemode)
+
+    members = {}
+    for user_id in data["members"]:
+        member = botutils.get_member_obj(user_id)
+        if member is None:
+            raise GameError(f"Member {user_id} of the saved game was not found.")
+        members[user_id] = member
+
+    # First pass: the players, so that the second pass can reference them
+    players = {}
+    for player_data in data["players"]:
+        player = Player(
+            members[player_data["id"]],
+            _restore_role(player_data["role"]),
+            game.status_store,
+            game.action_ledger
+        )
+        if player_data["old_role"]:
+            player._old_role_obj = _restore_role(player_data["old_role"])
+        player._state_obj = PlayerState(player_data["state"])
+        player._apparent_state_obj = PlayerState(player_data["apparent_state"])
+        player.ghost_vote = player_data["ghost_vote"]
+        player.has_nominated = player_data["has_nominated"]
+        player.was_nominated = player_data["was_nominated"]
+        players[player_data["id"]] = player
+
+    # Second pass: status effects and actions, which reference other players
+    for player_data in data["players"]:
+        player = players[player_data["id"]]
+        for status_data in player_data["status_effects"]:
+            source = status_data["source"]
+            source = status.Storyteller() if source == STORYTELLER else players.get(source)
+            status_effect = getattr(status, status_data["type"])(
+                source,
+                player,
+                players.get(status_data["pointer"]),
+                status_data["duration"]
+            )
+            status_effect._is_active = status_data["active"]
+            game.status_store.add(status_effect, expires_at = status_data["expires"])
+
+    for phase_id, action_data in data["actions"]:
+        targets = action_data["targets"]
+        if targets is not None:
+            targets = Targets([players[user_id] for user_id in targets])
+        source = players[action_data["source"]]
+        action = Action(source, targets, ActionTypes(action_data["type"]), action_data["birth"])
+        game.action_ledger.register(source, action, phase_id)
+
+    game._member_obj_list = [members[user_id] for user_id in data["members"]]
+    game._sitting_order = tuple(players[user_id] for user_id in data["sitting_order"])
+    game.seating = Seating(game._sitting_order)
+    game._player_obj_list = list(game._sitting_order)
+    game._chrono.current = data["phase_id"]
+    game.rng.start_phase(data["phase_id"] + 1)
+    game.invalidated = data["invalidated"]
+    game.setup.clear()
+    game.setup.create(game.player_obj_list)
+
+    chopping_block = data["chopping_block"]
+    if chopping_block:
+        game.chopping_block = ChoppingBlock(players.get(chopping_block["player"]), chopping_block["votes"])
+    game.today_executed_player = players.get(data["today_executed_player"])
+    game.night_deaths = [players[user_id] for user_id in data["night_deaths"]]
+
+    return game
@@ -1,6 +1,8 @@
 """Contains classes about BoTC in-game status effects"""
 
+import collections
 import enum
+from .EventBus import StatusAppliedEvent, StatusExpiredEvent
 
 DEFAULT_EFFECT_DURATION = 3
 
@@ -18,12 +20,18 @@ class StatusList(enum.Enum):
 
 class Storyteller:
     """Storyteller class. Used to indicate sources of certain effects."""
-    pass
+
+    __slots__ = ()
 
 
 class StatusEffect:
     """Parent class for status effect."""
 
+    __slots__ = ("source_player", "affected_player", "pointer_player", "duration", "expires_at",
+                 "expired", "_is_active")
+
+    _effect = None  # StatusList enum object, set by the child classes
+
     def __init__(self, source_player, affected_player, pointer_player, duration):
         """Initalize the object.
 
@@ -38,16 +46,13 @@ class StatusEffect:
         self.affected_player = affected_player
         self.pointer_player = pointer_player
         self.duration = duration
+        self.expires_at = None  # Phase ID from which the effect has worn off, set by the StatusStore
+        self.expired = False
         self._is_active = None
-        self._effect = None
 
     def __repr__(self):
         return f"Status {self._effect} on {self.affected_player}"
 
-    def wear_off(self):
-        """Wear off the effect duration by 1 phase"""
-        self.duration -= 1
-
     def manually_enable(self):
         """Manually enable the effect"""
         self._is_active = True
@@ -62,7 +67,7 @@ class StatusEffect:
         """
         if self._is_active is not None:
             return self._is_active
-        return self.duration > 0
+        return not self.expired
 
     @property
     def effect(self):
@@ -76,6 +81,10 @@ class StatusEffect:
 class RavenkeeperActivated(StatusEffect):
     """Ravenkeerper ability is active."""
 
+    __slots__ = ()
+
+    _effect = StatusList.ravenkeeper_activated
+
     def __init__(
             self,
             source_player,
@@ -90,12 +99,15 @@ class RavenkeeperActivated(StatusEffect):
         @duration : 2 phases (the same night, next dawn)
         """
         super().__init__(source_player, affected_player, pointer_player, duration)
-        self._effect = StatusList.ravenkeeper_activated
 
 
 class SafetyFromDemon(StatusEffect):
     """Safety from demon effect. Affected player will not die from demon kill."""
 
+    __slots__ = ()
+
+    _effect = StatusList.safety_from_demon
+
     def __init__(
             self,
             source_player,
@@ -104,12 +116,15 @@ class SafetyFromDemon(StatusEffect):
             duration = DEFAULT_EFFECT_DURATION
         ):
         super().__init__(source_player, affected_player, pointer_player, duration)
-        self._effect = StatusList.safety_from_demon
 
 
 class Drunkenness(StatusEffect):
     """Drunkenness effect"""
 
+    __slots__ = ()
+
+    _effect = StatusList.drunkenness
+
     def __init__(
             self,
             source_player,
@@ -118,12 +133,15 @@ class Drunkenness(StatusEffect):
             duration = DEFAULT_EFFECT_DURATION
         ):
         super().__init__(source_player, affected_player, pointer_player, duration)
-        self._effect = StatusList.drunkenness
 
 
 class Poison(StatusEffect):
     """Poison effect"""
 
+    __slots__ = ()
+
+    _effect = StatusList.poison
+
     def __init__(
             self,
             source_player,
@@ -132,12 +150,15 @@ class Poison(StatusEffect):
             duration = DEFAULT_EFFECT_DURATION
         ):
         super().__init__(source_player, affected_player, pointer_player, duration)
-        self._effect = StatusList.poison
 
 
 class RedHerring(StatusEffect):
     """Red herring for the fortune teller character."""
 
+    __slots__ = ()
+
+    _effect = StatusList.red_herring
+
     def __init__(
             self,
             source_player,
@@ -149,12 +170,15 @@ class RedHerring(StatusEffect):
         a really large number
         """
         super().__init__(source_player, affected_player, pointer_player, duration)
-        self._effect = StatusList.red_herring
 
 
 class ButlerService(StatusEffect):
     """Butler under service of a master"""
 
+    __slots__ = ()
+
+    _effect = StatusList.butler_service
+
     def __init__(
             self,
             source_player,
@@ -169,4 +193,96 @@ class ButlerService(StatusEffect):
         @duration : 3 phases by default (the same night, next dawn, and next day)
         """
         super().__init__(source_player, affected_player, pointer_player, duration)
-        self._effect = StatusList.butler_service
+
+
+class StatusStore:
+    """Status effects of a game, indexed by affected player and effect, by effect, by
+    source player, and scheduled by the phase ID at which they wear off.
+
+    An effect applied during phase N with a duration of D phases is active during
+    phases N to N + D - 1 (effects applied before night 1 count from night 1).
+    Worn off and disabled effects are removed from the store. Additions and removals
+    are published on the event bus of the game, if there is one.
+
+    The indexes are dicts used as ordered sets: the effects wear off in the order they
+    were applied, and a replayed game publishes the same events in the same order.
+    """
+
+    def __init__(self, chrono = None, events = None):
+        self._chrono = chrono  # GameChrono object giving the current phase ID
+        self._events = events  # EventBus object
+        self._by_player = collections.defaultdict(lambda: collections.defaultdict(dict))
+        self._by_effect = collections.defaultdict(dict)
+        self._by_source = collections.defaultdict(dict)
+        self._schedule = collections.defaultdict(dict)  # {expiry phase ID : {effect : None}}
+        self._worn_off_until = 0  # Effects expiring at or before this phase ID are gone
+
+    def add(self, status_effect, expires_at = None):
+        """Add a status effect applied during the current phase. The expiry phase ID can
+        be given instead of being computed from the duration (ex. restoring a saved game).
+        """
+        if expires_at is None:
+            phase_id = self._chrono.phase_id if self._chrono is not None else 0
+            expires_at = max(phase_id, 1) + status_effect.duration
+        status_effect.expires_at = expires_at
+        if expires_at <= self._worn_off_until:
+            status_effect.expired = True
+            return
+        self._by_player[status_effect.affected_player][status_effect.effect][status_effect] = None
+        self._by_effect[status_effect.effect][status_effect] = None
+        self._by_source[status_effect.source_player][status_effect] = None
+        self._schedule[expires_at][status_effect] = None
+        if self._events is not None:
+            self._events.emit(StatusAppliedEvent(status_effect))
+
+    def remove(self, status_effect):
+        """Remove a status effect from all the indexes"""
+        effects_of_player = self._by_player[status_effect.affected_player]
+        effects_of_player[status_effect.effect].pop(status_effect, None)
+        if not effects_of_player[status_effect.effect]:
+            del effects_of_player[status_effect.effect]
+        self._by_effect[status_effect.effect].pop(status_effect, None)
+        self._by_source[status_effect.source_player].pop(status_effect, None)
+        self._schedule.get(status_effect.expires_at, {}).pop(status_effect, None)
+
+    def has(self, player, effect):
+        """Is the player under an active status effect (StatusList enum object)?"""
+        effects = self._by_player[player].get(effect)
+        return bool(effects) and any(status_effect.is_active() for status_effect in effects)
+
+    def effects_of(self, player):
+        """All the status effects of a player that have not worn off"""
+        return [status_effect for effects in self._by_player[player].values() for status_effect in effects]
+
+    def _expire(self, status_effect, disabled):
+        self.remove(status_effect)
+        if self._events is not None:
+            self._events.emit(StatusExpiredEvent(status_effect, disabled))
+
+    def disable(self, status_effect):
+        """Disable a status effect before it wears off"""
+        status_effect.manually_disable()
+        self._expire(status_effect, True)
+
+    def disable_from_source(self, source_player, effect = None):
+        """Disable all the effects (or all the effects of a type) inflicted by a source"""
+        for status_effect in list(self._by_source[source_player]):
+            if effect is None or status_effect.effect == effect:
+                self.disable(status_effect)
+
+    def disable_effect(self, effect):
+        """Disable all the status effects of a type, whatever their source"""
+        for status_effect in list(self._by_effect[effect]):
+            self.disable(status_effect)
+
+    def end_phase(self, phase_id):
+        """The phase has ended: wear off the effects that do not last into the next phase"""
+        next_phase_id = phase_id + 1
+        for expiry in range(self._worn_off_until + 1, next_phase_id + 1):
+            for status_effect in self._schedule.pop(expiry, ()):
+                status_effect.expired = True
+                self._expire(status_effect, False)
+        self._worn_off_until = max(self._worn_off_until, next_phase_id)
+
+    def clear(self):
+        self.__init__(self._chrono, self._events)
@@ -0,0 +1,75 @@
+"""Contains the FileBackup class"""
+
+import asyncio
+import csv
+import os
+import threading
+from .settings import settings
+
+Preferences = settings.preferences
+
+BACKUP_DELAY = Preferences.getint("duration", "BACKUP_DELAY", fallback = 5)
+
+
+class FileBackup:
+    """Write-behind backup of a list of user IDs, in a one-row csv file.
+
+    changed() keeps the latest IDs and schedules a write `delay` seconds later, so that
+    the changes made in the meantime are written at once, and nothing is written while
+    nothing changes. The file is written in a worker thread, to a temporary file which
+    then replaces the backup: a crash mid-write leaves the previous backup intact.
+    """
+
+    def __init__(self, path, delay = BACKUP_DELAY):
+        self.path = path
+        self.delay = delay
+        self._pending = None  # IDs waiting to be written
+        self._task = None
+        # A write in the worker thread may overlap with write_pending() before a restart
+        self._write_lock = threading.Lock()
+
+    def load(self):
+        """Read the user IDs from the backup file. Empty if there is no file yet."""
+        try:
+            with open(self.path, mode = "r", newline = "") as backup_file:
+                return [int(item) for row in csv.reader(backup_file, delimiter = ",") for item in row if item]
+        except FileNotFoundError:
+            return []
+
+    def changed(self, user_ids):
+        """Schedule the write of the new list of user IDs"""
+        self._pending = list(user_ids)
+        if self._task is None or self._task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Not in the bot (ex. loading at startup): write it now
+                self.write_pending()
+                return
+            self._task = loop.create_task(self._write_later())
+
+    async def _write_later(self):
+        while self._pending is not None:
+            await asyncio.sleep(self.delay)
+            user_ids, self._pending = self._pending, None
+            await asyncio.get_running_loop().run_in_executor(None, self._write, user_ids)
+
+    def write_pending(self):
+        """Write the pending changes right away. Used when the bot exits or restarts
+        (os.execl doesn't run the atexit functions).
+        """
+        if self._pending is not None:
+            user_ids, self._pending = self._pending, None
+            self._write(user_ids)
+
+    def _write(self, user_ids):
+        temp_file = self.path + ".tmp"
+        with self._write_lock:
+            with open(temp_file, mode = "w", newline = "") as backup_file:
+                csv.writer(backup_file, delimiter = ",").writerow(user_ids)
+                backup_file.flush()
+                os.fsync(backup_file.fileno())
+            os.replace(temp_file, self.path)
+
+    def __repr__(self):
+        return f"<FileBackup {self.path}{' (pending)' if self._pending is not None else ''}>"
@@ -3,28 +3,29 @@
 from botc.gamemodes.Gamemode import Gamemode
 
 class GameChooser:
-    """A class to faciliate gamemode choosing and voting"""
+    """A class to faciliate gamemode choosing and voting.
+    Game objects are only created the first time their gamemode is asked for.
+    """
 
-    from botc.Game import Game
-    
-    _default_game = Game()
-
-    _tb_game = Game(Gamemode.trouble_brewing)
-    _bmr_game = Game(Gamemode.bad_moon_rising)
-    _snv_game = Game(Gamemode.sects_and_violets)
+    _games = {}
 
     selected_gamemode = Gamemode.trouble_brewing
 
+    @classmethod
+    def _get_game(cls, gamemode = None):
+        """Create the game object of a gamemode (None for the default game) on first use"""
+        if gamemode not in cls._games:
+            from botc.Game import Game
+            cls._games[gamemode] = Game() if gamemode is None else Game(gamemode)
+        return cls._games[gamemode]
+
     @property
     def default_game(self):
-        return self._default_game
+        return self._get_game()
     
     def get_selected_game(self):
-        if self.selected_gamemode == Gamemode.trouble_brewing:
-            return self. _tb_game
-        elif self.selected_gamemode == Gamemode.bad_moon_rising:
-            return self._bmr_game
-        elif self.selected_gamemode == Gamemode.sects_and_violets:
-            return self._snv_game
+        if self.selected_gamemode in (Gamemode.trouble_brewing, Gamemode.bad_moon_rising, 
+                                      Gamemode.sects_and_violets):
+            return self._get_game(self.selected_gamemode)
         else:
-            return self._default_game
+            return self._get_game()
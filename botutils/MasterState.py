@@ -1,6 +1,7 @@
 """Contains the Master State Machine"""
 
 import time
+from .Membership import MembershipTracker
 from .Pregame import Pregame
 from .BotState import BotState
 
@@ -95,6 +96,7 @@ class MasterState:
         self._boottime = time.time()
         self._pregame = Pregame()
         self._game = None
+        self._membership = MembershipTracker()
         self._session = BotState.empty
         self._game_packs = dict()
 
@@ -121,6 +123,10 @@ class MasterState:
     def game(self, new):
         self._game = new
     
+    @property
+    def membership(self):
+        return self._membership
+
     @property
     def session(self):
         return self._session
@@ -150,6 +156,12 @@ class MasterState:
         self.pregame.clear()
         self.game = None
     
+    def resume_game(self, game):
+        """Put a game restored after a restart back in place, in the game state"""
+        self.game = game
+        self.state_machine.currentState = StateMachine.game_state
+        self.transition_to_game()
+
     def transition_to_game(self):
         import botutils
         if botutils.lobby_timeout.is_running():
@@ -0,0 +1,41 @@
+"""Contains the MembershipTracker class"""
+
+
+class MembershipTracker:
+    """IDs of the users who have left the guild, kept up to date by the on_member_remove
+    and on_member_join events, so that the pregame and the game can check a player in
+    O(1) without fetching the guild members at every access.
+    """
+
+    def __init__(self):
+        self._departed = set()
+
+    def mark_left(self, user_id):
+        self._departed.add(int(user_id))
+
+    def mark_joined(self, user_id):
+        self._departed.discard(int(user_id))
+
+    def has_left(self, user_id):
+        """Has the user left the guild?"""
+        return int(user_id) in self._departed
+
+    def departed_among(self, user_ids):
+        """Return the IDs, out of the given ones, of the users who have left the guild"""
+        return [user_id for user_id in user_ids if int(user_id) in self._departed]
+
+    def refresh(self, guild, user_ids):
+        """Check the given users against the guild member cache in one pass. Needed when
+        the member events may have been missed (ex. after a reconnection).
+        """
+        for user_id in user_ids:
+            if guild.get_member(int(user_id)) is None:
+                self.mark_left(user_id)
+            else:
+                self.mark_joined(user_id)
+
+    def __len__(self):
+        return len(self._departed)
+
+    def __repr__(self):
+        return f"<MembershipTracker {len(self)} departed users>"
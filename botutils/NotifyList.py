@@ -0,0 +1,88 @@
+"""Contains the NotifyList class"""
+
+import discord
+
+
+class NotifyList:
+    """IDs of the users who want to be pinged by the notify command, in a set. The
+    changes are written behind to the backup file, if any (see FileBackup).
+
+    The subscribers who are not offline are indexed, kept up to date by the presence
+    events, so that the notify command doesn't have to look up every subscriber's
+    member object and status.
+    """
+
+    def __init__(self, backup = None):
+        self._users = set()
+        self._online = set()  # Subscribers whose status is not offline
+        self.backup = backup
+
+    def load(self):
+        """Replace the list with the content of the backup file"""
+        self._users = set(self.backup.load()) if self.backup else set()
+        self._online.clear()
+
+    def _changed(self):
+        if self.backup:
+            self.backup.changed(sorted(self._users))
+
+    def add(self, user_id, online = False):
+        user_id = int(user_id)
+        if user_id not in self._users:
+            self._users.add(user_id)
+            self._changed()
+        self.set_online(user_id, online)
+
+    def remove(self, user_id):
+        user_id = int(user_id)
+        self._online.discard(user_id)
+        if user_id in self._users:
+            self._users.discard(user_id)
+            self._changed()
+
+    def clear(self):
+        self._users.clear()
+        self._online.clear()
+        self._changed()
+
+    # ---------- PRESENCE INDEX ----------
+
+    def set_online(self, user_id, online):
+        """Update the presence of a subscriber. Does nothing for the other users."""
+        user_id = int(user_id)
+        if online and user_id in self._users:
+            self._online.add(user_id)
+        else:
+            self._online.discard(user_id)
+
+    def is_online(self, user_id):
+        return int(user_id) in self._online
+
+    def online(self):
+        """The subscribers who are not offline, in ID order"""
+        return sorted(self._online)
+
+    def refresh(self, guild):
+        """Rebuild the presence index from the guild member cache, in one pass. The
+        subscribers who have left the guild are removed. Needed at startup and when the
+        presence events may have been missed (ex. after a reconnection).
+        """
+        self._online.clear()
+        for user_id in list(self._users):
+            member = guild.get_member(user_id)
+            if member is None:
+                self.remove(user_id)
+            elif member.status != discord.Status.offline:
+                self._online.add(user_id)
+
+    def __contains__(self, user_id):
+        return int(user_id) in self._users
+
+    def __iter__(self):
+        return iter(sorted(self._users))
+
+    def __len__(self):
+        return len(self._users)
+
+    def __repr__(self):
+        return f"<NotifyList {len(self)} users, {len(self._online)} online>"
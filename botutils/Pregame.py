@@ -1,48 +1,53 @@
 """Contains the Pregame class"""
 
+import time
 import globvars
-import configparser
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
-
-SERVER_ID = Config["user"]["SERVER_ID"]
-SERVER_ID = int(SERVER_ID)
 
 class Pregame:
-    """Pregame class: for storing session before game start"""
+    """Pregame class: for storing session before game start
+
+    The joined players are kept in join order with their join time, in a dict for O(1)
+    membership. Players joining a full lobby are put on a waiting list, which outlives
+    the game: the waiting players are moved into the lobby of the next game. The votes
+    to start are kept with the roster, so that a player leaving takes their vote away.
+    """
 
     def __init__(self):
-        self._userid_list = []
+        self._joined = {}  # {user ID : join time}, in join order
+        self._start_votes = set()  # user IDs
+        self._waiting = {}  # {user ID : queuing time}, in queuing order
 
     @property
     def list(self):
-        """Access the list of user id"""
-        self.remove_left_guild_players()
-        return self._userid_list
-    
+        """Access the list of user id, in join order"""
+        return list(self._joined)
+
     def is_empty(self):
         """Is the pregame lobby empty? (meaning that there are 0 players who have joined)"""
-        return len(self._userid_list) == 0
+        return len(self._joined) == 0
 
     def add_player(self, userid):
         """Add a player based on its user ID"""
         userid = int(userid)
-        if userid not in self._userid_list:
-            self._userid_list.append(userid)
+        if userid not in self._joined:
+            self._joined[userid] = time.time()
+            self._waiting.pop(userid, None)
 
     def remove_player(self, userid):
-        """Remove a player based on its user ID"""
+        """Remove a player based on its user ID, with their vote to start"""
         userid = int(userid)
-        if userid in self._userid_list:
-            self._userid_list.remove(userid)
-    
+        self._joined.pop(userid, None)
+        self._start_votes.discard(userid)
+
     def is_joined(self, userid):
-        """Check if a userid is already in self._userid_list"""
-        self.remove_left_guild_players()
-        userid = int(userid)
-        return userid in self._userid_list
-    
+        """Check if a userid has joined"""
+        return int(userid) in self._joined
+
+    def joined_at(self, userid):
+        """Return the time at which a player joined, None if they have not"""
+        return self._joined.get(int(userid))
+
     def safe_add_player(self, userid):
         """Add a player based on its user ID only if the player has not joined"""
         userid = int(userid)
@@ -54,28 +59,98 @@ class Pregame:
         userid = int(userid)
         if self.is_joined(userid):
             self.remove_player(userid)
-    
+
+    # ---------- START VOTES ----------
+
+    def vote_to_start(self, userid):
+        self._start_votes.add(int(userid))
+
+    def has_voted_to_start(self, userid):
+        return int(userid) in self._start_votes
+
+    @property
+    def nb_start_votes(self):
+        return len(self._start_votes)
+
+    @property
+    def start_votes_needed(self):
+        """Number of votes needed to start the game"""
+        return max(len(self) - 3, 3)
+
+    def has_start_quorum(self):
+        return self.nb_start_votes >= self.start_votes_needed
+
+    def clear_start_votes(self):
+        self._start_votes.clear()
+
+    # ---------- WAITING LIST ----------
+
+    def queue_player(self, userid):
+        """Put a player on the waiting list (the lobby is full). Return their position."""
+        userid = int(userid)
+        if userid not in self._waiting and userid not in self._joined:
+            self._waiting[userid] = time.time()
+        return self.waiting_position(userid)
+
+    def unqueue_player(self, userid):
+        self._waiting.pop(int(userid), None)
+
+    def is_waiting(self, userid):
+        return int(userid) in self._waiting
+
+    def waiting_position(self, userid):
+        """Position of a player on the waiting list, starting at 1. None if they are not on it."""
+        userid = int(userid)
+        if userid not in self._waiting:
+            return None
+        return list(self._waiting).index(userid) + 1
+
+    @property
+    def waiting_list(self):
+        return list(self._waiting)
+
+    def promote_waiting(self, capacity):
+        """Move the first waiting players into the lobby, up to a number of players.
+        Return their user IDs.
+        """
+        promoted = []
+        for userid in list(self._waiting):
+            if len(self._joined) >= capacity:
+                break
+            self.add_player(userid)
+            promoted.append(userid)
+        return promoted
+
+    def clear_waiting(self):
+        self._waiting.clear()
+
     def clear(self):
-        """Clear the user ID list"""
-        self.__init__()
-    
+        """Clear the joined players and the start votes. The waiting list is kept for the
+        next game.
+        """
+        self._joined.clear()
+        self._start_votes.clear()
+
     def __str__(self):
         return f"Pregame Object with {len(self)} users"
 
     def __repr__(self):
         return self.__str__()
-    
+
     def __len__(self):
-        self.remove_left_guild_players()
-        return len(self._userid_list)
-    
+        return len(self._joined)
+
     def __iter__(self):
-        self.remove_left_guild_players()
-        return iter(self._userid_list)
+        return iter(list(self._joined))
+
+    def __contains__(self, userid):
+        return int(userid) in self._joined
 
     def remove_left_guild_players(self):
-        for userid in self._userid_list:
-            fetched_member = globvars.client.get_guild(SERVER_ID).get_member(int(userid))
-            if fetched_member == None:
-                #User left server
-                self._userid_list.remove(userid)
+        """Remove the users who have left the guild (see MembershipTracker). Players
+        leaving are normally removed by the on_member_remove listener already.
+        """
+        departed = globvars.master_state.membership.departed_among(list(self._joined) + list(self._waiting))
+        for userid in departed:
+            self.remove_player(userid)
+            self.unqueue_player(userid)
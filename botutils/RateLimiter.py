@@ -0,0 +1,172 @@
+"""Contains the RateLimiter and IgnoreList classes"""
+
+import time
+from discord.ext import commands
+from .settings import settings
+
+Preferences = settings.preferences
+
+TOKENS_GIVEN = int(Preferences["duration"]["TOKENS_GIVEN"])
+TOKEN_RESET = int(Preferences["duration"]["TOKEN_RESET"])
+IGNORE_THRESHOLD = int(Preferences["duration"]["IGNORE_THRESHOLD"])
+AUTO_IGNORE = Preferences.getint("duration", "AUTO_IGNORE", fallback = 600)
+AUTO_IGNORE_MAX = Preferences.getint("duration", "AUTO_IGNORE_MAX", fallback = 86400)
+STRIKES_RESET = Preferences.getint("duration", "STRIKES_RESET", fallback = 86400)
+
+
+class RateLimited(commands.CheckFailure):
+    """A user has used the same command too often. The command is dropped silently."""
+    pass
+
+
+class RateLimiter:
+    """Token buckets, one per key (user ID, or user ID and command name).
+
+    A bucket holds up to `capacity` tokens and gets `capacity` tokens back every `period`
+    seconds. The refill is computed from the time of the last use when the bucket is
+    used again, so nothing runs while the bot is idle. A bucket left unused for a whole
+    period is full, the same as a missing one: such buckets are evicted by the next use
+    of the limiter, at most once per period. Memory is bounded by the number of keys
+    used during the last period.
+    """
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.period = period
+        self._rate = capacity / period  # Tokens per second
+        self._buckets = {}  # {key : (tokens, time of the last use)}
+        self._last_sweep = time.monotonic()
+
+    def consume(self, key, now = None):
+        """Take a token from the bucket of a key. Return False if the bucket is empty."""
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_sweep >= self.period:
+            self.evict_idle(now)
+        tokens, last_use = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last_use) * self._rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return False
+        self._buckets[key] = (tokens - 1, now)
+        return True
+
+    def evict_idle(self, now = None):
+        """Drop the buckets which have been refilled to capacity"""
+        if now is None:
+            now = time.monotonic()
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if now - bucket[1] < self.period}
+        self._last_sweep = now
+
+    def reset(self, key):
+        self._buckets.pop(key, None)
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def __repr__(self):
+        return f"<RateLimiter {self.capacity} per {self.period}s, {len(self)} buckets>"
+
+
+class IgnoreList:
+    """IDs of the users ignored by the bot, in a set for an O(1) check on every command.
+
+    The users ignored by an admin stay ignored until an admin removes them; they are
+    the ones backed up in ignore.csv. The users ignored for going over the rate limit
+    are ignored for a while: the duration doubles with every offence, up to a maximum,
+    and the offences are forgotten after some time without any. The expired ignores are
+    dropped when they are checked. The changes of the admin ignores are written behind
+    to the backup file, if any (see FileBackup).
+    """
+
+    def __init__(self, duration = AUTO_IGNORE, max_duration = AUTO_IGNORE_MAX, strikes_reset = STRIKES_RESET,
+                 backup = None):
+        self.backup = backup
+        self.duration = duration
+        self.max_duration = max_duration
+        self.strikes_reset = strikes_reset
+        self._manual = set()
+        self._auto = {}  # {user ID : end of the ignore}
+        self._strikes = {}  # {user ID : (number of offences, time of the last offence)}
+
+    @property
+    def manual(self):
+        """User IDs ignored by an admin"""
+        return sorted(self._manual)
+
+    def load(self):
+        """Replace the admin ignores with the content of the backup file"""
+        self._manual = set(self.backup.load()) if self.backup else set()
+
+    def _changed(self):
+        if self.backup:
+            self.backup.changed(self.manual)
+
+    def add(self, user_id):
+        """Ignore a user until they are removed"""
+        user_id = int(user_id)
+        if user_id not in self._manual:
+            self._manual.add(user_id)
+            self._changed()
+
+    def remove(self, user_id):
+        """Stop ignoring a user, whether they have been ignored by an admin or automatically"""
+        user_id = int(user_id)
+        self._auto.pop(user_id, None)
+        self._strikes.pop(user_id, None)
+        if user_id in self._manual:
+            self._manual.discard(user_id)
+            self._changed()
+
+    def auto_ignore(self, user_id, now = None):
+        """Ignore a user for going over the rate limit. Return the duration in seconds."""
+        user_id = int(user_id)
+        if now is None:
+            now = time.monotonic()
+        # Forget the old offences, of this user and of the others
+        self._strikes = {
+            key: strike for key, strike in self._strikes.items() if now - strike[1] < self.strikes_reset
+        }
+        nb_strikes = self._strikes.get(user_id, (0, now))[0] + 1
+        self._strikes[user_id] = (nb_strikes, now)
+        duration = min(self.duration * 2 ** (nb_strikes - 1), self.max_duration)
+        self._auto[user_id] = now + duration
+        return duration
+
+    def clear(self):
+        self._manual.clear()
+        self._auto.clear()
+        self._strikes.clear()
+        self._changed()
+
+    def _active_auto(self):
+        now = time.monotonic()
+        self._auto = {user_id: end for user_id, end in self._auto.items() if end > now}
+        return self._auto
+
+    def __contains__(self, user_id):
+        user_id = int(user_id)
+        if user_id in self._manual:
+            return True
+        end = self._auto.get(user_id)
+        if end is None:
+            return False
+        if end > time.monotonic():
+            return True
+        del self._auto[user_id]
+        return False
+
+    def __iter__(self):
+        return iter(sorted(self._manual.union(self._active_auto())))
+
+    def __len__(self):
+        return len(self._manual.union(self._active_auto()))
+
+    def __repr__(self):
+        return f"<IgnoreList {len(self._manual)} ignored, {len(self._auto)} rate limited>"
+
+
+# Every command used by a user takes a token; running out of them gets the user ignored
+user_limiter = RateLimiter(IGNORE_THRESHOLD, TOKEN_RESET)
+# Every use of a command takes a token from the user's bucket for that command
+command_limiter = RateLimiter(TOKENS_GIVEN, TOKEN_RESET)
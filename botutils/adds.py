@@ -1,16 +1,16 @@
 """Contains functions to handle roles and permissions"""
 
-import configparser
 import json
 import traceback
 
 import discord
 
 import globvars
-from .sends import Level, log
+from .logsink import Level
+from .sends import log
+from .settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 LOBBY_CHANNEL_ID = Config["user"]["LOBBY_CHANNEL_ID"]
 SERVER_ID = Config["user"]["SERVER_ID"]
@@ -20,6 +20,8 @@ ADMINS_ROLE_ID = Config["user"]["ADMINS_ROLE_ID"]
 LOCK_CHANNELS_ID = json.loads(Config["user"].get("LOCK_CHANNELS_ID", "[]"))
 LOCK_CHANNELS_SPECIAL_ID = json.loads(Config["user"].get("LOCK_CHANNELS_SPECIAL_ID", "[]"))
 
+queue_promoted = settings.bot_text["cmd"]["queue_promoted"]
+
 
 async def add_admin_role(user):
     """Grant the admin role to a member"""
@@ -97,6 +99,23 @@ async def remove_all_alive_dead_roles_after_game():
             await remove_dead_role(player.user)
 
 
+async def promote_waiting_players(capacity):
+    """Move the first players of the waiting list into the lobby, up to a number of
+    players, give them the alive role and announce them. Return their user IDs.
+    """
+    from .helpers import make_ping
+    from .sends import send_lobby
+    pregame = globvars.master_state.pregame
+    promoted = pregame.promote_waiting(capacity)
+    if promoted:
+        for userid in promoted:
+            member_obj = globvars.client.get_guild(int(SERVER_ID)).get_member(int(userid))
+            if member_obj:
+                await add_alive_role(member_obj)
+        await send_lobby(queue_promoted.format(" ".join(make_ping(userid) for userid in promoted), len(pregame)))
+    return promoted
+
+
 async def lock_lobby():
     """Lock the lobby channel from non players"""
     server = globvars.client.get_guild(int(SERVER_ID))
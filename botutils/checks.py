@@ -1,12 +1,12 @@
 """Contains checks"""
 
-import configparser
 import json
 import botutils
 import globvars
+from .RateLimiter import command_limiter, RateLimited
+from .settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 LOBBY_CHANNEL_ID = Config["user"]["LOBBY_CHANNEL_ID"]
 SPEC_CHANNEL_ID = Config["user"]["SPEC_CHANNEL_ID"]
@@ -96,6 +96,17 @@ def check_if_not_ignored(ctx):
         return not ctx.author.id in globvars.ignore_list
 
 
+def check_command_rate(ctx):
+    """Take a token from the author's bucket for the command. Raise RateLimited if they
+    have used it too often, so that the command is dropped without an error message.
+    """
+    if __is_admin(ctx):
+        return True
+    if not command_limiter.consume((ctx.author.id, ctx.command.qualified_name)):
+        raise RateLimited()
+    return True
+
+
 def return_false(ctx):
     """Always return false. Use for debugging/testing"""
     return False
@@ -1,16 +1,17 @@
 """Contains other helper functions"""
 
-import configparser
 import datetime
+import os
 import re
+import sys
 
 import emoji
 
 import globvars
+from .settings import settings
 
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 SERVER_ID = Config["user"]["SERVER_ID"]
 ALIVE_ROLE_ID = Config["user"]["ALIVE_ROLE_ID"]
@@ -72,27 +73,30 @@ def update_state_machine():
 def find_role_in_all(role_name):
     """
     Find a role name amongst all the loaded game packs. 
-    Return the role class if it is found, else return None
+    Return the role object if it is found, else return None
 
     The game_packs variable is coded in the following way:
 
     {'botc': {'game_obj': <botc.Game.Game object at 0x1187bffd0>, 'gamemodes': {'trouble-brewing': 
-    [Baron Obj, Butler Obj, Chef Obj, Drunk Obj, Empath Obj, Fortune Teller Obj, Imp Obj, 
-    Investigator Obj, Librarian Obj, Mayor Obj, Monk Obj, Poisoner Obj, Ravenkeeper Obj, 
-    Recluse Obj, Saint Obj, Scarlet Woman Obj, Slayer Obj, Soldier Obj, Undertaker Obj, 
-    Virgin Obj, Washerwoman Obj]}}}
+    <EditionPack trouble-brewing (22 characters, not loaded)>, ...}}}
+
+    Only the names from the edition manifests are searched, so that the module of the
+    matching character is the only one that gets imported.
     """
     match = None
     for game_pack_title in globvars.master_state.game_packs:
         pack_content = globvars.master_state.game_packs[game_pack_title]
         for gamemode_title in pack_content["gamemodes"]:
-            gamemode_content = pack_content["gamemodes"][gamemode_title]
-            for role in gamemode_content:
-                if role_name.lower() == role.name.lower():
-                    return role
-                elif role_name.lower() in role.name.lower() and not match:
-                    match = role
-    return match
+            edition_pack = pack_content["gamemodes"][gamemode_title]
+            for name in edition_pack.role_names:
+                if role_name.lower() == name.lower():
+                    return edition_pack.get_role(name)
+                elif role_name.lower() in name.lower() and not match:
+                    match = (edition_pack, name)
+    if match:
+        edition_pack, name = match
+        return edition_pack.get_role(name)
+    return None
 
 
 def get_emoji(s):
@@ -105,3 +109,19 @@ def get_emoji(s):
             return str(em)
         else:
             return None
+
+
+async def restart_process():
+    """Restart the bot in place. os.execl doesn't run the atexit functions: everything
+    that is written behind (the ignore and notify lists, the game record, the logs) is
+    written out first.
+    """
+    from .logsink import shutdown_logging
+    globvars.ignore_list.backup.write_pending()
+    globvars.notify_list.backup.write_pending()
+    game = globvars.master_state.game
+    if game is not None and game.recorder is not None:
+        game.recorder.close()
+        game.recorder.wait()
+    await shutdown_logging()
+    os.execl(sys.executable, sys.executable, *sys.argv)
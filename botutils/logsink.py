@@ -0,0 +1,248 @@
+"""Contains the logging pipeline: the local logging through a queue, with a JSON log file,
+and the LogChannelSink, batching the entries sent to the log channel
+"""
+
+import asyncio
+import atexit
+import collections
+import contextvars
+import enum
+import io
+import json
+import logging
+import logging.handlers
+import queue
+import discord
+from .helpers import make_ping
+from .settings import settings
+
+Config = settings.config
+
+LOGGING_CHANNEL_ID = int(Config["user"]["LOGGING_CHANNEL_ID"])
+OWNER_ID = int(Config["user"]["OWNER_ID"])
+MAX_MESSAGE_LEN = int(Config["misc"]["MAX_MESSAGE_LEN"])
+
+Preferences = settings.preferences
+
+JSON_LOG_FILE = Preferences.get("logging", "JSON_LOG_FILE", fallback = "bot_log.jsonl")
+JSON_LOG_MAX_BYTES = Preferences.getint("logging", "JSON_LOG_MAX_BYTES", fallback = 5_000_000)
+LOG_FLUSH_INTERVAL = Preferences.getfloat("logging", "LOG_FLUSH_INTERVAL", fallback = 2)
+LOG_MAX_MESSAGES = Preferences.getint("logging", "LOG_MAX_MESSAGES", fallback = 3)
+LOG_BUFFER_SIZE = Preferences.getint("logging", "LOG_BUFFER_SIZE", fallback = 1000)
+
+logger = logging.getLogger("botutils.log")
+
+
+class Level(enum.Enum):
+    """Level of logging"""
+    info = "[INFO]"
+    warning = "**[WARNING]**"
+    error = "**[ERROR]**"
+
+
+_LOGGING_LEVELS = {
+    Level.info: logging.INFO,
+    Level.warning: logging.WARNING,
+    Level.error: logging.ERROR
+}
+
+
+# ========== LOCAL LOGGING =========================================================
+# ----------------------------------------------------------------------------------
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the phase ID of the game in progress if any"""
+
+    def format(self, record):
+        entry = {
+            "t": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if getattr(record, "phase_id", None) is not None:
+            entry["phase"] = record.phase_id
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default = str)
+
+
+class GamePhaseFilter(logging.Filter):
+    """Tag the records with the phase ID of the game in progress. Runs in the thread
+    logging the record, where the game state can be read.
+    """
+
+    def filter(self, record):
+        import globvars
+        master_state = getattr(globvars, "master_state", None)
+        game = master_state.game if master_state else None
+        record.phase_id = game._chrono.phase_id if game else None
+        return True
+
+
+_listener = None
+
+
+def setup_local_logging(level = logging.INFO):
+    """Send the log records through a queue to the console, in the usual format, and to
+    the JSON log file. The handlers run in the queue listener's thread, so logging
+    never waits on the terminal or the disk.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)-8s %(message)s",
+        datefmt = "%a, %d %b %Y %H:%M:%S"
+    ))
+    handlers = [console]
+    if JSON_LOG_FILE:
+        json_file = logging.handlers.RotatingFileHandler(
+            JSON_LOG_FILE,
+            maxBytes = JSON_LOG_MAX_BYTES,
+            backupCount = 3,
+            encoding = "utf-8"
+        )
+        json_file.setFormatter(JsonFormatter())
+        handlers.append(json_file)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(GamePhaseFilter())
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level = True)
+    _listener.start()
+    atexit.register(stop_local_logging)
+
+
+def stop_local_logging():
+    """Write out the records left in the queue and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# ========== LOG CHANNEL ===========================================================
+# ----------------------------------------------------------------------------------
+
+class LogChannelSink:
+    """Buffer of the entries for the log channel.
+
+    put() returns at once; a background task sends the buffered entries every
+    `interval` seconds, packed into at most `max_messages` messages. The entries too
+    long for a message, and the ones that don't fit, are sent in a text file attached
+    to one more message. The buffer is bounded: when the log channel can't keep up,
+    the oldest entries are dropped from it (they are still in the local logs).
+    """
+
+    def __init__(self, interval = LOG_FLUSH_INTERVAL, max_messages = LOG_MAX_MESSAGES, size = LOG_BUFFER_SIZE):
+        self.interval = interval
+        self.max_messages = max_messages
+        self._entries = collections.deque(maxlen = size)  # [(Level, message)]
+        self._dropped = 0
+        self._task = None
+
+    def put(self, level, message):
+        """Add an entry to the buffer, and to the local logs"""
+        logger.log(_LOGGING_LEVELS[level], message)
+        if len(self._entries) == self._entries.maxlen:
+            self._dropped += 1
+        self._entries.append((level, message))
+        if self._task is None or self._task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            # In an empty context, so that the sends aren't timed as part of the
+            # command that logged the entry (see CommandProfiler)
+            self._task = contextvars.Context().run(loop.create_task, self._flush_later())
+
+    async def _flush_later(self):
+        while self._entries:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Could not send the log entries to the log channel")
+
+    @staticmethod
+    def _render(level, message):
+        if level == Level.error:
+            return f"{level.value} {make_ping(OWNER_ID)}\n```python\n{message}```"
+        return f"{level.value} {message}"
+
+    def _batch(self, entries):
+        """Pack the entries into messages under the length limit. Return the messages
+        and the entries left for the attachment.
+        """
+        max = MAX_MESSAGE_LEN - 50
+        messages = []
+        attached = []
+        for level, message in entries:
+            text = self._render(level, message)
+            if len(text) > max:
+                attached.append((level, message))
+            elif messages and len(messages[-1]) + 1 + len(text) <= max:
+                messages[-1] += "\n" + text
+            elif len(messages) < self.max_messages:
+                messages.append(text)
+            else:
+                attached.append((level, message))
+        return messages, attached
+
+    async def flush(self):
+        """Send the buffered entries to the log channel. They are kept in the buffer
+        while the channel is unavailable (ex. before the client is ready).
+        """
+        import globvars
+
+        client = getattr(globvars, "client", None)
+        log_channel = client.get_channel(LOGGING_CHANNEL_ID) if client else None
+        if not self._entries or log_channel is None:
+            return
+        entries = list(self._entries)
+        self._entries.clear()
+        dropped, self._dropped = self._dropped, 0
+
+        messages, attached = self._batch(entries)
+        for msg in messages:
+            await log_channel.send(msg)
+
+        if attached or dropped:
+            header = f"{len(attached)} log entries attached."
+            if dropped:
+                header += f" {dropped} entries dropped (see the local logs)."
+            if any(level == Level.error for level, _ in attached):
+                header = f"{Level.error.value} {make_ping(OWNER_ID)} {header}"
+            else:
+                header = f"{Level.info.value} {header}"
+            content = "\n\n".join(f"[{level.name.upper()}] {message}" for level, message in attached)
+            log_file = discord.File(io.BytesIO(content.encode("utf-8")), filename = "log.txt") if attached else None
+            await log_channel.send(header, file = log_file)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<LogChannelSink {len(self)} entries buffered>"
+
+
+log_sink = LogChannelSink()
+
+
+async def shutdown_logging():
+    """Send what is left in the log channel buffer and stop the local logging. To be
+    awaited before restarting the bot with os.execl, which doesn't run the atexit
+    functions.
+    """
+    try:
+        await log_sink.flush()
+    except Exception:
+        logger.exception("Could not send the log entries to the log channel")
+    stop_local_logging()
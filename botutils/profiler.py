@@ -0,0 +1,300 @@
+"""Contains the command profiler, to measure command latency and throughput"""
+
+import collections
+import contextvars
+import cProfile
+import enum
+import functools
+import io
+import pstats
+import time
+from .settings import settings
+
+Preferences = settings.preferences
+
+PROFILE_COMMANDS = Preferences.get("profiler", "PROFILE_COMMANDS", fallback = "true").lower() == "true"
+HISTORY_SIZE = Preferences.getint("profiler", "HISTORY_SIZE", fallback = 500)
+SLOWEST_KEPT = Preferences.getint("profiler", "SLOWEST_KEPT", fallback = 10)
+
+# The invocation record of the command being processed in the current asyncio task
+_current_record = contextvars.ContextVar("current_command_record", default = None)
+
+
+class Stage(enum.Enum):
+    """Stages of a command invocation:
+    checks: global, cog and command checks
+    converters: argument converters (PlayerParser, RoleConverter, etc.)
+    handler: the command callback, minus the time spent sending messages
+    sends: outbound messages sent while the command is being processed
+    """
+
+    checks = "checks"
+    converters = "converters"
+    handler = "handler"
+    sends = "sends"
+
+
+class InvocationRecord:
+    """Timings of a single command invocation"""
+
+    def __init__(self, command_name, extension_name, author_id):
+        self.command_name = command_name
+        self.extension_name = extension_name
+        self.author_id = author_id
+        self.started_at = time.time()
+        self.stages = dict.fromkeys(Stage, 0.0)
+        self.total = 0.0
+        self.failed = False
+        self._start = time.perf_counter()
+        self._handler_start = None
+        self._converters_before_handler = 0.0
+
+    def add(self, stage, duration):
+        """Add a duration (in seconds) to a stage"""
+        self.stages[stage] += duration
+
+    def mark_handler_start(self):
+        """Called right before the command callback. Checks and converters are done.
+        A group invoking a subcommand calls it again, before the subcommand callback:
+        the handler stage then runs from the group callback to the end.
+        """
+        if self._handler_start is not None:
+            return
+        now = time.perf_counter()
+        self._handler_start = now
+        self._converters_before_handler = self.stages[Stage.converters]
+        self.stages[Stage.checks] = max(now - self._start - self.stages[Stage.converters], 0.0)
+        # Sends made by checks or converters (ex. PlayerParser errors) are not handler time
+        self.stages[Stage.sends] = 0.0
+
+    def finish(self, command_name):
+        """Called when the invocation is over, after the (last) callback or on an error.
+        An invocation that failed in the checks or the converters has no handler stage.
+        """
+        now = time.perf_counter()
+        self.command_name = command_name
+        self.total = now - self._start
+        if self._handler_start is None:
+            self.stages[Stage.checks] = max(self.total - self.stages[Stage.converters], 0.0)
+        else:
+            # The converters of a subcommand run after the group callback
+            converters = self.stages[Stage.converters] - self._converters_before_handler
+            self.stages[Stage.handler] = max(now - self._handler_start - self.stages[Stage.sends] - converters, 0.0)
+
+    def __repr__(self):
+        failed = " (failed)" if self.failed else ""
+        return f"{self.command_name} ({self.extension_name}) in {self.total * 1000:.1f} ms{failed}"
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class CommandProfiler:
+    """Collect timing records for every command invocation, grouped by command and by
+    extension (cmd.gameplay, botc.commands.townhall, botc.commands.abilities.tb, ...)
+    """
+
+    def __init__(self, history_size = HISTORY_SIZE, slowest_kept = SLOWEST_KEPT):
+        self.history_size = history_size
+        self.slowest_kept = slowest_kept
+        self.enabled = PROFILE_COMMANDS
+        self._client = None
+        self._cprofile = None
+        self._nb_active = 0  # Invocation records started and not finished yet
+        self._original_send = None  # Messageable.send, while it is wrapped
+        self.reset()
+
+    def reset(self):
+        """Forget all the collected records"""
+        self._by_command = collections.defaultdict(lambda: collections.deque(maxlen = self.history_size))
+        self._by_extension = collections.defaultdict(lambda: collections.deque(maxlen = self.history_size))
+        self._recent = collections.deque(maxlen = self.history_size)
+        self._counts = collections.Counter()
+        self._since = time.time()
+
+    # -------------------- Bot hooks --------------------
+
+    def install(self, client):
+        """Register the profiling hooks on the bot. Must only be used by main.py. The
+        failed invocations are recorded by the on_command_error listener (see
+        record_error).
+        """
+        self._client = client
+        client.add_check(self._start_record, call_once = True)
+        client.before_invoke(self._before_invoke)
+        client.after_invoke(self._after_invoke)
+
+    def _wrap_sends(self):
+        """Time the sends of the commands being recorded. Messageable.send is only
+        wrapped while an invocation record is active.
+        """
+        import discord
+
+        original_send = self._original_send = discord.abc.Messageable.send
+
+        @functools.wraps(original_send)
+        async def timed_send(messageable, *args, **kwargs):
+            record = _current_record.get()
+            if record is None:
+                return await original_send(messageable, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return await original_send(messageable, *args, **kwargs)
+            finally:
+                record.add(Stage.sends, time.perf_counter() - start)
+
+        discord.abc.Messageable.send = timed_send
+
+    def _unwrap_sends(self):
+        import discord
+        discord.abc.Messageable.send = self._original_send
+        self._original_send = None
+
+    def _find_extension(self, command):
+        """Find the name of the loaded extension a command comes from"""
+        module = command.module or ""
+        matches = [name for name in self._client.extensions if module == name or module.startswith(name + ".")]
+        if matches:
+            return max(matches, key = len)
+        return module
+
+    def _start_record(self, ctx):
+        """Global call_once check: the very first hook that runs in the invocation task"""
+        if self.enabled and ctx.command is not None:
+            record = InvocationRecord(
+                ctx.command.qualified_name,
+                self._find_extension(ctx.command),
+                ctx.author.id
+            )
+            _current_record.set(record)
+            if self._nb_active == 0:
+                self._wrap_sends()
+            self._nb_active += 1
+        return True
+
+    async def _before_invoke(self, ctx):
+        record = _current_record.get()
+        if record is not None:
+            record.mark_handler_start()
+
+    async def _after_invoke(self, ctx):
+        # A group runs the hooks around its own callback, then around its subcommand's
+        if ctx.invoked_subcommand is not None and ctx.invoked_subcommand is not ctx.command:
+            return
+        record = _current_record.get()
+        if record is None or record._handler_start is None:
+            return
+        record.failed = ctx.command_failed
+        self._finish_record(record, ctx)
+
+    def record_error(self, ctx):
+        """Record an invocation that failed before the end of its callback (ex. in a
+        check or a converter). Called by the on_command_error listener.
+        """
+        record = _current_record.get()
+        if record is None:
+            return
+        record.failed = True
+        self._finish_record(record, ctx)
+
+    def _finish_record(self, record, ctx):
+        _current_record.set(None)
+        record.finish(ctx.command.qualified_name if ctx.command else record.command_name)
+        self._nb_active -= 1
+        if self._nb_active == 0 and self._original_send is not None:
+            self._unwrap_sends()
+        self.add_record(record)
+
+    def add_record(self, record):
+        """Store a finished invocation record"""
+        self._by_command[record.command_name].append(record)
+        self._by_extension[record.extension_name].append(record)
+        self._recent.append(record)
+        self._counts[record.command_name] += 1
+
+    # -------------------- Reports --------------------
+
+    @staticmethod
+    def _summarize(records):
+        """Compute count, percentiles of the total time and mean time per stage"""
+        totals = sorted(record.total for record in records)
+        n = len(totals)
+        stage_means = {
+            stage: sum(record.stages[stage] for record in records) / n if n else 0.0
+            for stage in Stage
+        }
+        return {
+            "count": n,
+            "failed": sum(record.failed for record in records),
+            "p50": percentile(totals, 50),
+            "p95": percentile(totals, 95),
+            "p99": percentile(totals, 99),
+            "stages": stage_means
+        }
+
+    def command_summaries(self):
+        """Return {command name: summary}, most used commands first"""
+        return {
+            name: self._summarize(self._by_command[name])
+            for name, _ in self._counts.most_common()
+        }
+
+    def extension_summaries(self):
+        """Return {extension name: summary}"""
+        return {name: self._summarize(records) for name, records in sorted(self._by_extension.items())}
+
+    def slowest(self, limit = None):
+        """Return the slowest recent invocations"""
+        limit = limit or self.slowest_kept
+        return sorted(self._recent, key = lambda record: record.total, reverse = True)[:limit]
+
+    def throughput(self):
+        """Return the number of commands per minute since the last reset"""
+        elapsed = max(time.time() - self._since, 1)
+        return sum(self._counts.values()) * 60 / elapsed
+
+    # -------------------- cProfile --------------------
+
+    def is_capturing(self):
+        """Is a cProfile capture currently running?"""
+        return self._cprofile is not None
+
+    def start_capture(self):
+        """Start a cProfile capture of the whole event loop thread"""
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop_capture(self, sort_by = "cumulative", limit = 40):
+        """Stop the cProfile capture and return the formatted stats"""
+        self._cprofile.disable()
+        stream = io.StringIO()
+        pstats.Stats(self._cprofile, stream = stream).strip_dirs().sort_stats(sort_by).print_stats(limit)
+        self._cprofile = None
+        return stream.getvalue()
+
+
+def profiled_stage(stage):
+    """Decorator for async functions (such as converters) whose duration is added to
+    a stage of the command currently being processed
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def inner(*args, **kwargs):
+            record = _current_record.get()
+            if record is None:
+                return await func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                record.add(stage, time.perf_counter() - start)
+        return inner
+    return decorator
+
+
+command_profiler = CommandProfiler()
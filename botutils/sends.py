@@ -1,48 +1,28 @@
 """Contains functions to send messages"""
 
-import configparser
-import enum
-import json
+import asyncio
 import globvars
 from .helpers import make_ping
+from .logsink import log_sink
+from .settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 SERVER_ID = Config["user"]["SERVER_ID"]
 SERVER_ID = int(SERVER_ID)
 LOBBY_CHANNEL_ID = Config["user"]["LOBBY_CHANNEL_ID"]
 LOBBY_CHANNEL_ID = int(LOBBY_CHANNEL_ID)
-LOGGING_CHANNEL_ID = Config["user"]["LOGGING_CHANNEL_ID"]
-LOGGING_CHANNEL_ID = int(LOGGING_CHANNEL_ID)
-OWNER_ID = Config["user"]["OWNER_ID"]
-OWNER_ID = int(OWNER_ID)
 MAX_MESSAGE_LEN = Config["misc"]["MAX_MESSAGE_LEN"]
 MAX_MESSAGE_LEN = int(MAX_MESSAGE_LEN)
 
+Preferences = settings.preferences
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+PING_CHUNK_DELAY = Preferences.getfloat("duration", "PING_CHUNK_DELAY", fallback = 1)
 
-stats_pregame_header = language["cmd"]["stats_pregame_header"]
-
-
-class Level(enum.Enum):
-    """Level of logging"""
-    info = "[INFO]"
-    warning = "**[WARNING]**"
-    error = "**[ERROR]**"
 
+language = settings.bot_text
 
-async def __send_log(message):
-    """Send a message to the logs"""
-    log_channel = globvars.client.get_channel(int(LOGGING_CHANNEL_ID))
-    await log_channel.send(message)
-
-
-def __create_python_code_block(message):
-    """Create a python code block"""
-    return f"```python\n{message}```"
+stats_pregame_header = language["cmd"]["stats_pregame_header"]
 
 
 def create_code_block(message):
@@ -63,35 +43,39 @@ async def send_pregame_stats(ctx, id_list):
     await ctx.send(msg)
 
 
-async def __send_long_error(post, depth=0):
-    """Send a message and break it down if it goes over the Discord message limit"""
+async def send_pings(destination, header, user_ids):
+    """Send a header followed by the pings of users, split into as many messages as
+    needed to stay under the message length limit. The messages are sent one after the
+    other, PING_CHUNK_DELAY seconds apart, so that a long list of pings doesn't burst
+    through the channel's rate limit.
+    """
     max = int(MAX_MESSAGE_LEN) - 50
-    if len(post) <= max:
-        if depth:
-            await __send_log("[CONTINUED] " + "```py\n" + post[:max])
-        else:
-            await __send_log(post)
-            return
-    else:
-        if depth:
-            await __send_log("[CONTINUED] " + "```py\n" + post[:max] + "```")
-        else:
-            await __send_log(post[:max] + "```")
-        await __send_long_error(post[max:], depth + 1)
+    msg = header
+    sent = False
+    for userid in user_ids:
+        ping = " " + make_ping(userid)
+        if len(msg) + len(ping) > max:
+            await destination.send(msg)
+            await asyncio.sleep(PING_CHUNK_DELAY)
+            msg = header
+            sent = True
+        msg += ping
+    if msg != header or not sent:
+        await destination.send(msg)
 
 
 async def log(level, message):
-    """Send a message to the logs with a header"""
-    if level == Level.error:
-        msg = f"{level.value} {make_ping(OWNER_ID)}\n{__create_python_code_block(message)}"
-        await __send_long_error(msg)
-    else:
-        msg = f"{level.value} {message}"
-        await __send_log(msg)
+    """Send a message to the logs with a header. Returns at once: the message is sent
+    with the others in the next batch (see LogChannelSink).
+    """
+    log_sink.put(level, message)
 
 
 async def send_lobby(message, embed = None, file = None, delete_after = None):
     """Send a message to the lobby"""
+    # The headless games (see botc/replay.py) run without a Discord client
+    if globvars.client is None:
+        return None
     lobby_channel = globvars.client.get_channel(int(LOBBY_CHANNEL_ID))
     ret = await lobby_channel.send(message, embed = embed, file = file, delete_after = delete_after)
     return ret
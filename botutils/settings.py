@@ -0,0 +1,288 @@
+"""Contains the settings registry: config.INI, preferences.INI and the text files,
+parsed once and shared by all modules as read-only views
+"""
+
+import collections.abc
+import configparser
+import json
+import inspect
+import os
+import pickle
+import sys
+import types
+
+CONFIG_FILE = "config.INI"
+PREFERENCES_FILE = "preferences.INI"
+GAME_TEXT_FILE = "botc/game_text.json"
+BOT_TEXT_FILE = "botutils/bot_text.json"
+
+# Parsed content of all the files, pickled. Only used if enabled in preferences.INI
+CACHE_FILE = ".settings.cache"
+CACHE_VERSION = 1
+
+_UNSET = object()
+
+
+def freeze(data):
+    """Recursively turn the parsed json data into read-only mappings and tuples"""
+    if isinstance(data, dict):
+        return types.MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def parse_ini(path):
+    """Parse an INI file into {section: {option: value}}, defaults included"""
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    return {section: dict(parser[section]) for section in parser.sections()}
+
+
+def parse_json(path):
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def _read_by_module_code():
+    """Is the setting being read by module or class level code (ex. a constant set at
+    import), rather than by a function? The frames of the registry itself are skipped.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    return frame is not None and not frame.f_code.co_flags & inspect.CO_OPTIMIZED
+
+
+def file_signature(path):
+    """Modification time and size of a file, None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class ConfigSection(collections.abc.Mapping):
+    """Read-only section of an INI file. Option names are case insensitive,
+    like in configparser.
+    """
+
+    def __init__(self, name, options):
+        self.name = name
+        self._options = {option.lower(): value for option, value in options.items()}
+
+    def __getitem__(self, option):
+        return self._options[option.lower()]
+
+    def __iter__(self):
+        return iter(self._options)
+
+    def __len__(self):
+        return len(self._options)
+
+    def __repr__(self):
+        return f"<ConfigSection [{self.name}]>"
+
+
+class ConfigView:
+    """Read-only view of an INI file of the registry, with the typed getters of
+    configparser. Always reflects the last (re)load of the file.
+    """
+
+    BOOLEAN_STATES = configparser.ConfigParser.BOOLEAN_STATES
+
+    def __init__(self, registry, path):
+        self._registry = registry
+        self._path = path
+
+    @property
+    def _sections(self):
+        return self._registry._content[self._path]
+
+    def __getitem__(self, section):
+        if _read_by_module_code():
+            self._registry._copied.add((self._path, section))
+        return self._sections[section]
+
+    def __contains__(self, section):
+        return section in self._sections
+
+    def sections(self):
+        return list(self._sections)
+
+    def has_option(self, section, option):
+        return section in self._sections and option in self._sections[section]
+
+    def get(self, section, option, *, fallback = _UNSET):
+        if _read_by_module_code():
+            self._registry._copied.add((self._path, section, option.lower()))
+        try:
+            return self._sections[section][option]
+        except KeyError:
+            if fallback is _UNSET:
+                raise
+            return fallback
+
+    def _get_converted(self, converter, section, option, fallback):
+        value = self.get(section, option, fallback = _UNSET if fallback is _UNSET else None)
+        if value is None:
+            return fallback
+        return converter(value)
+
+    def getint(self, section, option, *, fallback = _UNSET):
+        return self._get_converted(int, section, option, fallback)
+
+    def getfloat(self, section, option, *, fallback = _UNSET):
+        return self._get_converted(float, section, option, fallback)
+
+    def getboolean(self, section, option, *, fallback = _UNSET):
+        def to_boolean(value):
+            if value.lower() not in self.BOOLEAN_STATES:
+                raise ValueError(f"Not a boolean: {value}")
+            return self.BOOLEAN_STATES[value.lower()]
+        return self._get_converted(to_boolean, section, option, fallback)
+
+    def __repr__(self):
+        return f"<ConfigView {self._path}>"
+
+
+class TextView(collections.abc.Mapping):
+    """Read-only view of a json text file of the registry. Always reflects the last
+    (re)load of the file. Nested objects are read-only mappings, arrays are tuples.
+    """
+
+    def __init__(self, registry, path):
+        self._registry = registry
+        self._path = path
+
+    @property
+    def _data(self):
+        return self._registry._content[self._path]
+
+    def __getitem__(self, key):
+        if _read_by_module_code():
+            self._registry._copied.add((self._path, key))
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"<TextView {self._path}>"
+
+
+class Settings:
+    """Registry of the bot settings and strings. Each file is parsed once, the modules
+    share the same read-only views (settings.config, settings.preferences,
+    settings.game_text, settings.bot_text).
+
+    Values copied into module level constants at import keep the value they had at
+    startup; code reading the views when it runs picks up a reload(). The registry notes
+    the settings read by module and class level code, so that reload() can tell which
+    changes are only applied at the next restart.
+    """
+
+    def __init__(self):
+        self._parsers = {
+            CONFIG_FILE: parse_ini,
+            PREFERENCES_FILE: parse_ini,
+            GAME_TEXT_FILE: parse_json,
+            BOT_TEXT_FILE: parse_json
+        }
+        self._content = {}
+        self._signatures = {}
+        self._copied = set()  # {(path, section) or (path, section, option) or (path, key)}
+        self.config = ConfigView(self, CONFIG_FILE)
+        self.preferences = ConfigView(self, PREFERENCES_FILE)
+        self.game_text = TextView(self, GAME_TEXT_FILE)
+        self.bot_text = TextView(self, BOT_TEXT_FILE)
+        self.load()
+
+    @staticmethod
+    def _freeze(path, parsed):
+        if path.endswith(".INI"):
+            return {section: ConfigSection(section, options) for section, options in parsed.items()}
+        return freeze(parsed)
+
+    @staticmethod
+    def _use_cache(preferences):
+        """Is the binary cache enabled in the parsed preferences.INI?"""
+        return preferences.get("settings", {}).get("binary_cache", "false").lower() == "true"
+
+    def _read_cache(self, signatures):
+        """Return the cached parsed content if the files have not changed since"""
+        try:
+            with open(CACHE_FILE, "rb") as cache_file:
+                cached = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if cached.get("version") != CACHE_VERSION or cached.get("signatures") != signatures:
+            return None
+        return cached["parsed"]
+
+    def _write_cache(self, signatures, parsed):
+        temp_file = CACHE_FILE + ".tmp"
+        try:
+            with open(temp_file, "wb") as cache_file:
+                pickle.dump({"version": CACHE_VERSION, "signatures": signatures, "parsed": parsed},
+                            cache_file, protocol = pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, CACHE_FILE)
+        except OSError:
+            pass
+
+    def load(self):
+        """Parse all the files, or take them from the binary cache when it is valid"""
+        signatures = {path: file_signature(path) for path in self._parsers}
+        # preferences.INI says whether the cache is used: it is always parsed
+        preferences = parse_ini(PREFERENCES_FILE)
+        use_cache = self._use_cache(preferences)
+        parsed = self._read_cache(signatures) if use_cache else None
+        from_cache = parsed is not None
+        if not from_cache:
+            parsed = {path: parser(path) for path, parser in self._parsers.items() if path != PREFERENCES_FILE}
+            parsed[PREFERENCES_FILE] = preferences
+        self._content = {path: self._freeze(path, content) for path, content in parsed.items()}
+        self._signatures = signatures
+        if not from_cache and use_cache:
+            self._write_cache(signatures, parsed)
+
+    def _changes(self, path, old_content):
+        """The (section, option) of an INI file, or the top level keys of a json file,
+        whose value differs from the old content
+        """
+        new_content = self._content[path]
+        if path.endswith(".INI"):
+            for section in old_content.keys() | new_content.keys():
+                old_options = old_content.get(section, {})
+                new_options = new_content.get(section, {})
+                for option in old_options.keys() | new_options.keys():
+                    if old_options.get(option) != new_options.get(option):
+                        yield section, option
+        else:
+            for key in old_content.keys() | new_content.keys():
+                if old_content.get(key) != new_content.get(key):
+                    yield (key,)
+
+    def reload(self):
+        """Parse the files again. Return the list of files that changed on disk, and the
+        list of the changed settings that were copied at import, which keep their old
+        value until the next restart (ex. "config.INI [misc] disable_dms").
+        """
+        old_signatures = self._signatures
+        old_content = self._content
+        self.load()
+        changed = [path for path in self._parsers if old_signatures.get(path) != self._signatures[path]]
+        not_applied = []
+        for path in changed:
+            for change in sorted(self._changes(path, old_content.get(path, {}))):
+                if (path, change[0]) in self._copied or (path, *change) in self._copied:
+                    section, *option = change
+                    not_applied.append(f"{path} [{section}]" + (f" {option[0]}" if option else ""))
+        return changed, not_applied
+
+
+settings = Settings()
@@ -1,45 +1,30 @@
 """Contains some tasks/async loops"""
 
 import botutils
-import json
 import asyncio
-import csv
 import discord
-import configparser
 from discord.ext import tasks
+from .settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 ALIVE_ROLE_ID = Config["user"]["ALIVE_ROLE_ID"]
 ALIVE_ROLE_ID = int(ALIVE_ROLE_ID)
 PREFIX = Config["settings"]["PREFIX"]
 
-Config.read("preferences.INI")
+Preferences = settings.preferences
 
-LOBBY_TIMEOUT = Config["duration"]["LOBBY_TIMEOUT"]
+LOBBY_TIMEOUT = Preferences["duration"]["LOBBY_TIMEOUT"]
 LOBBY_TIMEOUT = int(LOBBY_TIMEOUT)
-TOKEN_RESET = int(Config["duration"]["TOKEN_RESET"])
-STATUS_CYCLE = int(Config["duration"]["STATUS_CYCLE"])
-START_CLEAR = int(Config["duration"]["START_CLEAR"])
-BACKUP_INTERVAL_MIN = int(Config["duration"]["BACKUP_INTERVAL_MIN"])
+STATUS_CYCLE = int(Preferences["duration"]["STATUS_CYCLE"])
+START_CLEAR = int(Preferences["duration"]["START_CLEAR"])
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 lobby_timeout_str = language["system"]["lobby_timeout"]
 not_enough_votes_to_start = language["system"]["not_enough_votes_to_start"]
 
 
-@tasks.loop(seconds = TOKEN_RESET, count = None)
-async def rate_limit_commands():
-    """Rate limit the frequency of commands"""
-    import globvars
-    for user in globvars.ratelimit_dict:
-        globvars.ratelimit_dict[user] = 0
-    globvars.logging.info("Cleared the rate limit dict")
-
-
 @tasks.loop(seconds = LOBBY_TIMEOUT, count = 2)
 async def lobby_timeout():
     """Lobby timeout loop"""
@@ -87,24 +72,5 @@ async def start_votes_timer():
 
     import globvars
     await asyncio.sleep(START_CLEAR)
-    globvars.start_votes.clear()
+    globvars.master_state.pregame.clear_start_votes()
     await botutils.send_lobby(not_enough_votes_to_start)
-
-
-@tasks.loop(minutes = BACKUP_INTERVAL_MIN, count = None)
-async def backup_loop():
-    """A task to backup data in csv files: 
-    Notify and ignore information
-    """
-
-    import globvars
-
-    with open('ignore.csv', mode = 'w') as ignore_file:
-        ignore_writer = csv.writer(ignore_file, delimiter = ',')
-        ignore_writer.writerow(globvars.ignore_list)
-    
-    with open('notify.csv', mode = 'w') as notify_file:
-        notify_writer = csv.writer(notify_file, delimiter = ',')
-        notify_writer.writerow(globvars.notify_list)
-    
-    globvars.logging.info("Backing up data")
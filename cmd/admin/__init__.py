@@ -7,6 +7,8 @@ from .fleave import Fleave
 from .playtest import Playtest
 from .frestart import Frestart
 from .update import Update
+from .profile import Profile
+from .reload import Reload
 
 def setup(client):
     client.add_cog(Ignore(client))
@@ -18,3 +20,5 @@ def setup(client):
     client.add_cog(Playtest(client))
     client.add_cog(Frestart(client))
     client.add_cog(Update(client))
+    client.add_cog(Profile(client))
+    client.add_cog(Reload(client))
@@ -1,12 +1,11 @@
 """Contains admins only commands"""
 
 import traceback
-import json
 import botutils
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 user_not_found_str = language["errors"]["user_not_found"]
 missing_user_str = language["errors"]["missing_user"]
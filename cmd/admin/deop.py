@@ -1,12 +1,11 @@
 """Contains the deop command cog"""
 
 import botutils
-import json
 from discord.ext import commands
 from ._admin import Admin
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 
 class Deop(Admin, name = language["system"]["admin_cog"]):
@@ -2,13 +2,12 @@
 
 import discord
 import botutils
-import json
 from discord.ext import commands
 from ._admin import Admin
 from botutils import lobby_timeout
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 fjoin_str = language["cmd"]["fjoin"]
 fjoined_str = language["cmd"]["fjoined"]
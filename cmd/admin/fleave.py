@@ -2,13 +2,12 @@
 
 import discord
 import botutils
-import json
 from discord.ext import commands
 from ._admin import Admin
 from botutils import lobby_timeout, start_votes_timer
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 fleave_str = language["cmd"]["fleave"]
 fleaved_str = language["cmd"]["fleaved"]
@@ -31,18 +30,22 @@ class Fleave(Admin, name = language["system"]["admin_cog"]):
 
         # The player has joined; make them leave
         if globvars.master_state.pregame.is_joined(member.id):
+            # The start vote of the player is removed with them
             globvars.master_state.pregame.safe_remove_player(member.id)
             await ctx.send(fleave_str.format(member.name, len(globvars.master_state.pregame)))
             botutils.update_state_machine()
+            # The seat goes to the first player on the waiting list
+            await botutils.promote_waiting_players(botutils.GameChooser().get_selected_game().MAX_PLAYERS)
             # If you are the last player to leave, then cancel the lobby timeout loop
             if len(globvars.master_state.pregame) == 0:
                 lobby_timeout.cancel()
-            # If the player has voted to start, then remove the start vote
-            if member.id in globvars.start_votes:
-                globvars.start_votes.remove(member.id)
             # Cancel the start clear timer if no one has voted to start
-            if len(globvars.start_votes) == 0 and start_votes_timer.is_running():
+            if globvars.master_state.pregame.nb_start_votes == 0 and start_votes_timer.is_running():
                 start_votes_timer.cancel()
+
+        # The player is on the waiting list
+        elif globvars.master_state.pregame.is_waiting(member.id):
+            globvars.master_state.pregame.unqueue_player(member.id)
         
         # The player has not joined
         else:
@@ -1,17 +1,15 @@
 """Contains the frestart command cog"""
 
-import json
-import os
-import sys
 import traceback
 
 from discord.ext import commands
 
 import botutils
 import globvars
+from botc.snapshot import has_snapshot
+from botutils.settings import settings
 
-with open("botutils/bot_text.json") as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
@@ -41,8 +39,12 @@ class Frestart(commands.Cog, name = language["system"]["admin_cog"]):
             await ctx.send(language["cmd"]["frestart_confirm"].format(ctx.author.mention, botutils.BotEmoji.cross))
             return
 
-        await ctx.send(language["cmd"]["frestart"].format(ctx.author.mention, botutils.BotEmoji.success))
-        os.execl(sys.executable, sys.executable, *sys.argv)
+        # The game is resumed from its last phase boundary after the restart
+        if globvars.master_state.game and has_snapshot():
+            await ctx.send(language["cmd"]["frestart_resume"].format(ctx.author.mention, botutils.BotEmoji.success))
+        else:
+            await ctx.send(language["cmd"]["frestart"].format(ctx.author.mention, botutils.BotEmoji.success))
+        await botutils.restart_process()
 
     @frestart.error
     async def frestart_error(self, ctx, error):
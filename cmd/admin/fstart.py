@@ -1,12 +1,11 @@
 """Contains the fstart command cog"""
 
 import botutils
-import json
 from discord.ext import commands
 from ._admin import Admin
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file: 
-    language = json.load(json_file)
+language = settings.bot_text
 
 fstart_min = language["errors"]["fstart_min"]
 fstart_max = language["errors"]["fstart_max"]
@@ -58,4 +57,4 @@ class Fstart(Admin, name = language["system"]["admin_cog"]):
         botutils.update_state_machine()
 
         # Clear the start votes
-        globvars.start_votes.clear()
+        globvars.master_state.pregame.clear_start_votes()
@@ -2,29 +2,26 @@
 
 import botutils
 import discord
-import json
-import configparser
 from ._admin import Admin
 from discord.ext import commands
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 PREFIX = Config["settings"]["PREFIX"]
 SERVER_ID = int(Config["user"]["SERVER_ID"])
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
-    add_ignore = language["cmd"]["add_ignore"]
-    remove_ignore = language["cmd"]["remove_ignore"]
-    already_ignored = language["cmd"]["already_ignored"]
-    not_ignored = language["cmd"]["not_ignored"]
-    ignore_list_empty = language["cmd"]["ignore_list_empty"]
-    people_total = language["cmd"]["people_total"]
-    clear_ignore = language["cmd"]["clear_ignore"]
-    force_clear = language["cmd"]["force_clear"]
-    ignore_sync = language["cmd"]["ignore_sync"]
-    
+language = settings.bot_text
+add_ignore = language["cmd"]["add_ignore"]
+remove_ignore = language["cmd"]["remove_ignore"]
+already_ignored = language["cmd"]["already_ignored"]
+not_ignored = language["cmd"]["not_ignored"]
+ignore_list_empty = language["cmd"]["ignore_list_empty"]
+people_total = language["cmd"]["people_total"]
+clear_ignore = language["cmd"]["clear_ignore"]
+force_clear = language["cmd"]["force_clear"]
+ignore_sync = language["cmd"]["ignore_sync"]
+
 
 class Ignore(Admin, name = language["system"]["admin_cog"]):
     """Ignore command"""
@@ -67,7 +64,7 @@ class Ignore(Admin, name = language["system"]["admin_cog"]):
         """Add a user into the ignore list"""
         import globvars
         if member.id not in globvars.ignore_list:
-            globvars.ignore_list.append(member.id)
+            globvars.ignore_list.add(member.id)
             msg = add_ignore.format(
                 botutils.BotEmoji.check,
                 member.display_name,
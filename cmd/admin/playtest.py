@@ -2,12 +2,11 @@
 
 import botutils
 import json
-import configparser
 from ._admin import Admin
 from discord.ext import commands
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 PLAYTESTERS = json.loads(Config["misc"]["PLAYTESTERS"])
 
@@ -0,0 +1,145 @@
+"""Contains the profile command cog"""
+
+import asyncio
+import io
+import botutils
+import discord
+from discord.ext import commands
+from ._admin import Admin
+from botutils.settings import settings
+
+language = settings.bot_text
+profile_empty = language["cmd"]["profile_empty"]
+profile_header = language["cmd"]["profile_header"]
+profile_slowest_header = language["cmd"]["profile_slowest_header"]
+profile_reset = language["cmd"]["profile_reset"]
+profile_capture_start = language["cmd"]["profile_capture_start"]
+profile_capture_running = language["cmd"]["profile_capture_running"]
+
+Config = settings.config
+
+MAX_MESSAGE_LEN = int(Config["misc"]["MAX_MESSAGE_LEN"])
+MAX_CAPTURE_SECONDS = 300
+
+
+def ms(seconds):
+    """Format a duration in seconds as milliseconds"""
+    return f"{seconds * 1000:.1f}"
+
+
+class Profile(Admin, name = language["system"]["admin_cog"]):
+    """Profile command"""
+
+    @commands.group(
+        pass_context = True,
+        name = "profile",
+        aliases = ["profiler"],
+        brief = language["doc"]["profile"]["profile"]["brief"],
+        help = language["doc"]["profile"]["profile"]["help"],
+        description = language["doc"]["profile"]["profile"]["description"]
+    )
+    async def profile(self, ctx):
+        """If no subcommand is invoked, display the latency percentiles per command"""
+        if ctx.invoked_subcommand is None:
+            summaries = botutils.command_profiler.command_summaries()
+            await self._send_summaries(ctx, summaries, "command")
+
+    @profile.command(
+        pass_context = True,
+        name = "cogs",
+        aliases = ["cog", "extensions"],
+        brief = language["doc"]["profile"]["cogs"]["brief"],
+        help = language["doc"]["profile"]["cogs"]["help"],
+        description = language["doc"]["profile"]["cogs"]["description"]
+    )
+    async def cogs(self, ctx):
+        """Display the latency percentiles per extension"""
+        summaries = botutils.command_profiler.extension_summaries()
+        await self._send_summaries(ctx, summaries, "extension")
+
+    @profile.command(
+        pass_context = True,
+        name = "slowest",
+        aliases = ["slow"],
+        brief = language["doc"]["profile"]["slowest"]["brief"],
+        help = language["doc"]["profile"]["slowest"]["help"],
+        description = language["doc"]["profile"]["slowest"]["description"]
+    )
+    async def slowest(self, ctx, limit: int = None):
+        """Display the slowest recent invocations"""
+        records = botutils.command_profiler.slowest(limit)
+        if not records:
+            await ctx.send(profile_empty)
+            return
+        lines = []
+        for record in records:
+            stages = " ".join(f"{stage.value}={ms(record.stages[stage])}" for stage in botutils.Stage)
+            failed = " (failed)" if record.failed else ""
+            lines.append(f"{ms(record.total):>8} ms  {record.command_name}{failed} [{record.extension_name}] " \
+                f"by {record.author_id}\n           {stages}")
+        msg = profile_slowest_header.format(botutils.BotEmoji.hourglass, len(records))
+        msg += botutils.create_code_block("\n".join(lines))
+        await ctx.send(msg)
+
+    @profile.command(
+        pass_context = True,
+        name = "reset",
+        brief = language["doc"]["profile"]["reset"]["brief"],
+        help = language["doc"]["profile"]["reset"]["help"],
+        description = language["doc"]["profile"]["reset"]["description"]
+    )
+    async def reset(self, ctx):
+        """Clear the collected timings"""
+        botutils.command_profiler.reset()
+        await ctx.send(profile_reset.format(botutils.BotEmoji.check))
+
+    @profile.command(
+        pass_context = True,
+        name = "cprofile",
+        aliases = ["capture"],
+        brief = language["doc"]["profile"]["cprofile"]["brief"],
+        help = language["doc"]["profile"]["cprofile"]["help"],
+        description = language["doc"]["profile"]["cprofile"]["description"]
+    )
+    async def cprofile(self, ctx, seconds: int = 30):
+        """Run cProfile for a number of seconds and upload the stats"""
+        profiler = botutils.command_profiler
+        if profiler.is_capturing():
+            await ctx.send(profile_capture_running.format(ctx.author.mention, botutils.BotEmoji.cross))
+            return
+        seconds = min(max(seconds, 1), MAX_CAPTURE_SECONDS)
+        await ctx.send(profile_capture_start.format(botutils.BotEmoji.gears, seconds))
+        profiler.start_capture()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stats = profiler.stop_capture()
+        file = discord.File(io.BytesIO(stats.encode("utf-8")), filename = "cprofile.txt")
+        await ctx.send(file = file)
+
+    async def _send_summaries(self, ctx, summaries, label):
+        """Send a table of percentiles and mean time per stage"""
+        if not summaries:
+            await ctx.send(profile_empty)
+            return
+        header = f"{label:<28} {'n':>5} {'fail':>5} {'p50':>8} {'p95':>8} {'p99':>8} " \
+            f"{'checks':>8} {'conv':>8} {'handler':>8} {'sends':>8}"
+        lines = [header]
+        for name, summary in summaries.items():
+            stages = summary["stages"]
+            lines.append(
+                f"{name[:28]:<28} {summary['count']:>5} {summary['failed']:>5} {ms(summary['p50']):>8} " \
+                f"{ms(summary['p95']):>8} {ms(summary['p99']):>8} " \
+                f"{ms(stages[botutils.Stage.checks]):>8} {ms(stages[botutils.Stage.converters]):>8} " \
+                f"{ms(stages[botutils.Stage.handler]):>8} {ms(stages[botutils.Stage.sends]):>8}"
+            )
+        msg = profile_header.format(
+            botutils.BotEmoji.hourglass,
+            round(botutils.command_profiler.throughput(), 2)
+        )
+        table = "\n".join(lines)
+        if len(msg) + len(table) + 10 > MAX_MESSAGE_LEN:
+            file = discord.File(io.BytesIO(table.encode("utf-8")), filename = "profile.txt")
+            await ctx.send(msg, file = file)
+        else:
+            await ctx.send(msg + botutils.create_code_block(table))
@@ -0,0 +1,38 @@
+"""Contains the reload command cog"""
+
+import botutils
+from discord.ext import commands
+from ._admin import Admin
+from botutils.settings import settings
+
+language = settings.bot_text
+
+# Number of settings listed as not applied, to stay under the message length limit
+MAX_LISTED = 25
+
+
+class Reload(Admin, name = language["system"]["admin_cog"]):
+    """Reload command"""
+
+    @commands.command(
+        pass_context = True,
+        name = "reload",
+        brief = language["doc"]["reload"]["brief"],
+        help = language["doc"]["reload"]["help"],
+        description = language["doc"]["reload"]["description"]
+    )
+    async def reload(self, ctx):
+        """Reload the settings registry"""
+        changed, not_applied = settings.reload()
+        if changed:
+            msg = language["cmd"]["reload_changed"].format(botutils.BotEmoji.check, ", ".join(changed))
+            if not_applied:
+                lines = not_applied[:MAX_LISTED]
+                if len(not_applied) > MAX_LISTED:
+                    lines.append(f"... (+{len(not_applied) - MAX_LISTED})")
+                msg += "\n" + language["cmd"]["reload_not_applied"].format(
+                    botutils.create_code_block("\n".join(lines)))
+        else:
+            msg = language["cmd"]["reload_unchanged"].format(botutils.BotEmoji.check)
+        await ctx.send(msg)
+
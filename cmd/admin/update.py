@@ -1,6 +1,5 @@
 """Contains the update command cog"""
 
-import json
 import os
 import subprocess
 import sys
@@ -10,9 +9,10 @@ from discord.ext import commands
 
 import botutils
 import globvars
+from botc.snapshot import has_snapshot
+from botutils.settings import settings
 
-with open("botutils/bot_text.json") as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
@@ -50,11 +50,15 @@ class Update(commands.Cog, name = language["system"]["admin_cog"]):
             return
 
         if globvars.master_state.game:
+            # The game is resumed from its last phase boundary after the restart
+            if has_snapshot():
+                await ctx.send(language["cmd"]["frestart_resume"].format(ctx.author.mention, botutils.BotEmoji.success))
+                await botutils.restart_process()
             await ctx.send(language["cmd"]["frestart_confirm"].format(ctx.author.mention, botutils.BotEmoji.cross))
             return
 
         await ctx.send(language["cmd"]["frestart"].format(ctx.author.mention, botutils.BotEmoji.success))
-        os.execl(sys.executable, sys.executable, *sys.argv)
+        await botutils.restart_process()
 
     @update.error
     async def update_error(self, ctx, error):
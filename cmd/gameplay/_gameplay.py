@@ -1,11 +1,10 @@
 """Contains gameplay commands"""
 
 import botutils
-import json
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 
 class Gameplay(commands.Cog, name = language["system"]["gameplay_cog"]):
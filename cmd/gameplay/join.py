@@ -1,17 +1,17 @@
 """Contains the join command cog"""
 
 import botutils
-import json
 import random
 import traceback
 from discord.ext import commands
 from ._gameplay import Gameplay
 from botutils import lobby_timeout
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 joined_str = language["cmd"]["joined"]
+queued_str = language["cmd"]["queued"]
 error_str = language["system"]["error"]
 
 emojis = [
@@ -59,6 +59,12 @@ class Join(Gameplay, name = language["system"]["gameplay_cog"]):
         if globvars.master_state.pregame.is_joined(ctx.author.id):
             await ctx.send(joined_str.format(ctx.author.mention))
 
+        # The lobby is full; put the command user on the waiting list for the next game
+        elif len(globvars.master_state.pregame) >= botutils.GameChooser().get_selected_game().MAX_PLAYERS:
+            position = globvars.master_state.pregame.queue_player(ctx.author.id)
+            await ctx.send(queued_str.format(ctx.author.mention, len(globvars.master_state.pregame), position))
+            return
+
         # The command user has not joined yet; make them join
         else:
             globvars.master_state.pregame.safe_add_player(ctx.author.id)
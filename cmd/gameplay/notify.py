@@ -1,25 +1,21 @@
 """Contains the notify command cog"""
 
 import botutils
-import json
 import time
 import traceback
-import configparser
 from ._gameplay import Gameplay
 from discord.ext import commands
 from discord import Status
 from library import display_time
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 SERVER_ID = int(Config["user"]["SERVER_ID"])
 
-Preferences = configparser.ConfigParser()
-Preferences.read("preferences.INI")
+Preferences = settings.preferences
 NOTIFY_COOLDOWN = int(Preferences["duration"]["NOTIFY_COOLDOWN"])
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 cooldown_str = language["errors"]["cmd_cooldown"]
@@ -55,26 +51,15 @@ class Notify(Gameplay, name = language["system"]["gameplay_cog"]):
             if botutils.check_if_lobby(ctx):
                 globvars.last_notify = time.time()
 
-            pings = []
+            # Only ping the subscribers who are not offline (see NotifyList)
+            users_to_ping = [
+                userid for userid in globvars.notify_list.online()
+                if userid not in globvars.ignore_list
+                and userid not in globvars.master_state.pregame
+                and userid != ctx.author.id
+            ]
 
-            users_to_ping = sorted(set(globvars.notify_list) - set(globvars.ignore_list))
-
-            for userid in users_to_ping:
-                member = globvars.client.get_guild(SERVER_ID).get_member(userid)
-
-                # member found, only ping them if they are not offline
-                if member:
-                    if member.status != Status.offline and \
-                        member.id not in globvars.master_state.pregame and \
-                        member.id != ctx.author.id:
-                        pings.append(member.mention)
-
-                # member not present in server, remove their id
-                else:
-                    globvars.notify_list.remove(userid)
-
-            msg = f"{ctx.author.mention} {botutils.BotEmoji.mention} {' '.join(pings)}"
-            await ctx.send(msg)
+            await botutils.send_pings(ctx, f"{ctx.author.mention} {botutils.BotEmoji.mention}", users_to_ping)
 
     @notify.command(
         pass_context = True,
@@ -92,7 +77,9 @@ class Notify(Gameplay, name = language["system"]["gameplay_cog"]):
             msg = already_in_notify.format(ctx.author.mention, botutils.BotEmoji.cross)
             await ctx.send(msg)
         else:
-            globvars.notify_list.append(ctx.author.id)
+            member = globvars.client.get_guild(SERVER_ID).get_member(ctx.author.id)
+            online = member is not None and member.status != Status.offline
+            globvars.notify_list.add(ctx.author.id, online = online)
             msg = add_notify.format(botutils.BotEmoji.check)
             await ctx.send(msg)
     
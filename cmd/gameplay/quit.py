@@ -2,16 +2,16 @@
 
 import botutils
 import traceback
-import json
 from discord.ext import commands
 from ._gameplay import Gameplay
 from botutils import lobby_timeout, start_votes_timer
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 quit_str = language["cmd"]["quit"]
 quitted_str = language["cmd"]["quitted"]
+unqueued_str = language["cmd"]["unqueued"]
 error_str = language["system"]["error"]
 
 
@@ -39,19 +39,24 @@ class Quit(Gameplay, name = language["system"]["gameplay_cog"]):
         
         # The command user has joined; make them quit
         if globvars.master_state.pregame.is_joined(ctx.author.id):
+            # The start vote of the player is removed with them
             globvars.master_state.pregame.safe_remove_player(ctx.author.id)
             botutils.update_state_machine()
             await ctx.send(quit_str.format(ctx.author.name, len(globvars.master_state.pregame)))
+            # The seat goes to the first player on the waiting list
+            await botutils.promote_waiting_players(botutils.GameChooser().get_selected_game().MAX_PLAYERS)
             # If you are the last player to leave, then cancel the lobby timeout loop
             if len(globvars.master_state.pregame) == 0:
                 lobby_timeout.cancel()
-            # If the player has voted to start, then remove the start vote
-            if ctx.author.id in globvars.start_votes:
-                globvars.start_votes.remove(ctx.author.id)
             # Cancel the start clear timer if no one has voted to start
-            if len(globvars.start_votes) == 0 and start_votes_timer.is_running():
+            if globvars.master_state.pregame.nb_start_votes == 0 and start_votes_timer.is_running():
                 start_votes_timer.cancel()
 
+        # The command user is on the waiting list
+        elif globvars.master_state.pregame.is_waiting(ctx.author.id):
+            globvars.master_state.pregame.unqueue_player(ctx.author.id)
+            await ctx.send(unqueued_str.format(ctx.author.name))
+
         # The command user has not joined
         else:
             await ctx.send(quitted_str.format(ctx.author.mention))
@@ -1,14 +1,13 @@
 """Contains the start command cog"""
 
 import traceback
-import json
 import botutils
 from discord.ext import commands
 from ._gameplay import Gameplay
 from botutils import start_votes_timer
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 fstart_min = language["errors"]["fstart_min"]
@@ -36,7 +35,7 @@ class Start(Gameplay, name = language["system"]["gameplay_cog"]):
         globvars.master_state.pregame.remove_left_guild_players()
 
         # The player has already voted to start
-        if ctx.author.id in globvars.start_votes:
+        if globvars.master_state.pregame.has_voted_to_start(ctx.author.id):
             return
 
         game = botutils.GameChooser().get_selected_game()
@@ -64,30 +63,27 @@ class Start(Gameplay, name = language["system"]["gameplay_cog"]):
         # The player has not voted to start yet
         else:
 
-            globvars.start_votes.append(ctx.author.id)
+            globvars.master_state.pregame.vote_to_start(ctx.author.id)
 
             # First person to vote. Start the clear start votes timer
-            if len(globvars.start_votes) == 1:
+            if globvars.master_state.pregame.nb_start_votes == 1:
                 if start_votes_timer.is_running():
                     start_votes_timer.cancel()
                 start_votes_timer.start()
             
-            # Calculate the number of votes needed
-            votes_needed = max(len(globvars.master_state.pregame) - 3, 3)
-
             # Reached the number of votes needed. Start the game.
-            if len(globvars.start_votes) == votes_needed:
+            if globvars.master_state.pregame.has_start_quorum():
                 game = botutils.GameChooser().get_selected_game()
                 globvars.master_state.game = game
                 await globvars.master_state.game.start_game()
                 botutils.update_state_machine()
 
                 # Clear the start votes
-                globvars.start_votes.clear()
+                globvars.master_state.pregame.clear_start_votes()
                 
                 return
             
-            votes_left = votes_needed - len(globvars.start_votes)
+            votes_left = globvars.master_state.pregame.start_votes_needed - globvars.master_state.pregame.nb_start_votes
 
             # Do not have a negative number of votes required to start
             if votes_left < 0:
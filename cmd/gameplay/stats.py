@@ -1,19 +1,16 @@
 """Contains the stats command cog"""
 
 import botutils
-import json
-import configparser
 import traceback
 from discord.ext import commands
 from ._gameplay import Gameplay
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 PREFIX = Config["settings"]["PREFIX"]
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 no_game = language["cmd"]["no_game"]
@@ -1,22 +1,18 @@
 """Contains the time command cog"""
 
-import configparser
-import json
 import botutils
 import traceback
 from datetime import datetime, timezone
 from discord.ext import commands
 from ._gameplay import Gameplay
 from botutils import lobby_timeout
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-
-Config.read("preferences.INI")
+Config = settings.preferences
 LOBBY_TIMEOUT = Config["duration"]["LOBBY_TIMEOUT"]
 LOBBY_TIMEOUT = int(LOBBY_TIMEOUT)
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 lobby_timeout_str = language["system"]["lobby_timeout"]
@@ -1,8 +1,10 @@
 from .on_ready import on_ready
 from .on_command_error import on_command_error
 from .on_command import on_command
+from .on_member import on_member
 
 def setup(client):
     client.add_cog(on_ready(client))
     client.add_cog(on_command_error(client))
     client.add_cog(on_command(client))
+    client.add_cog(on_member(client))
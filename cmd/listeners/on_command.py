@@ -1,20 +1,17 @@
 """Contains the on_command event listener"""
 
 import discord
-import json
-import configparser
 import botutils
 from discord.ext import commands
+from botutils.settings import settings
+from library import display_time
 
-Config = configparser.ConfigParser()
-Config.read("preferences.INI")
+Config = settings.preferences
 
 IGNORE_THRESHOLD = int(Config["duration"]["IGNORE_THRESHOLD"])
-TOKENS_GIVEN = int(Config["duration"]["TOKENS_GIVEN"])
 TOKEN_RESET = int(Config["duration"]["TOKEN_RESET"])
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 ignore = language["system"]["ignore"]
 
@@ -30,23 +27,19 @@ class on_command(commands.Cog):
         """On_command event"""
 
         import globvars
-        
-        # For each command used, we increase the count by one
-        if str(ctx.author.id) not in globvars.ratelimit_dict:
-            globvars.ratelimit_dict[str(ctx.author.id)] = 1
-        else:
-            globvars.ratelimit_dict[str(ctx.author.id)] += 1
-        
-        # The user has surpassed the threshold, and will be ignored
-        if globvars.ratelimit_dict[str(ctx.author.id)] > IGNORE_THRESHOLD:
-            if not ctx.author.id in globvars.ignore_list:
-                globvars.ignore_list.append(ctx.author.id)
-                msg = f"{ctx.author.mention} was added to the ignore list for rate limiting."
-                await botutils.log(botutils.Level.warning, msg)
-                await ctx.send(ignore.format(ctx.author.mention, IGNORE_THRESHOLD, TOKEN_RESET))
-
-        if globvars.ratelimit_dict[str(ctx.author.id)] >= TOKENS_GIVEN:
-            pass
+
+        # The commands of the ignored users are dropped by the checks
+        if ctx.author.id in globvars.ignore_list:
+            return
+
+        # For each command used, the user spends a token. The user has run out of them,
+        # and will be ignored for a while.
+        if not botutils.user_limiter.consume(ctx.author.id):
+            duration = globvars.ignore_list.auto_ignore(ctx.author.id)
+            botutils.user_limiter.reset(ctx.author.id)
+            msg = f"{ctx.author.mention} was added to the ignore list for rate limiting ({display_time(duration)})."
+            await botutils.log(botutils.Level.warning, msg)
+            await ctx.send(ignore.format(ctx.author.mention, IGNORE_THRESHOLD, TOKEN_RESET, display_time(duration)))
 
 
 def setup(client):
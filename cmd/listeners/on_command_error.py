@@ -2,12 +2,11 @@
 
 #import sys
 import botutils
-import json
 import traceback
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
@@ -29,6 +28,9 @@ class on_command_error(commands.Cog):
         error: commands.CommandError
             The Exception raised.
         """
+        # The invocations that failed before the end of their callback are recorded here
+        botutils.command_profiler.record_error(ctx)
+
         # This prevents any commands with local handlers being handled here in on_command_error.
         if hasattr(ctx.command, 'on_error'):
             return
@@ -39,7 +41,7 @@ class on_command_error(commands.Cog):
             if cog._get_overridden_method(cog.cog_command_error) is not None:
                 return
         
-        ignored = (commands.CommandNotFound, )
+        ignored = (commands.CommandNotFound, botutils.RateLimited)
 
         # Allows us to check for original exceptions raised and sent to CommandInvokeError.
         # If nothing is found. We keep the exception passed to on_command_error.
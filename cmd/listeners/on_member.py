@@ -0,0 +1,69 @@
+"""Contains the on_member_remove, on_member_join and presence event listeners"""
+
+import botutils
+import discord
+from discord.ext import commands
+from botutils.settings import settings
+
+Config = settings.config
+
+SERVER_ID = Config["user"]["SERVER_ID"]
+SERVER_ID = int(SERVER_ID)
+
+
+class on_member(commands.Cog):
+    """Event listeners on_member_remove, on_member_join and presence updates"""
+
+    def __init__(self, client):
+        self.client = client
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        """On_member_remove event: the user can't play anymore"""
+
+        import globvars
+
+        if member.guild.id != SERVER_ID:
+            return
+
+        globvars.master_state.membership.mark_left(member.id)
+        globvars.notify_list.remove(member.id)
+
+        globvars.master_state.pregame.unqueue_player(member.id)
+
+        # Players who leave during a game are removed at the next phase boundary
+        if globvars.master_state.pregame.is_joined(member.id):
+            globvars.master_state.pregame.remove_player(member.id)
+            botutils.update_state_machine()
+            await botutils.promote_waiting_players(botutils.GameChooser().get_selected_game().MAX_PLAYERS)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        """On_member_join event"""
+
+        import globvars
+
+        if member.guild.id != SERVER_ID:
+            return
+
+        globvars.master_state.membership.mark_joined(member.id)
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before, after):
+        """On_presence_update event: keep the presence index of the notify list"""
+
+        import globvars
+
+        if after.guild.id != SERVER_ID or before.status == after.status:
+            return
+
+        globvars.notify_list.set_online(after.id, after.status != discord.Status.offline)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        """On_member_update event: the status changes come with it before discord.py 2.0"""
+        await self.on_presence_update(before, after)
+
+
+def setup(client):
+    client.add_cog(on_member(client))
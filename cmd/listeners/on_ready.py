@@ -1,26 +1,27 @@
 """Contains the on_ready event listener"""
 
-import configparser
 import json
-import csv
 import sqlite3
+import traceback
 import botutils
 from discord.ext import commands
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
 SERVER_ID = Config["user"]["SERVER_ID"]
+SERVER_ID = int(SERVER_ID)
 LOBBY_CHANNEL_ID = Config["user"]["LOBBY_CHANNEL_ID"]
 ALIVE_ROLE_ID = Config["user"]["ALIVE_ROLE_ID"]
 DEAD_ROLE_ID = Config["user"]["DEAD_ROLE_ID"]
 LOCK_CHANNELS_SPECIAL_ID = json.loads(Config["user"].get("LOCK_CHANNELS_SPECIAL_ID", "[]"))
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 restart_msg = language["system"]["restart"]
 restarted_notify_msg = language["system"]["restarted_notify"]
+restarted_resume_msg = language["system"]["restarted_resume"]
+resume_failed_msg = language["system"]["resume_failed"]
 
 
 class on_ready(commands.Cog):
@@ -35,24 +36,6 @@ class on_ready(commands.Cog):
 
         import globvars
 
-        # Import the ignore data from csv file
-        globvars.ignore_list.clear()
-
-        with open('ignore.csv', mode = 'r') as ignore_file:
-            csv_reader = csv.reader(ignore_file, delimiter = ',')
-            for row in csv_reader:
-                globvars.ignore_list = [int(item) for item in row]
-                break
-
-        # Import the notify data from csv file
-        globvars.notify_list.clear()
-
-        with open('notify.csv', mode = 'r') as notify_file:
-            csv_reader = csv.reader(notify_file, delimiter = ',')
-            for row in csv_reader:
-                globvars.notify_list = [int(item) for item in row]
-                break
-
         with sqlite3.connect("data.sqlite3") as db:
             c = db.execute("PRAGMA user_version")
             schema_version, = c.fetchone()
@@ -96,9 +79,6 @@ class on_ready(commands.Cog):
                 db.execute("PRAGMA user_version = 2")
                 schema_version = 2
 
-        # Start the backup loop
-        botutils.backup_loop.start()
-
         # Print the login message in console
         print(f"Logged in as {self.client.user.name}")
         print(f"Bot ID {self.client.user.id}")
@@ -110,6 +90,20 @@ class on_ready(commands.Cog):
         # Send the message in log
         await botutils.log(botutils.Level.info, restart_msg)
 
+        # Member events may have been missed while disconnected
+        game = globvars.master_state.game
+        user_ids = list(globvars.master_state.pregame) + \
+            ([member.id for member in game.member_obj_list] if game else [])
+        globvars.master_state.membership.refresh(globvars.client.get_guild(SERVER_ID), user_ids)
+        # And so may have presence updates
+        globvars.notify_list.refresh(globvars.client.get_guild(SERVER_ID))
+
+        # Resume the game that was in progress before the restart
+        from botc.snapshot import has_snapshot
+        if globvars.master_state.game is None and has_snapshot():
+            if await self.resume_saved_game():
+                return
+
         pings = []
 
         alive_role = globvars.client.get_guild(int(SERVER_ID)).get_role(int(ALIVE_ROLE_ID))
@@ -133,6 +127,32 @@ class on_ready(commands.Cog):
 
         await botutils.unlock_lobby()
 
+    async def resume_saved_game(self):
+        """Restore the game saved at the last phase boundary and start its game loop.
+        Return True if the game was resumed.
+        """
+
+        import globvars
+        from botc.snapshot import load_snapshot, restore_game, delete_snapshot
+
+        data = load_snapshot()
+        try:
+            if data is None:
+                raise ValueError("The snapshot file is unreadable or from another version.")
+            game = restore_game(data)
+        except Exception:
+            delete_snapshot()
+            await botutils.log(botutils.Level.error, resume_failed_msg + "\n" + traceback.format_exc())
+            return False
+
+        globvars.master_state.resume_game(game)
+        await game.resume_game()
+
+        pings = [botutils.make_role_ping(ALIVE_ROLE_ID), botutils.make_role_ping(DEAD_ROLE_ID)]
+        lobby_channel = globvars.client.get_channel(int(LOBBY_CHANNEL_ID))
+        await lobby_channel.send(restarted_resume_msg.format(" ".join(pings), game._chrono.next_phase.value))
+        return True
+
 
 def setup(client):
     client.add_cog(on_ready(client))
@@ -1,12 +1,11 @@
 """Contains miscellaneous commands"""
 
-import json
 import botutils
 import traceback
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
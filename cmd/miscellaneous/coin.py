@@ -1,13 +1,12 @@
 """Contains the coin command cog"""
 
 import botutils
-import json
 import random
 from ._miscellaneous import Miscellaneous
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 
 class Coin(Miscellaneous, name = language["system"]["miscellaneous_cog"]):
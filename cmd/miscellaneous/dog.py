@@ -2,12 +2,11 @@
 
 import botutils
 import random
-import json
 from ._miscellaneous import Miscellaneous
 from discord.ext import commands
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 
 class Dog(Miscellaneous, name = language["system"]["miscellaneous_cog"]):
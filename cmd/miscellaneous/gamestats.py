@@ -1,15 +1,14 @@
 """Contains the gamestats command cog"""
 
-import json
 import sqlite3
 
 import discord
 from discord.ext import commands
 
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-with open("botutils/bot_text.json") as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 gamestats_title_str = language["cmd"]["gamestats_title"]
 gamestats_title_players_str = language["cmd"]["gamestats_title_players"]
@@ -1,12 +1,11 @@
 """Contains the github command cog"""
 
-import json
 import botutils
 from discord.ext import commands
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 github_str = language["cmd"]["github"]
 
@@ -1,12 +1,11 @@
 """Contains the ping command cog"""
 
 import botutils
-import json
 from discord.ext import commands
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 ping_str = language["cmd"]["ping"]
 
@@ -1,6 +1,5 @@
 """Contains the playerstats command cog"""
 
-import json
 import sqlite3
 import traceback
 from typing import Union
@@ -10,9 +9,9 @@ from discord.ext import commands
 
 import botutils
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-with open("botutils/bot_text.json") as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 playerstats_title_str = language["cmd"]["playerstats_title"]
 playerstats_no_games_str = language["cmd"]["playerstats_no_games"]
@@ -1,13 +1,12 @@
 """Contains the role command cog"""
 
 import botutils
-import json
 import traceback
 from discord.ext import commands
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 error_str = language["system"]["error"]
 
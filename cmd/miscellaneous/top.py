@@ -1,7 +1,5 @@
 """Contains the top command cog"""
 
-import configparser
-import json
 import sqlite3
 
 import discord
@@ -9,12 +7,11 @@ from discord.ext import commands
 
 import globvars
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-Config = configparser.ConfigParser()
-Config.read("config.INI")
+Config = settings.config
 
-with open("botutils/bot_text.json") as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 top_games_str = language["cmd"]["top_games"]
 top_wins_str = language["cmd"]["top_wins"]
@@ -1,14 +1,13 @@
 """Contains the uptime command cog"""
 
 import botutils
-import json
 from time import time
 from discord.ext import commands
 from datetime import timedelta
 from ._miscellaneous import Miscellaneous
+from botutils.settings import settings
 
-with open('botutils/bot_text.json') as json_file:
-    language = json.load(json_file)
+language = settings.bot_text
 
 uptime_str = language["cmd"]["uptime"]
 
@@ -1,13 +1,15 @@
 """Global variables, for access by all modules"""
 
 import logging
-from botutils import MasterState
+# From the submodules: botutils may be partially imported when a module of the package
+# imports globvars first (ex. python -m botc.replay)
+from botutils.MasterState import MasterState
+from botutils.RateLimiter import IgnoreList
+from botutils.NotifyList import NotifyList
+from botutils.FileBackup import FileBackup
+from botutils.logsink import setup_local_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s %(levelname)-8s %(message)s',
-    datefmt='%a, %d %b %Y %H:%M:%S'
-)
+setup_local_logging(level = logging.INFO)
 
 
 def init_master_state():
@@ -22,12 +24,8 @@ def init_client():
     client = None
 
 
-ratelimit_dict = dict()
+ignore_list = IgnoreList(backup = FileBackup("ignore.csv"))
 
-ignore_list = []
-
-notify_list = []
-
-start_votes = []
+notify_list = NotifyList(backup = FileBackup("notify.csv"))
 
 last_notify = 0
@@ -1,2 +1,3 @@
 from .fancytext import fancy
 from .display_time import display_time
+from .startup_profiler import startup_profiler
@@ -0,0 +1,145 @@
+"""Contains the startup profiler, to measure the import time of each module and the
+load time of each extension when the bot starts. Only uses the standard library, so
+that it can be started before any other module of the bot is imported.
+"""
+
+import builtins
+import contextlib
+import datetime
+import importlib.util
+import sys
+import time
+
+
+class StartupProfiler:
+    """Record the import time of the modules imported while it is running, the
+    load time of the bot extensions and of named startup sections.
+    """
+
+    def __init__(self):
+        self.modules = {}  # {module name : [cumulative seconds, self seconds]}
+        self.extensions = []  # [(extension name, seconds)]
+        self.sections = []  # [(section name, seconds)]
+        self.total = 0.0
+        self._children = []  # time spent in nested imports, one entry per import being timed
+        self._original_import = None
+        self._client = None
+        self._start = None
+
+    @property
+    def running(self):
+        return self._original_import is not None
+
+    def start(self):
+        """Start timing the imports. Must be called before the bot modules are imported."""
+        self._start = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self):
+        """Stop timing, restore the import system and the client"""
+        self.total = time.perf_counter() - self._start
+        builtins.__import__ = self._original_import
+        self._original_import = None
+        if self._client is not None:
+            del self._client.load_extension
+            self._client = None
+
+    @staticmethod
+    def _absolute_name(name, globals, level):
+        if level == 0:
+            return name
+        package = (globals or {}).get("__package__") or ""
+        if not name:
+            return importlib.util.resolve_name("." * level, package)
+        return importlib.util.resolve_name("." * level + name, package)
+
+    def _timed_import(self, name, globals = None, locals = None, fromlist = (), level = 0):
+        """Replacement of builtins.__import__, timing the modules loaded for the first time"""
+        try:
+            absolute_name = self._absolute_name(name, globals, level)
+        except (ImportError, ValueError):
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        # from package import submodule: submodules are loaded by the same statement
+        candidates = [absolute_name] + [f"{absolute_name}.{item}" for item in fromlist or () if item != "*"]
+        new_modules = [module_name for module_name in candidates if module_name not in sys.modules]
+        if not new_modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            loaded = [module_name for module_name in new_modules if module_name in sys.modules]
+            if loaded:
+                self.modules[", ".join(loaded)] = [elapsed, max(elapsed - children, 0.0)]
+
+    def watch_extensions(self, client):
+        """Time every client.load_extension call until the profiler is stopped"""
+        self._client = client
+        original_load_extension = client.load_extension
+
+        def timed_load_extension(extension_name, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original_load_extension(extension_name, *args, **kwargs)
+            finally:
+                self.extensions.append((extension_name, time.perf_counter() - start))
+
+        client.load_extension = timed_load_extension
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """Time a named part of the startup (ex. loading the game packs)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((name, time.perf_counter() - start))
+
+    def create_report(self, budget = None, limit = 30):
+        """Create the text report. The budget is in seconds, None for no budget."""
+        lines = [f"Startup profile - {datetime.datetime.now().isoformat()}", ""]
+        total_line = f"Total startup time: {self.total * 1000:.1f} ms"
+        if budget:
+            verdict = "OK" if self.total <= budget else "EXCEEDED"
+            total_line += f" (budget {budget * 1000:.1f} ms: {verdict})"
+        lines += [total_line, ""]
+
+        lines.append("Sections")
+        for name, seconds in self.sections:
+            lines.append(f"    {name:<50} {seconds * 1000:>10.1f} ms")
+        lines.append("")
+
+        lines.append("Extensions")
+        for name, seconds in self.extensions:
+            lines.append(f"    {name:<50} {seconds * 1000:>10.1f} ms")
+        lines.append("")
+
+        lines.append(f"Slowest modules (top {limit} by self time)")
+        lines.append(f"    {'module':<50} {'self':>10}    {'cumulative':>10}")
+        by_self_time = sorted(self.modules.items(), key = lambda item: item[1][1], reverse = True)
+        for name, (cumulative, self_time) in by_self_time[:limit]:
+            lines.append(f"    {name[:50]:<50} {self_time * 1000:>10.1f} ms {cumulative * 1000:>10.1f} ms")
+        lines.append("")
+        lines.append(f"{len(self.modules)} modules imported while profiling")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path, budget = None):
+        """Write the report to a file and return it"""
+        report = self.create_report(budget)
+        with open(path, "w") as report_file:
+            report_file.write(report)
+        return report
+
+    def is_over_budget(self, budget):
+        return bool(budget) and self.total > budget
+
+
+startup_profiler = StartupProfiler()
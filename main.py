@@ -13,19 +13,44 @@ affiliated with them in any way.
 
 """
 
-import globvars
-import configparser
-import botc
-import json
-import botutils
-import discord
-from discord.ext import commands
+import argparse
+import atexit
+import sys
+from library.startup_profiler import startup_profiler
+
+parser = argparse.ArgumentParser(description = "Blood on the Clocktower Storyteller Discord bot")
+parser.add_argument(
+    "--profile-startup",
+    nargs = "?",
+    const = "startup_profile.txt",
+    metavar = "REPORT",
+    help = "measure the import time of each module and the load time of each extension, "
+           "write the report (startup_profile.txt by default) and exit before logging in"
+)
+parser.add_argument(
+    "--startup-budget",
+    type = float,
+    metavar = "SECONDS",
+    help = "with --profile-startup, exit with status 1 if the startup takes longer than this "
+           "(defaults to [profiler] STARTUP_BUDGET in preferences.INI)"
+)
+args, _ = parser.parse_known_args()
+
+if args.profile_startup:
+    startup_profiler.start()
+
+with startup_profiler.section("import bot modules"):
+    import globvars
+    import botc
+    import botutils
+    import discord
+    from discord.ext import commands
+    from botutils.settings import settings
 
 
 if __name__ == "__main__":
 
-    Config = configparser.ConfigParser()
-    Config.read("config.INI")
+    Config = settings.config
 
     TOKEN = Config["secret"]["TOKEN"]
     OWNER_ID = Config["user"]["OWNER_ID"]
@@ -34,6 +59,12 @@ if __name__ == "__main__":
     globvars.init_client()
     globvars.init_master_state()
 
+    # The ignore and notify lists are loaded once; their changes are written behind
+    globvars.ignore_list.load()
+    globvars.notify_list.load()
+    atexit.register(globvars.ignore_list.backup.write_pending)
+    atexit.register(globvars.notify_list.backup.write_pending)
+
     def command_prefix(bot, message):
         if message.guild is None:
             return (PREFIX, "")
@@ -41,8 +72,7 @@ if __name__ == "__main__":
             return PREFIX
 
     # The help command
-    with open('botutils/bot_text.json') as json_file:
-        language = json.load(json_file)
+    language = settings.bot_text
 
     help_command = commands.DefaultHelpCommand(
         verify_checks = False,
@@ -78,12 +108,18 @@ if __name__ == "__main__":
         allowed_mentions = allowed_mentions,
     )
 
+    if args.profile_startup:
+        startup_profiler.watch_extensions(globvars.client)
+
     globvars.client.add_check(botutils.check_if_not_ignored)
-    botutils.rate_limit_commands.start()
+    botutils.command_profiler.install(globvars.client)
+    # After the profiler's start hook, so that the rate limited commands are recorded too
+    globvars.client.add_check(botutils.check_command_rate, call_once = True)
 
     # Loading game packs
     print("===== LOADING GAME PACKS =====")
-    botc.load_pack(globvars.master_state)
+    with startup_profiler.section("load game packs"):
+        botc.load_pack(globvars.master_state)
     print(globvars.master_state.game_packs)
 
     extensions = ["admin", "gameplay", "miscellaneous", "listeners"]
@@ -91,9 +127,17 @@ if __name__ == "__main__":
     # Loading command extensions
     print("===== LOADING COMMAND EXTENSIONS =====")
 
-    for extension in extensions:
-        globvars.client.load_extension(f"cmd.{extension}")
-        print(f"> {extension} cog successfully loaded")
+    with startup_profiler.section("load command extensions"):
+        for extension in extensions:
+            globvars.client.load_extension(f"cmd.{extension}")
+            print(f"> {extension} cog successfully loaded")
+
+    if args.profile_startup:
+        startup_profiler.stop()
+        budget = args.startup_budget or settings.preferences.getfloat("profiler", "STARTUP_BUDGET", fallback = 0)
+        print("===== STARTUP PROFILE =====")
+        print(startup_profiler.write_report(args.profile_startup, budget))
+        sys.exit(1 if startup_profiler.is_over_budget(budget) else 0)
 
     print("===== LOGGING IN =====")
     globvars.client.run(TOKEN)